@@ -3,11 +3,13 @@ from __future__ import annotations
 
 import argparse
 import json
+import sys
 from pathlib import Path
 from typing import Any, Dict
 
 from controller.config_loader import load_config
 from controller.amnion_controller import AmnionController
+from controller.metrics import Metrics, MetricsConfig
 
 
 def _demo_sensors(cfg: Dict[str, Any]) -> Dict[str, Any]:
@@ -26,13 +28,18 @@ def main() -> int:
     ap = argparse.ArgumentParser(prog="amnion-oracle")
     ap.add_argument("--config-dir", default="configs", help="Path to configs/ folder")
     ap.add_argument("--ticks", type=int, default=3, help="How many demo ticks to run")
+    ap.add_argument("--validate", choices=("off", "report", "strict"), default=None,
+                    help="Config schema check (default: $AMNION_CONFIG_VALIDATE or report)")
     args = ap.parse_args()
 
     cfg_dir = Path(args.config_dir)
-    loaded = load_config(config_dir=cfg_dir)
+    loaded = load_config(config_dir=cfg_dir, validate=args.validate)
+    if loaded.schema_errors:
+        print(f"[WARN] {len(loaded.schema_errors)} config schema error(s); "
+              "see tools/validate_configs.py --all", file=sys.stderr)
     cfg = loaded.data  # merged
 
-    c = AmnionController()
+    c = AmnionController(metrics=Metrics(cfg=MetricsConfig.from_config(cfg)))
 
     for i in range(max(1, int(args.ticks))):
         sensors = _demo_sensors(cfg)
@@ -1,7 +1,8 @@
 # controller/amnion_controller.py
 from __future__ import annotations
 
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
+from time import perf_counter_ns
 from typing import Any, Dict, Optional
 
 from controller.metrics import Metrics
@@ -11,6 +12,8 @@ from controller.resonance_model import from_sensors as resonance_from_sensors
 from controller.lawx_adapter import LawXAdapter
 from controller.abraxas_module import AbraxasModule
 from controller.contracts import SensorFrame, DerivedMetrics, SafetyState, ControlOutput
+from controller.stage_timing import STAGE_INDEX, StageTimer
+from controller.tick_context import TickContext
 
 
 @dataclass
@@ -27,6 +30,9 @@ class AmnionController:
           -> safety evaluation
           -> runtime compute
           -> metrics logging
+
+    stage_timer: optional controller.stage_timing.StageTimer; when set, step()
+    records per-stage wall time and swallowed exceptions (see instrument()).
     """
 
     safety: SafetyGate = field(default_factory=SafetyGate)
@@ -34,6 +40,42 @@ class AmnionController:
     runtime: Runtime = field(default_factory=Runtime)
     lawx: LawXAdapter = field(default_factory=LawXAdapter)
     abraxas: AbraxasModule = field(default_factory=AbraxasModule)
+    stage_timer: Optional[StageTimer] = None
+    # Version of the SafetyConfig / RuntimeConfig in use (0: as constructed);
+    # stamped on every tick (context + metrics history)
+    config_version: int = 0
+    _ctx: TickContext = field(init=False, repr=False, compare=False, default_factory=TickContext)
+    _staged: Any = field(init=False, repr=False, compare=False, default=None)
+
+    def __post_init__(self) -> None:
+        if self.stage_timer is not None:
+            self.metrics.stages = self.stage_timer
+
+    def instrument(self, enabled: bool = True) -> Optional[StageTimer]:
+        """Enable (fresh StageTimer, also reported by metrics.snapshot()) or disable stage timing."""
+        self.stage_timer = StageTimer() if enabled else None
+        self.metrics.stages = self.stage_timer
+        return self.stage_timer
+
+    def stage_config(self, bundle: Any) -> None:
+        """
+        Queue a config bundle (.version, .safety, .runtime; see
+        controller.config_watcher) from any thread. The next step() swaps both
+        configs in before the tick starts, so no tick mixes old and new values.
+        """
+        self._staged = bundle  # single reference store: atomic
+
+    def _apply_staged(self) -> None:
+        staged = self._staged
+        if staged is not None and staged.version != self.config_version:
+            self.safety.cfg = staged.safety
+            self.runtime.cfg = staged.runtime
+            self.config_version = staged.version
+
+    @property
+    def context(self) -> TickContext:
+        """Pipeline state of the most recent tick (reused in place by the next step())."""
+        return self._ctx
 
     @staticmethod
     def _to_float(x: Any) -> Optional[float]:
@@ -71,18 +113,31 @@ class AmnionController:
 
     def step(self, sensors: Dict[str, Any]) -> Dict[str, Any]:
         sensors = sensors or {}
+        if self._staged is not None:
+            self._apply_staged()
+        timer = self.stage_timer
+        if timer is not None:
+            stamps = [perf_counter_ns()]
 
         # ------------------------------------------------------------
         # 1) Sanitize inputs
         # ------------------------------------------------------------
+        # The sanitized dict is owned by this tick: later stages enrich it in place.
+        ctx = self._ctx
         safe_sensors = self.safety.sanitize_inputs(sensors)
+        if safe_sensors is sensors:
+            safe_sensors = dict(safe_sensors)
+        ctx.sensors = safe_sensors
+        ctx.resonance = ctx.lawx = ctx.abraxas = None
+        ctx.config_version = self.config_version
+        if timer is not None:
+            stamps.append(perf_counter_ns())
 
         # ------------------------------------------------------------
         # 2) Resonance layer (deterministic physical observables)
         # ------------------------------------------------------------
         try:
             rf = resonance_from_sensors(safe_sensors)
-            safe_sensors = dict(safe_sensors)
             safe_sensors.update({
                 "r_order": rf.r_order,
                 "phase_mean": rf.phase_mean,
@@ -91,16 +146,19 @@ class AmnionController:
                 "coherence_score": rf.coherence_score,
                 "state_vector": getattr(rf, "state_vector", None),
             })
+            ctx.resonance = rf
         except Exception:
             # resonance layer must never break the control loop
-            pass
+            if timer is not None:
+                timer.error(STAGE_INDEX["resonance"])
+        if timer is not None:
+            stamps.append(perf_counter_ns())
 
         # ------------------------------------------------------------
         # 3) LawX advisory
         # ------------------------------------------------------------
         try:
             lawx_res = self.lawx.process(safe_sensors)
-            safe_sensors = dict(safe_sensors)
             safe_sensors.update({
                 "lawx_mode": lawx_res.mode,
                 "lawx_confidence": lawx_res.confidence,
@@ -114,15 +172,18 @@ class AmnionController:
                 "lawx_gap": lawx_res.gap,
                 "lawx_p_draw": lawx_res.p_draw,
             })
+            ctx.lawx = lawx_res
         except Exception:
-            pass
+            if timer is not None:
+                timer.error(STAGE_INDEX["lawx"])
+        if timer is not None:
+            stamps.append(perf_counter_ns())
 
         # ------------------------------------------------------------
         # 4) ABRAXAS invariants
         # ------------------------------------------------------------
         try:
             abra = self.abraxas.evaluate(safe_sensors)
-            safe_sensors = dict(safe_sensors)
             safe_sensors.update({
                 "f_ref": abra.f_ref,
                 "f_tol": abra.f_tol,
@@ -133,14 +194,22 @@ class AmnionController:
                 "abraxas_violations": list(abra.violations),
                 "abraxas_violation_count": len(abra.violations),
             })
+            ctx.abraxas = abra
         except Exception:
-            pass
+            if timer is not None:
+                timer.error(STAGE_INDEX["abraxas"])
+        if timer is not None:
+            stamps.append(perf_counter_ns())
 
         # ------------------------------------------------------------
         # 5) Typed views
         # ------------------------------------------------------------
         sensor_frame = self._to_sensor_frame(safe_sensors)
         derived = self._derive_metrics(sensor_frame, safe_sensors)
+        ctx.sensor_frame = sensor_frame
+        ctx.derived = derived
+        if timer is not None:
+            stamps.append(perf_counter_ns())
 
         # ------------------------------------------------------------
         # 6) Safety evaluation
@@ -151,6 +220,10 @@ class AmnionController:
             allow_control=bool(raw_safety.get("allow_control", True)),
             P_budget=float(raw_safety.get("patch", {}).get("P_budget", 0.0) or 0.0),
         )
+        ctx.safety = raw_safety
+        ctx.safety_state = safety_state
+        if timer is not None:
+            stamps.append(perf_counter_ns())
 
         # ------------------------------------------------------------
         # 7) Runtime compute
@@ -161,29 +234,57 @@ class AmnionController:
             mode=str(raw_output.get("mode", raw_safety.get("patch", {}).get("mode", "NORMAL"))),
             P_budget=float(raw_output.get("P_budget", safety_state.P_budget) or 0.0),
         )
+        ctx.output = control_output
+        if timer is not None:
+            stamps.append(perf_counter_ns())
 
         # ------------------------------------------------------------
         # 8) Metrics logging (best-effort)
         # ------------------------------------------------------------
+        output = {
+            "u_control": control_output.u_control,
+            "mode": control_output.mode,
+            "P_budget": control_output.P_budget,
+            "config_version": self.config_version,
+        }
         try:
-            self.metrics.on_tick(
-                {
-                    **safe_sensors,
-                    "sensor_frame": asdict(sensor_frame),
-                    "derived_metrics": asdict(derived),
-                },
-                raw_safety,
-                asdict(control_output),
-            )
+            # ctx.view: lazy {**sensors, "sensor_frame": ..., "derived_metrics": ...}
+            self.metrics.on_tick(ctx.view, raw_safety, output)
         except Exception:
-            pass
+            if timer is not None:
+                timer.error(STAGE_INDEX["metrics"])
+        if timer is not None:
+            stamps.append(perf_counter_ns())
+            timer.record(stamps)
 
         # ------------------------------------------------------------
         # 9) Public return payload
         # ------------------------------------------------------------
         return {
-            **asdict(control_output),
+            "u_control": control_output.u_control,
+            "mode": control_output.mode,
+            "P_budget": control_output.P_budget,
             "state": safety_state.state,
             "allow_control": safety_state.allow_control,
-            "derived_metrics": asdict(derived),
+            "derived_metrics": {
+                "mismatch_power": derived.mismatch_power,
+                "mismatch_phase": derived.mismatch_phase,
+                "coherence_score": derived.coherence_score,
+            },
         }
+
+    def step_batch(self, columns: Any, *, chunk_size: Optional[int] = None) -> Any:
+        """
+        Vectorized step() over struct-of-arrays sensor input.
+
+        columns: mapping of sensor key -> 1-D array (NaN = key absent in that frame),
+                 or a prepared controller.batch.SensorColumns.
+        Returns controller.batch.BatchResult; row i equals step(columns.frame(i)).
+        Metrics are not updated (offline re-evaluation path).
+        """
+        from controller.batch import DEFAULT_CHUNK, SensorColumns, evaluate_batch
+
+        if self._staged is not None:
+            self._apply_staged()
+        cols = columns if isinstance(columns, SensorColumns) else SensorColumns.from_mapping(columns)
+        return evaluate_batch(self, cols, chunk_size=chunk_size or DEFAULT_CHUNK)
@@ -0,0 +1,299 @@
+# controller/batch.py
+# Vectorized (struct-of-arrays) evaluation of the AmnionController tick pipeline.
+# Offline re-evaluation / fleet simulation only. No clinical use.
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, Mapping, Optional, Tuple
+
+import numpy as np
+
+from controller.contracts import MODE_NAMES, STATE_NAMES
+from controller.resonance_model import from_sensors as resonance_from_sensors
+
+
+# Keys that carry per-frame arrays in step(); they have no columnar form.
+_VECTOR_KEYS = ("phase_samples", "signal", "pattern")
+
+DEFAULT_CHUNK = 1 << 15
+
+# (values, present) pair; values are float64, present marks frames where the key exists
+_Col = Tuple[np.ndarray, np.ndarray]
+
+
+class BatchInputError(ValueError):
+    """Columnar input cannot be mapped onto step() frames."""
+
+
+@dataclass(frozen=True)
+class SensorColumns:
+    """
+    Struct-of-arrays sensor input.
+
+    Frame i is equivalent to the step() dict built by `frame(i)`:
+      - float columns: NaN means "key absent in this frame"
+      - bool columns: always present, map to Python bools
+      - integer columns: always present, map to Python floats
+    """
+
+    n: int
+    values: Dict[str, np.ndarray]
+    present: Dict[str, np.ndarray]
+    is_bool: Dict[str, bool]
+
+    @classmethod
+    def from_mapping(cls, columns: Mapping[str, Any]) -> "SensorColumns":
+        values: Dict[str, np.ndarray] = {}
+        present: Dict[str, np.ndarray] = {}
+        is_bool: Dict[str, bool] = {}
+        n: Optional[int] = None
+
+        for key, raw in (columns or {}).items():
+            key = str(key)
+            if key in _VECTOR_KEYS:
+                raise BatchInputError(f"per-frame array key not supported in batch mode: {key}")
+            arr = np.asarray(raw)
+            if arr.ndim != 1:
+                raise BatchInputError(f"column {key!r} must be 1-D, got shape {arr.shape}")
+            if n is None:
+                n = int(arr.shape[0])
+            elif arr.shape[0] != n:
+                raise BatchInputError(f"column {key!r} has length {arr.shape[0]}, expected {n}")
+
+            if arr.dtype == np.bool_:
+                values[key] = arr.astype(np.float64)
+                present[key] = np.ones(arr.shape, dtype=bool)
+                is_bool[key] = True
+            elif np.issubdtype(arr.dtype, np.integer):
+                values[key] = arr.astype(np.float64)
+                present[key] = np.ones(arr.shape, dtype=bool)
+                is_bool[key] = False
+            elif np.issubdtype(arr.dtype, np.floating):
+                vals = arr.astype(np.float64, copy=False)
+                values[key] = vals
+                present[key] = ~np.isnan(vals)
+                is_bool[key] = False
+            else:
+                raise BatchInputError(f"column {key!r} must be numeric or bool, got {arr.dtype}")
+
+        return cls(n=int(n or 0), values=values, present=present, is_bool=is_bool)
+
+    def frame(self, i: int) -> Dict[str, Any]:
+        """Reference step() dict for frame i (used for equivalence checks)."""
+        out: Dict[str, Any] = {}
+        for key, vals in self.values.items():
+            if not self.present[key][i]:
+                continue
+            out[key] = bool(vals[i]) if self.is_bool[key] else float(vals[i])
+        return out
+
+    def iter_frames(self) -> Iterator[Dict[str, Any]]:
+        for i in range(self.n):
+            yield self.frame(i)
+
+    def col(self, key: str, sl: slice) -> Optional[_Col]:
+        if key not in self.values:
+            return None
+        return self.values[key][sl], self.present[key][sl]
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """
+    Columnar step() outputs. `state_code` indexes STATE_NAMES (and MODE_NAMES,
+    since the outward mode is a pure function of the safety state).
+    `mismatch_power` is NaN where step() returns None.
+    """
+
+    u_control: np.ndarray
+    P_budget: np.ndarray
+    state_code: np.ndarray
+    allow_control: np.ndarray
+    mismatch_power: np.ndarray
+    mismatch_phase: np.ndarray
+    coherence_score: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.u_control.shape[0])
+
+    @property
+    def state(self) -> np.ndarray:
+        return np.asarray(STATE_NAMES, dtype=object)[self.state_code]
+
+    @property
+    def mode(self) -> np.ndarray:
+        return np.asarray(MODE_NAMES, dtype=object)[self.state_code]
+
+    def row(self, i: int) -> Dict[str, Any]:
+        """Frame i in the exact shape returned by AmnionController.step()."""
+        code = int(self.state_code[i])
+        mp = float(self.mismatch_power[i])
+        return {
+            "u_control": float(self.u_control[i]),
+            "mode": MODE_NAMES[code],
+            "P_budget": float(self.P_budget[i]),
+            "state": STATE_NAMES[code],
+            "allow_control": bool(self.allow_control[i]),
+            "derived_metrics": {
+                "mismatch_power": None if mp != mp else mp,
+                "mismatch_phase": float(self.mismatch_phase[i]),
+                "coherence_score": float(self.coherence_score[i]),
+            },
+        }
+
+
+# ------------------------------------------------------------
+# Scalar-exact helpers (mirror Python min/max/clamp semantics)
+# ------------------------------------------------------------
+def _clamp(x: np.ndarray, lo: float, hi: float) -> np.ndarray:
+    # clamp(x) == max(lo, min(hi, x)); Python keeps the first argument on ties.
+    m = np.where(x < hi, x, hi)
+    return np.where(m > lo, m, lo)
+
+
+def _alias(*cols: Optional[_Col], n: int) -> _Col:
+    """First present column wins (sanitize_inputs alias chain)."""
+    values = np.zeros(n, dtype=np.float64)
+    present = np.zeros(n, dtype=bool)
+    for c in reversed([c for c in cols if c is not None]):
+        v, m = c
+        values = np.where(m, v, values)
+        present |= m
+    return values, present
+
+
+def _truthy(c: Optional[_Col], n: int) -> np.ndarray:
+    """bool(sensors.get(key, False))"""
+    if c is None:
+        return np.zeros(n, dtype=bool)
+    v, m = c
+    return m & (v != 0.0)
+
+
+def evaluate_batch(ctrl: Any, cols: SensorColumns, *, chunk_size: int = DEFAULT_CHUNK) -> BatchResult:
+    """
+    Vectorized equivalent of calling ctrl.step(cols.frame(i)) for every i.
+    Metrics are not fed (offline evaluation).
+    """
+    if getattr(ctrl.safety, "guards", None) is not None:
+        raise BatchInputError("stateful guard engine is not supported in batch mode")
+
+    n = cols.n
+    out = BatchResult(
+        u_control=np.empty(n, dtype=np.float64),
+        P_budget=np.empty(n, dtype=np.float64),
+        state_code=np.empty(n, dtype=np.int8),
+        allow_control=np.empty(n, dtype=bool),
+        mismatch_power=np.empty(n, dtype=np.float64),
+        mismatch_phase=np.empty(n, dtype=np.float64),
+        coherence_score=np.empty(n, dtype=np.float64),
+    )
+
+    # Without per-frame phase windows the resonance layer is constant.
+    rf = resonance_from_sensors({})
+    chunk = max(1, int(chunk_size))
+    for start in range(0, n, chunk):
+        _evaluate_chunk(ctrl, cols, slice(start, min(n, start + chunk)), rf, out)
+    return out
+
+
+def _evaluate_chunk(ctrl: Any, cols: SensorColumns, sl: slice, rf: Any, out: BatchResult) -> None:
+    scfg = ctrl.safety.cfg
+    rcfg = ctrl.runtime.cfg
+    abx = ctrl.abraxas
+    n = sl.stop - sl.start
+
+    def c(key: str) -> Optional[_Col]:
+        return cols.col(key, sl)
+
+    # ------------------------------------------------------------
+    # 1) Sanitize aliases
+    # ------------------------------------------------------------
+    P_in = _alias(c("P_in"), c("power_in"), n=n)
+    P_draw = _alias(c("P_draw"), c("power_draw"), c("power_w"), n=n)
+    Q = _alias(c("Q"), c("q"), c("q_factor"), c("coherence_score"), n=n)
+    phase_in = _alias(c("phase_error"), c("mismatch_phase"), c("phase_noise"), n=n)
+
+    # ------------------------------------------------------------
+    # 2) Resonance (constant) + 3) LawX (no pattern column -> ALLOW)
+    # ------------------------------------------------------------
+    coherence_score = float(rf.coherence_score)
+
+    # ------------------------------------------------------------
+    # 4) ABRAXAS invariants
+    # ------------------------------------------------------------
+    f_ref_v, f_ref_m = _alias(c("f_ref"), c("mark_hz"), n=n)
+    f_ref = np.where(f_ref_m, f_ref_v, abx.f_ref_default)
+    f_tol_c = c("f_tol")
+    f_tol = np.where(f_tol_c[1], f_tol_c[0], abx.f_tol_default) if f_tol_c else np.full(n, abx.f_tol_default)
+    phase_error = np.where(phase_in[1], phase_in[0], float(rf.phase_noise))
+    loop_closure = _truthy(c("loop_closure"), n)
+    integrity = _alias(c("state_integrity"), c("sensor_health"), n=n)
+    state_integrity = np.where(integrity[1], integrity[0], 0.0)
+    imin_c = c("integrity_min")
+    integrity_min = (
+        np.where(imin_c[1], imin_c[0], abx.integrity_min_default) if imin_c else np.full(n, abx.integrity_min_default)
+    )
+    abraxas_violation = (np.abs(f_ref - 76.4) > f_tol) | ~loop_closure | (state_integrity < integrity_min)
+
+    # ------------------------------------------------------------
+    # 5) Derived metrics
+    # ------------------------------------------------------------
+    power_ok = P_in[1] & P_draw[1]
+    mismatch_power = np.where(power_ok, P_draw[0] - P_in[0], np.nan)
+    mismatch_phase = np.abs(phase_error)
+
+    # ------------------------------------------------------------
+    # 6) Safety escalation (max over triggered levels)
+    # ------------------------------------------------------------
+    sv = c("sensor_valid")
+    sensor_flag_invalid = (sv[1] & (sv[0] == 0.0)) if (sv is not None and cols.is_bool["sensor_valid"]) else False
+    sensors_invalid = sensor_flag_invalid | ~Q[1]
+    age = c("sensor_age_ms")
+    if age is not None and scfg.sensor_timeout_ms is not None:
+        sensors_invalid = sensors_invalid | (age[1] & (age[0] > scfg.sensor_timeout_ms))
+
+    rate_v, rate_m = c("rate_change") or (np.zeros(n), np.zeros(n, dtype=bool))
+    rate_abs = np.abs(rate_v)
+
+    barrier = (
+        sensors_invalid
+        | (P_draw[1] & (P_draw[0] > scfg.P_max))
+        | (Q[1] & (Q[0] <= scfg.Q_crit))
+        | (mismatch_phase > scfg.phase_trip)
+        | (rate_m & (rate_abs > scfg.rate_trip))
+        | abraxas_violation
+    )
+    throttle = rate_m & (rate_abs > scfg.rate_limit)
+    halt = _truthy(c("emergency_stop"), n)
+
+    state = np.where(halt, 3, np.where(barrier, 2, np.where(throttle, 1, 0))).astype(np.int8)
+    allow = state < 2
+
+    # ------------------------------------------------------------
+    # 7) Runtime compute
+    # ------------------------------------------------------------
+    u = np.full(n, rcfg.u_nominal, dtype=np.float64)
+    u *= np.where(Q[1], _clamp(Q[0], 0.0, 1.0), _clamp(np.float64(coherence_score), 0.0, 1.0))
+    u *= _clamp(1.0 - mismatch_phase, 0.0, 1.0)
+    penalty = _clamp(1.0 - np.where(1.0 < rate_abs, 1.0, rate_abs), 0.0, 1.0)
+    u *= np.where(rate_m, penalty, 1.0)
+
+    u = np.where(state == 1, u * 0.5, u)
+    u = np.where(state == 2, rcfg.fail_safe_u, u)
+    u = np.where(state == 3, 0.0, u)
+    u = np.where(allow, u, 0.0)
+    u = _clamp(u, rcfg.u_min, rcfg.u_max)
+
+    p_lut = np.array([rcfg.P_budget_nominal, scfg.P_budget_soft, rcfg.P_budget_min, 0.0], dtype=np.float64)
+    p_budget = p_lut[state]
+
+    # ControlOutput(float(x or 0.0)) folds -0.0 into +0.0
+    out.u_control[sl] = np.where(u == 0.0, 0.0, u)
+    out.P_budget[sl] = np.where(p_budget == 0.0, 0.0, p_budget)
+    out.state_code[sl] = state
+    out.allow_control[sl] = allow
+    out.mismatch_power[sl] = mismatch_power
+    out.mismatch_phase[sl] = mismatch_phase
+    out.coherence_score[sl] = coherence_score
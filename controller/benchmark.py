@@ -0,0 +1,324 @@
+# controller/benchmark.py
+# Tick-latency benchmark suite: AmnionController.step end to end plus every stage
+# it calls, with p50/p99/p999 latency, JSON results and baseline regression gates.
+#
+#   python -m controller.benchmark --update-baseline    # record this machine's baseline
+#   python -m controller.benchmark                      # run + compare to it
+#
+# Simulation-only. Numbers are machine-specific, so no baseline is committed: it
+# lives in results/ (git-ignored; AMNION_BENCH_BASELINE overrides the path, e.g.
+# a CI cache) and a baseline recorded on a different machine is not gated.
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from controller.amnion_controller import AmnionController
+from controller.io.sensor_stub import SensorStub
+from controller.resonance_model import from_sensors
+from controller.tick_context import TickView
+
+
+ROOT = Path(__file__).resolve().parents[1]
+BASELINE_ENV = "AMNION_BENCH_BASELINE"
+DEFAULT_BASELINE = ROOT / "results" / "bench_baseline.json"
+# meta keys that must match for latencies to be comparable
+MACHINE_KEYS: Tuple[str, ...] = ("python", "numpy", "platform", "cpu_count")
+SAMPLE_INPUTS = ROOT / "examples" / "sample_inputs.yaml"
+
+PERCENTILES: Tuple[Tuple[str, float], ...] = (("p50", 50.0), ("p99", 99.0), ("p999", 99.9))
+PHASE_WINDOWS: Tuple[int, ...] = (0, 64, 1024, 4096)
+DEFAULT_GATES: Tuple[str, ...] = ("p50", "p99")
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_MIN_DELTA_US = 0.5  # ignore slowdowns smaller than this (timer / scheduler noise)
+DEFAULT_REPEAT = 3
+
+
+@dataclass(frozen=True)
+class Case:
+    """One benchmarked callable; fn(*args) is timed once per entry of `args`."""
+
+    name: str
+    fn: Callable[..., Any]
+    args: Sequence[Tuple[Any, ...]]
+
+
+def sample_frames() -> List[Dict[str, Any]]:
+    """Frames from examples/sample_inputs.yaml (its `inputs_echo` block); empty if unavailable."""
+    try:
+        import yaml
+
+        with open(SAMPLE_INPUTS, "r", encoding="utf-8") as f:
+            doc = yaml.safe_load(f) or {}
+    except (ImportError, OSError):
+        return []
+    frame = doc.get("inputs_echo") if isinstance(doc, dict) else None
+    return [dict(frame)] if isinstance(frame, dict) else []
+
+
+def representative_frames(n: int, *, sample_every: int = 100) -> List[Dict[str, Any]]:
+    """n SensorStub frames with the example frames mixed in every `sample_every` ticks."""
+    stub = SensorStub()
+    extra = sample_frames()
+    frames: List[Dict[str, Any]] = []
+    for i in range(int(n)):
+        if extra and i % sample_every == sample_every - 1:
+            frames.append(dict(extra[(i // sample_every) % len(extra)]))
+        else:
+            frames.append(stub.read())
+    return frames
+
+
+def _record(obj: Any, name: str, sink: List[Tuple[Any, ...]], results: Optional[List[Any]] = None) -> None:
+    # Shadow a bound method with a recorder that keeps the call arguments (and results)
+    method = getattr(obj, name)
+
+    def rec(*args: Any) -> Any:
+        # per-tick views alias the controller's reused context: keep this tick's copy
+        sink.append(tuple(a.detach() if isinstance(a, TickView) else a for a in args))
+        out = method(*args)
+        if results is not None:
+            results.append(out)
+        return out
+
+    setattr(obj, name, rec)
+
+
+def build_cases(frames: Sequence[Dict[str, Any]], phase_windows: Sequence[int] = PHASE_WINDOWS) -> List[Case]:
+    """
+    Stage inputs are captured from a real step() pass over `frames`, so each stage
+    is timed on exactly what the pipeline hands it.
+    """
+    probe = AmnionController()
+    calls: Dict[str, List[Tuple[Any, ...]]] = {k: [] for k in ("sanitize", "lawx", "abraxas", "safety", "runtime", "metrics")}
+    sanitized: List[Dict[str, Any]] = []
+    _record(probe.safety, "sanitize_inputs", calls["sanitize"], sanitized)
+    _record(probe.lawx, "process", calls["lawx"])
+    _record(probe.abraxas, "evaluate", calls["abraxas"])
+    _record(probe.safety, "evaluate", calls["safety"])
+    _record(probe.runtime, "compute", calls["runtime"])
+    _record(probe.metrics, "update", calls["metrics"])
+    for f in frames:
+        probe.step(f)
+
+    ctrl = AmnionController()
+    cases = [
+        Case("step", ctrl.step, [(f,) for f in frames]),
+        Case("sanitize_inputs", ctrl.safety.sanitize_inputs, calls["sanitize"]),
+    ]
+    rng = np.random.default_rng(0)
+    for w in phase_windows:
+        if w:
+            window = rng.normal(0.0, 0.3, w)
+            args = [({**s, "phase_samples": window},) for s in sanitized]
+        else:
+            args = [(s,) for s in sanitized]
+        cases.append(Case(f"from_sensors[{w}]", from_sensors, args))
+    cases += [
+        Case("LawXAdapter.process", ctrl.lawx.process, calls["lawx"]),
+        Case("AbraxasModule.evaluate", ctrl.abraxas.evaluate, calls["abraxas"]),
+        Case("SafetyGate.evaluate", ctrl.safety.evaluate, calls["safety"]),
+        Case("Runtime.compute", ctrl.runtime.compute, calls["runtime"]),
+        Case("Metrics.update", ctrl.metrics.update, calls["metrics"]),
+    ]
+    return cases
+
+
+def timer_overhead_ns(n: int = 100_000) -> float:
+    clock = time.perf_counter_ns
+    t = np.empty(n, dtype=np.int64)
+    for i in range(n):
+        t0 = clock()
+        t[i] = clock() - t0
+    return float(np.median(t))
+
+
+def _run_once(fn: Callable[..., Any], args: Sequence[Tuple[Any, ...]]) -> Dict[str, float]:
+    clock = time.perf_counter_ns
+    lat = np.empty(len(args), dtype=np.int64)
+    t_start = clock()
+    for i, a in enumerate(args):
+        t0 = clock()
+        fn(*a)
+        lat[i] = clock() - t0
+    total_s = (clock() - t_start) / 1e9
+    out: Dict[str, float] = {
+        "ticks_per_s": len(args) / total_s if total_s > 0 else 0.0,
+        "mean_us": float(lat.mean()) / 1e3,
+    }
+    pct = np.percentile(lat, [p for _, p in PERCENTILES])
+    for (label, _), v in zip(PERCENTILES, pct):
+        out[f"{label}_us"] = float(v) / 1e3
+    out["max_us"] = float(lat.max()) / 1e3
+    return out
+
+
+def run_case(case: Case, *, warmup: int = 200, repeat: int = DEFAULT_REPEAT) -> Dict[str, float]:
+    """Best of `repeat` passes per statistic (the least-disturbed pass)."""
+    for a in case.args[:warmup]:
+        case.fn(*a)
+    runs = [_run_once(case.fn, case.args) for _ in range(max(1, int(repeat)))]
+    out: Dict[str, float] = {"n": float(len(case.args))}
+    for key in runs[0]:
+        vals = [r[key] for r in runs]
+        out[key] = max(vals) if key == "ticks_per_s" else min(vals)
+    return out
+
+
+def run_suite(
+    ticks: int = 20_000,
+    *,
+    repeat: int = DEFAULT_REPEAT,
+    phase_windows: Sequence[int] = PHASE_WINDOWS,
+    only: Optional[Sequence[str]] = None,
+) -> Dict[str, Any]:
+    frames = representative_frames(ticks)
+    results: Dict[str, Dict[str, float]] = {}
+    for case in build_cases(frames, phase_windows):
+        if only and not any(case.name.startswith(o) for o in only):
+            continue
+        results[case.name] = run_case(case, repeat=repeat)
+    return {
+        "meta": {
+            "ticks": int(ticks),
+            "repeat": int(repeat),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "timer_overhead_us": timer_overhead_ns() / 1e3,
+        },
+        "results": results,
+    }
+
+
+@dataclass(frozen=True)
+class Regression:
+    case: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline > 0 else float("inf")
+
+
+def compare(
+    current: Dict[str, Any],
+    baseline: Dict[str, Any],
+    *,
+    threshold: float = DEFAULT_THRESHOLD,
+    gates: Sequence[str] = DEFAULT_GATES,
+    min_delta_us: float = DEFAULT_MIN_DELTA_US,
+) -> List[Regression]:
+    """
+    Cases/metrics whose latency grew by more than `threshold` (0.25 = +25%) and by
+    more than `min_delta_us` over the baseline. Cases missing on either side are skipped.
+    """
+    out: List[Regression] = []
+    base = baseline.get("results", {})
+    for name, res in current.get("results", {}).items():
+        ref = base.get(name)
+        if not ref:
+            continue
+        for gate in gates:
+            key = f"{gate}_us"
+            if key not in ref or key not in res:
+                continue
+            if res[key] > ref[key] * (1.0 + threshold) and res[key] - ref[key] > min_delta_us:
+                out.append(Regression(name, gate, ref[key], res[key]))
+    return out
+
+
+def machine_mismatch(current: Dict[str, Any], baseline: Dict[str, Any]) -> List[str]:
+    """MACHINE_KEYS on which the two reports differ ("key: baseline -> current")."""
+    cur, base = current.get("meta", {}), baseline.get("meta", {})
+    return [f"{k}: {base.get(k)} -> {cur.get(k)}" for k in MACHINE_KEYS if cur.get(k) != base.get(k)]
+
+
+def format_table(report: Dict[str, Any], baseline: Optional[Dict[str, Any]] = None) -> str:
+    base = (baseline or {}).get("results", {})
+    lines = [f"{'case':<26} {'ticks/s':>11} {'p50 us':>9} {'p99 us':>9} {'p999 us':>9} {'vs base p50':>12}"]
+    for name, r in report["results"].items():
+        ref = base.get(name, {}).get("p50_us")
+        delta = f"{(r['p50_us'] / ref - 1.0) * 100:+.0f}%" if ref else "-"
+        lines.append(
+            f"{name:<26} {r['ticks_per_s']:>11.0f} {r['p50_us']:>9.2f} {r['p99_us']:>9.2f} {r['p999_us']:>9.2f} {delta:>12}"
+        )
+    return "\n".join(lines)
+
+
+def _write_json(path: Path, data: Dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    ap = argparse.ArgumentParser(prog="amnion-bench", description="Tick-latency benchmark suite.")
+    ap.add_argument("--ticks", type=int, default=20_000)
+    ap.add_argument("--out", default="results/bench.json", help="Write results JSON here")
+    ap.add_argument("--baseline", default=os.environ.get(BASELINE_ENV) or str(DEFAULT_BASELINE))
+    ap.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Allowed slowdown (0.25 = +25%%)")
+    ap.add_argument("--min-delta-us", type=float, default=DEFAULT_MIN_DELTA_US)
+    ap.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    ap.add_argument("--gates", default=",".join(DEFAULT_GATES), help="Gated percentiles, e.g. p50,p99,p999")
+    ap.add_argument("--only", default="", help="Comma-separated case name prefixes")
+    ap.add_argument("--update-baseline", action="store_true")
+    ap.add_argument("--any-machine", action="store_true", help="Gate even if the baseline is from another machine")
+    args = ap.parse_args(argv)
+
+    report = run_suite(args.ticks, repeat=args.repeat, only=[s for s in args.only.split(",") if s] or None)
+    if args.out:
+        _write_json(Path(args.out), report)
+
+    baseline_path = Path(args.baseline)
+    if args.update_baseline:
+        _write_json(baseline_path, report)
+        print(format_table(report))
+        print(f"OK: baseline written to {baseline_path}")
+        return 0
+
+    baseline: Optional[Dict[str, Any]] = None
+    if baseline_path.is_file():
+        with open(baseline_path, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+    print(format_table(report, baseline))
+    if baseline is None:
+        print(f"NOTE: no baseline at {baseline_path} (run with --update-baseline)")
+        return 0
+    mismatch = machine_mismatch(report, baseline)
+    if mismatch and not args.any_machine:
+        print(f"NOTE: baseline {baseline_path} is from another machine ({'; '.join(mismatch)}); "
+              "not gating (re-record with --update-baseline, or pass --any-machine)")
+        return 0
+
+    regressions = compare(
+        report,
+        baseline,
+        threshold=args.threshold,
+        gates=[g for g in args.gates.split(",") if g],
+        min_delta_us=args.min_delta_us,
+    )
+    for r in regressions:
+        print(f"REGRESSION {r.case} {r.metric}: {r.baseline:.2f}us -> {r.current:.2f}us (x{r.ratio:.2f})", file=sys.stderr)
+    if regressions:
+        return 1
+    print(f"OK: no regressions above +{args.threshold * 100:.0f}%")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
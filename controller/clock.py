@@ -0,0 +1,126 @@
+# controller/clock.py
+# Time sources for simulation and control loops.
+# RealClock: wall-clock timestamps that never step backwards.
+# VirtualClock: simulated time that advances by a fixed dt per control tick, so
+# runs are reproducible and as fast as the CPU allows while time-based rules
+# (sensor timeout_ms, guard dwell such as safe_hold_seconds) see simulated time.
+
+from __future__ import annotations
+
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict
+
+NS = 1_000_000_000
+
+
+class Clock(ABC):
+    """
+    time():          seconds, for timestamps (frame "ts", event records)
+    monotonic_ns():  interval source (frame ages, deadlines)
+    advance(ticks):  the loop finished `ticks` control ticks
+    sleep(seconds):  wait; a virtual clock jumps forward instead
+    times(n):        float64 timestamps of the next n ticks (SensorStub.read_batch)
+    """
+
+    virtual = False
+
+    @abstractmethod
+    def time(self) -> float:
+        ...
+
+    @abstractmethod
+    def monotonic_ns(self) -> int:
+        ...
+
+    def advance(self, ticks: int = 1) -> None:
+        pass
+
+    @abstractmethod
+    def sleep(self, seconds: float) -> None:
+        ...
+
+    def times(self, n: int) -> Any:
+        import numpy as np
+
+        return np.full(int(n), self.time(), dtype=np.float64)
+
+
+class RealClock(Clock):
+    """Epoch seconds anchored at construction plus monotonic elapsed time (immune to NTP steps)."""
+
+    def __init__(self) -> None:
+        self._anchor = time.time()
+        self._start_ns = time.perf_counter_ns()
+
+    def time(self) -> float:
+        return self._anchor + (time.perf_counter_ns() - self._start_ns) / NS
+
+    def monotonic_ns(self) -> int:
+        return time.perf_counter_ns()
+
+    def sleep(self, seconds: float) -> None:
+        if seconds > 0:
+            time.sleep(seconds)
+
+
+class VirtualClock(Clock):
+    """
+    Simulated time: start + elapsed, where elapsed only moves on advance()
+    (dt per tick) and sleep(). Kept in integer nanoseconds, so tick k always
+    reads start + k * dt_ns / 1e9 however it was reached.
+    """
+
+    virtual = True
+
+    def __init__(self, dt: float = 0.02, start: float = 0.0):
+        self.dt_ns = int(round(float(dt) * NS))
+        if self.dt_ns <= 0:
+            raise ValueError(f"dt must be positive, got {dt!r}")
+        self.start = float(start)
+        self._ns = 0
+
+    @classmethod
+    def from_config(cls, data: Dict[str, Any], **overrides: Any) -> "VirtualClock":
+        """dt = 1 / limits.update_rate_hz (00_system.yaml)."""
+        rate = float((data.get("limits") or {}).get("update_rate_hz", 50.0))
+        kw: Dict[str, Any] = {"dt": 1.0 / rate}
+        kw.update(overrides)
+        return cls(**kw)
+
+    @property
+    def dt(self) -> float:
+        return self.dt_ns / NS
+
+    def time(self) -> float:
+        return self.start + self._ns / NS
+
+    def monotonic_ns(self) -> int:
+        return self._ns
+
+    def advance(self, ticks: int = 1) -> None:
+        self._ns += int(ticks) * self.dt_ns
+
+    def sleep(self, seconds: float) -> None:
+        if seconds > 0:
+            self._ns += max(1, int(round(seconds * NS)))
+
+    def times(self, n: int) -> Any:
+        import numpy as np
+
+        ns = self._ns + np.arange(int(n), dtype=np.int64) * self.dt_ns
+        return self.start + ns / NS
+
+
+def time_source(clock: Any) -> Callable[[], float]:
+    """Seconds callable for a Clock, a plain callable or None (time.time)."""
+    if isinstance(clock, Clock):
+        return clock.time
+    return clock or time.time
+
+
+def ns_source(clock: Any) -> Callable[[], int]:
+    """Nanosecond callable for a Clock, a plain callable or None (time.perf_counter_ns)."""
+    if isinstance(clock, Clock):
+        return clock.monotonic_ns
+    return clock or time.perf_counter_ns
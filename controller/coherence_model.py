@@ -1,7 +1,9 @@
 # controller/coherence_model.py
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import NamedTuple
+
 import numpy as np
 
 
@@ -23,4 +25,101 @@ class KuramotoModel:
         phases2 = (phases + d_theta - self.zeta_damp * np.sin(phases)) % (2.0 * np.pi)
         return phases2
 
-  
+    def batch(self, phases: np.ndarray) -> "KuramotoBatch":
+        """Batched stepper over (ensembles, oscillators) using this model's gains."""
+        return KuramotoBatch(phases, k_gain=self.k_gain, zeta_damp=self.zeta_damp)
+
+
+class OrderTrajectory(NamedTuple):
+    """Order parameter per step: r (magnitude) and psi (mean phase), shape (n_steps, ensembles)."""
+
+    r: np.ndarray
+    psi: np.ndarray
+
+
+@dataclass
+class KuramotoBatch:
+    """
+    Many independent KuramotoModel ensembles stepped together, in place.
+
+    phases: (ensembles, oscillators) float64 array, owned and updated in place.
+    k_gain / zeta_damp: scalar or per-ensemble vector.
+
+    Each row evolves bit-identically to repeated KuramotoModel(k, zeta).step(row).
+    Scratch buffers are allocated once; step() does not allocate per oscillator.
+    """
+
+    phases: np.ndarray
+    k_gain: float | np.ndarray = 0.25
+    zeta_damp: float | np.ndarray = 0.03
+    _k: np.ndarray = field(init=False, repr=False)
+    _z: np.ndarray = field(init=False, repr=False)
+    _e: np.ndarray = field(init=False, repr=False)
+    _a: np.ndarray = field(init=False, repr=False)
+    _s: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        ph = np.array(self.phases, dtype=np.float64, order="C", copy=True)
+        if ph.ndim != 2:
+            raise ValueError("phases must be a 2-D (ensembles, oscillators) array")
+        self.phases = ph
+        n_ens = ph.shape[0]
+        self._k = np.broadcast_to(np.asarray(self.k_gain, dtype=np.float64), (n_ens,)).reshape(n_ens, 1).copy()
+        self._z = np.broadcast_to(np.asarray(self.zeta_damp, dtype=np.float64), (n_ens,)).reshape(n_ens, 1).copy()
+        self._e = np.empty(ph.shape, dtype=np.complex128)
+        self._a = np.empty_like(ph)
+        self._s = np.empty_like(ph)
+
+    def order(self) -> np.ndarray:
+        """Complex order parameter mean(exp(1j*phases)) per ensemble, shape (ensembles,)."""
+        e = self._e
+        np.cos(self.phases, out=e.real)
+        np.sin(self.phases, out=e.imag)
+        return np.mean(e, axis=1)
+
+    def step(self) -> np.ndarray:
+        """
+        Advance every ensemble one step in place.
+        Returns the complex order parameter of the state *before* the step.
+        """
+        ph = self.phases
+        if ph.size == 0:
+            return np.zeros(ph.shape[0], dtype=np.complex128)
+        z = self.order()
+        a, s = self._a, self._s
+        psi = np.angle(z).reshape(-1, 1)
+        # Same operation order as KuramotoModel.step:
+        # (phases + k*sin(psi - phases) - zeta*sin(phases)) % 2pi
+        np.subtract(psi, ph, out=a)
+        np.sin(a, out=a)
+        a *= self._k
+        a += ph
+        np.multiply(self._z, self._e.imag, out=s)  # e.imag == sin(phases)
+        a -= s
+        np.remainder(a, 2.0 * np.pi, out=ph)
+        return z
+
+    def integrate(self, n_steps: int) -> OrderTrajectory:
+        """
+        Run n_steps steps; row j of the result is the order parameter after j+1 steps.
+        Only the final phases are kept (self.phases); intermediate states are not stored.
+        """
+        n = max(0, int(n_steps))
+        n_ens = self.phases.shape[0]
+        r = np.empty((n, n_ens), dtype=np.float64)
+        psi = np.empty((n, n_ens), dtype=np.float64)
+        if n == 0:
+            return OrderTrajectory(r, psi)
+        if self.phases.size == 0:
+            r.fill(0.0)
+            psi.fill(0.0)
+            return OrderTrajectory(r, psi)
+        self.step()
+        for j in range(1, n):
+            z = self.step()  # order of the state after step j
+            np.abs(z, out=r[j - 1])
+            psi[j - 1] = np.angle(z)
+        z = self.order()
+        np.abs(z, out=r[n - 1])
+        psi[n - 1] = np.angle(z)
+        return OrderTrajectory(r, psi)
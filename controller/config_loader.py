@@ -1,14 +1,31 @@
 # controller/config_loader.py
 from __future__ import annotations
 
-from dataclasses import dataclass
+import dataclasses
+import hashlib
+import math
+import os
+import pickle
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-
-import yaml
+from typing import Any, Dict, List, Optional, Tuple
 
 DEFAULT_CONFIG_DIR = Path(__file__).resolve().parent.parent / "configs"
 
+# PyYAML is imported on the first parse (a warm cache hit never needs it)
+_YAML_LOADER: Any = None
+
+# Compiled-config cache: merged result pickled under a key derived from the
+# sha256 of every source file and the file list. Set AMNION_CONFIG_CACHE=0 to
+# disable, or to a directory to relocate it.
+CACHE_ENV = "AMNION_CONFIG_CACHE"
+CACHE_FORMAT = 1
+
+# Schema check in load_config() (controller.config_schema): "off", "report"
+# (errors kept on LoadedConfig.schema_errors) or "strict" (ConfigError).
+VALIDATE_ENV = "AMNION_CONFIG_VALIDATE"
+VALIDATE_MODES = ("off", "report", "strict")
+
 DEFAULT_CONFIG_FILES: List[str] = [
     "00_system.yaml",
     "01_interfaces.yaml",
@@ -24,17 +41,37 @@ class ConfigError(Exception):
     """Fatal configuration error."""
 
 
-def _read_yaml(path: Path) -> Dict[str, Any]:
-    if not path.exists():
-        raise ConfigError(f"Config file not found: {path}")
+def _read_bytes(path: Path) -> bytes:
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        raise ConfigError(f"Config file not found: {path}") from None
+
+
+def _yaml_loader() -> Any:
+    """libyaml-backed loader when available (same safe subset, several times faster)."""
+    global _YAML_LOADER
+    if _YAML_LOADER is None:
+        import yaml
+
+        _YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return _YAML_LOADER
+
+
+def _parse_yaml(raw: bytes, path: Path) -> Dict[str, Any]:
+    import yaml
+
     try:
-        with path.open("r", encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
-        if not isinstance(data, dict):
-            raise ConfigError(f"YAML root must be a mapping/dict: {path}")
-        return data
+        data = yaml.load(raw.decode("utf-8"), Loader=_yaml_loader()) or {}
     except yaml.YAMLError as e:
         raise ConfigError(f"YAML parse error in {path}: {e}") from e
+    if not isinstance(data, dict):
+        raise ConfigError(f"YAML root must be a mapping/dict: {path}")
+    return data
+
+
+def _read_yaml(path: Path) -> Dict[str, Any]:
+    return _parse_yaml(_read_bytes(path), path)
 
 
 def _deep_merge(base: Dict[str, Any], patch: Dict[str, Any]) -> Dict[str, Any]:
@@ -65,31 +102,160 @@ class LoadedConfig:
     config_dir: Path
     files: List[str]
     data: Dict[str, Any]
+    # sha256 of each source file (04_logging.yaml: include_config_hashes)
+    file_hashes: Dict[str, str] = field(default_factory=dict)
+    from_cache: bool = False
+    # schema violations found in "report" mode (empty when valid or not checked)
+    schema_errors: Tuple[str, ...] = ()
+
+
+def default_cache_dir() -> Optional[Path]:
+    """Cache folder from AMNION_CONFIG_CACHE / XDG_CACHE_HOME; None if disabled."""
+    env = os.environ.get(CACHE_ENV, "")
+    if env.strip().lower() in ("0", "off", "false", "no"):
+        return None
+    if env:
+        return Path(env)
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "amnion-oracle" / "config"
+
+
+def _cache_key(files: List[str], hashes: Dict[str, str]) -> str:
+    h = hashlib.sha256(f"amnion-config/{CACHE_FORMAT}\0".encode())
+    for name in files:
+        h.update(f"{name}\0{hashes[name]}\0".encode())
+    return h.hexdigest()
+
+
+def _cache_get(path: Path, key: str) -> Optional[Dict[str, Any]]:
+    try:
+        with path.open("rb") as f:
+            entry = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        return None  # unreadable / truncated entry: rebuilt and overwritten
+    if not isinstance(entry, dict) or entry.get("key") != key or not isinstance(entry.get("data"), dict):
+        return None
+    return entry["data"]
+
+
+def _cache_put(path: Path, key: str, data: Dict[str, Any]) -> None:
+    # best-effort: a read-only or full cache folder never fails a load
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tmp.open("wb") as f:
+            pickle.dump({"key": key, "data": data}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except (OSError, pickle.PicklingError):
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+
+
+def _validate_mode(validate: Optional[str]) -> str:
+    mode = (validate if validate is not None else os.environ.get(VALIDATE_ENV, "report")).strip().lower()
+    if mode not in VALIDATE_MODES:
+        raise ConfigError(f"validate must be one of {VALIDATE_MODES}, got {mode!r}")
+    return mode
 
 
 def load_config(
     config_dir: Optional[Path] = None,
     files: Optional[List[str]] = None,
+    *,
+    cache_dir: Optional[Path] = None,
+    use_cache: bool = True,
+    validate: Optional[str] = None,
 ) -> LoadedConfig:
+    """
+    Read and deep-merge the config files (in order).
+
+    The merged result is cached (pickle) under cache_dir (default:
+    default_cache_dir()) keyed by the sha256 of every file plus the file list,
+    so any edit, rename or reorder misses the cache; entries are only ever
+    read back for byte-identical sources. The files are still read and hashed
+    on every load (file_hashes), only parsing and merging are skipped.
+    The cache holds pickles: point it only at a folder you own.
+
+    Each file is also checked against its JSON schema (config_schema.SCHEMA_MAP)
+    unless validate="off"; results are cached per file hash in the same folder.
+    validate defaults to $AMNION_CONFIG_VALIDATE, else "report".
+    """
     cfg_dir = (config_dir or DEFAULT_CONFIG_DIR).resolve()
+    mode = _validate_mode(validate)
 
     # IMPORTANT: copy list, and treat empty list as error (usually accidental)
     cfg_files = list(files) if files is not None else list(DEFAULT_CONFIG_FILES)
     if not cfg_files:
         raise ConfigError("No config files specified (files=[]).")
 
-    merged: Dict[str, Any] = {}
-    used_files: List[str] = []
+    raw: Dict[str, bytes] = {name: _read_bytes(cfg_dir / name) for name in cfg_files}
+    hashes = {name: hashlib.sha256(b).hexdigest() for name, b in raw.items()}
+    used_files = list(cfg_files)
+
+    folder = (cache_dir or default_cache_dir()) if use_cache else None
+    key = _cache_key(used_files, hashes)
+    entry = folder / f"{key}.pickle" if folder is not None else None
+    merged = _cache_get(entry, key) if entry is not None else None
+    from_cache = merged is not None
+    parsed: Dict[str, Dict[str, Any]] = {}
+
+    if merged is None:
+        merged = {}
+        for name in cfg_files:
+            parsed[name] = _parse_yaml(raw[name], cfg_dir / name)
+            merged = _deep_merge(merged, parsed[name])
+        _validate_basic(merged)
+
+    schema_errors: Tuple[str, ...] = ()
+    if mode != "off":
+        from controller.config_schema import validate_configs
 
-    for name in cfg_files:
-        p = cfg_dir / name
-        part = _read_yaml(p)
-        merged = _deep_merge(merged, part)
-        used_files.append(name)
+        report = validate_configs(cfg_dir, used_files, raw=raw, file_hashes=hashes, parsed=parsed,
+                                  cache_dir=folder, use_cache=folder is not None)
+        schema_errors = tuple(report.errors)
+        if schema_errors and mode == "strict":
+            raise ConfigError("Config schema validation failed:\n  " + "\n  ".join(schema_errors))
 
-    _validate_basic(merged)
+    if entry is not None and not from_cache:
+        _cache_put(entry, key, merged)
+    return LoadedConfig(config_dir=cfg_dir, files=used_files, data=merged, file_hashes=hashes,
+                        from_cache=from_cache, schema_errors=schema_errors)
 
-    return LoadedConfig(config_dir=cfg_dir, files=used_files, data=merged)
+
+def dataclass_overrides(cls: type, section: Any, where: str) -> Dict[str, Any]:
+    """
+    Check a {field: value} mapping against a flat config dataclass (SafetyConfig,
+    RuntimeConfig): unknown fields, wrong types and non-finite numbers raise
+    ConfigError. Field types follow the defaults (None default: optional float).
+    """
+    if section is None:
+        return {}
+    if not isinstance(section, dict):
+        raise ConfigError(f"{where} must be a mapping")
+    known = {f.name: f.default for f in dataclasses.fields(cls)}
+    out: Dict[str, Any] = {}
+    for key, value in section.items():
+        if key not in known:
+            raise ConfigError(f"{where}.{key}: unknown field")
+        default = known[key]
+        if isinstance(default, bool):
+            if not isinstance(value, bool):
+                raise ConfigError(f"{where}.{key}: expected a boolean, got {value!r}")
+        elif isinstance(default, str):
+            if not isinstance(value, str):
+                raise ConfigError(f"{where}.{key}: expected a string, got {value!r}")
+        elif value is None and default is None:
+            pass
+        elif isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+            raise ConfigError(f"{where}.{key}: expected a finite number, got {value!r}")
+        else:
+            value = float(value)
+        out[key] = value
+    return out
 
 
 def load_manifest(config_dir: Optional[Path] = None) -> Dict[str, Any]:
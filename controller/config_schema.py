@@ -0,0 +1,226 @@
+# controller/config_schema.py
+"""
+JSON-Schema validation of the YAML configs (schemas/*.schema.json).
+
+One layer shared by load_config() and tools/validate_configs.py:
+- the draft comes from each schema's "$schema" (all of schemas/ are 2020-12);
+- compiled validators are kept per schema sha256 for the life of the process;
+- results are cached on disk per (config sha256, schema sha256), next to the
+  compiled-config cache, so an unchanged file is never revalidated and a warm
+  start does not even import jsonschema;
+- files that miss the cache are validated concurrently (jobs).
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from controller.config_loader import DEFAULT_CONFIG_DIR, ConfigError, _parse_yaml, default_cache_dir
+
+SCHEMAS_DIR = DEFAULT_CONFIG_DIR.parent / "schemas"
+
+# config filename -> schema filename (files not listed here are not checked)
+SCHEMA_MAP: Dict[str, str] = {
+    "00_system.yaml": "system.schema.json",
+    "01_interfaces.yaml": "interfaces.schema.json",
+    "02_safety.yaml": "safety.schema.json",
+    "03_metrics.yaml": "metrics.schema.json",
+    "04_logging.yaml": "logging.schema.json",
+    "05_profile.yaml": "profile.schema.json",
+    "06_safeguards.yaml": "safeguards.schema.json",
+}
+
+# bump when the cached result format or the error wording changes
+RESULT_FORMAT = 1
+
+_VALIDATORS: Dict[str, Any] = {}  # schema sha256 -> compiled validator
+_LOCK = threading.Lock()
+
+
+@dataclass(frozen=True)
+class FileValidation:
+    config: str
+    schema: str
+    errors: Tuple[str, ...] = ()
+    cached: bool = False  # result read back from the cache (not revalidated)
+
+
+@dataclass(frozen=True)
+class ValidationReport:
+    results: Tuple[FileValidation, ...] = ()
+    missing: Tuple[str, ...] = ()  # mapped config files that do not exist
+
+    @property
+    def errors(self) -> List[str]:
+        return [e for r in self.results for e in r.errors]
+
+    @property
+    def ok(self) -> bool:
+        return not any(r.errors for r in self.results)
+
+    @property
+    def cached(self) -> int:
+        return sum(1 for r in self.results if r.cached)
+
+
+def compiled_validator(schema_raw: bytes, digest: Optional[str] = None) -> Any:
+    """Validator for a schema document; compiled (and checked) once per schema sha256."""
+    key = digest or hashlib.sha256(schema_raw).hexdigest()
+    v = _VALIDATORS.get(key)
+    if v is not None:
+        return v
+
+    from jsonschema import Draft202012Validator
+    from jsonschema.exceptions import SchemaError
+    from jsonschema.validators import validator_for
+
+    schema = json.loads(schema_raw)
+    cls = validator_for(schema, default=Draft202012Validator)
+    try:
+        cls.check_schema(schema)
+    except SchemaError as e:
+        raise ConfigError(f"Invalid schema ({schema.get('$id', key[:12])}): {e.message}") from e
+    with _LOCK:
+        return _VALIDATORS.setdefault(key, cls(schema))
+
+
+def _format_errors(name: str, validator: Any, data: Dict[str, Any]) -> Tuple[str, ...]:
+    errors = sorted(validator.iter_errors(data), key=lambda e: [str(p) for p in e.path])
+    out = []
+    for e in errors:
+        loc = ".".join(map(str, e.path)) if e.path else "(root)"
+        out.append(f"{name}: {loc}: {e.message}")
+    return tuple(out)
+
+
+def _result_key(name: str, config_hash: str, schema_hash: str) -> str:
+    return hashlib.sha256(f"amnion-schema/{RESULT_FORMAT}\0{name}\0{config_hash}\0{schema_hash}".encode()).hexdigest()
+
+
+def _result_get(path: Path, key: str) -> Optional[Tuple[str, ...]]:
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(entry, dict) or entry.get("key") != key or not isinstance(entry.get("errors"), list):
+        return None
+    return tuple(str(e) for e in entry["errors"])
+
+
+def _result_put(path: Path, key: str, errors: Tuple[str, ...]) -> None:
+    # best-effort, like the compiled-config cache
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(json.dumps({"key": key, "errors": list(errors)}), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+
+
+def _validate_one(
+    name: str,
+    schema_name: str,
+    cfg_path: Path,
+    raw: bytes,
+    schema_raw: bytes,
+    schema_hash: str,
+    data: Optional[Dict[str, Any]],
+) -> FileValidation:
+    try:
+        if data is None:
+            data = _parse_yaml(raw, cfg_path)
+        errors = _format_errors(name, compiled_validator(schema_raw, schema_hash), data)
+    except ConfigError as e:
+        errors = (f"{name}: {e}",)
+    return FileValidation(config=name, schema=schema_name, errors=errors)
+
+
+def validate_configs(
+    config_dir: Optional[Path] = None,
+    files: Optional[Sequence[str]] = None,
+    *,
+    schemas_dir: Optional[Path] = None,
+    schema_map: Optional[Dict[str, str]] = None,
+    raw: Optional[Dict[str, bytes]] = None,
+    file_hashes: Optional[Dict[str, str]] = None,
+    parsed: Optional[Dict[str, Dict[str, Any]]] = None,
+    cache_dir: Optional[Path] = None,
+    use_cache: bool = True,
+    jobs: Optional[int] = None,
+) -> ValidationReport:
+    """
+    Validate config files against their schemas (SCHEMA_MAP; default: every
+    mapped file). raw / file_hashes / parsed let load_config() hand over what it
+    has already read, hashed and parsed. Results are cached under cache_dir
+    (default: default_cache_dir()) keyed by the sha256 of the config file and of
+    its schema; only misses are parsed and validated, on up to `jobs` threads.
+    """
+    cfg_dir = (config_dir or DEFAULT_CONFIG_DIR).resolve()
+    sch_dir = (schemas_dir or SCHEMAS_DIR).resolve()
+    mapping = SCHEMA_MAP if schema_map is None else schema_map
+    names = [n for n in (files if files is not None else mapping) if n in mapping]
+    raw = dict(raw or {})
+    file_hashes = dict(file_hashes or {})
+    parsed = parsed or {}
+    folder = (cache_dir or default_cache_dir()) if use_cache else None
+
+    results: Dict[str, FileValidation] = {}
+    missing: List[str] = []
+    todo: List[Tuple[str, Tuple[Any, ...], Optional[Path], str]] = []
+    schemas: Dict[str, Optional[Tuple[bytes, str]]] = {}
+    for name in names:
+        schema_name = mapping[name]
+        if name not in raw:
+            try:
+                raw[name] = (cfg_dir / name).read_bytes()
+            except FileNotFoundError:
+                missing.append(name)
+                continue
+        if schema_name not in schemas:
+            try:
+                s = (sch_dir / schema_name).read_bytes()
+                schemas[schema_name] = (s, hashlib.sha256(s).hexdigest())
+            except FileNotFoundError:
+                schemas[schema_name] = None
+        if schemas[schema_name] is None:
+            results[name] = FileValidation(name, schema_name, (f"{name}: missing schema: {schema_name}",))
+            continue
+        schema_raw, schema_hash = schemas[schema_name]
+        cfg_hash = file_hashes.get(name) or hashlib.sha256(raw[name]).hexdigest()
+        key = _result_key(name, cfg_hash, schema_hash)
+        entry = folder / f"schema-{key}.json" if folder is not None else None
+        if entry is not None:
+            errors = _result_get(entry, key)
+            if errors is not None:
+                results[name] = FileValidation(name, schema_name, errors, cached=True)
+                continue
+        args = (name, schema_name, cfg_dir / name, raw[name], schema_raw, schema_hash, parsed.get(name))
+        todo.append((name, args, entry, key))
+
+    workers = min(len(todo), jobs if jobs is not None else (os.cpu_count() or 1))
+    if workers > 1:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="config-schema") as pool:
+            done = list(pool.map(lambda t: _validate_one(*t[1]), todo))
+    else:
+        done = [_validate_one(*t[1]) for t in todo]
+    for (name, _, entry, key), res in zip(todo, done):
+        results[name] = res
+        if entry is not None:
+            _result_put(entry, key, res.errors)
+
+    return ValidationReport(
+        results=tuple(results[n] for n in names if n in results),
+        missing=tuple(missing),
+    )
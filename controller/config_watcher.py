@@ -0,0 +1,176 @@
+# controller/config_watcher.py
+# Hot reload of SafetyConfig / RuntimeConfig from the configs/ files.
+# Polls cheaply (stat: mtime + size, then content hash), rebuilds and validates
+# the immutable config objects off the hot path and stages them on the
+# controller, which swaps them in between ticks (AmnionController.stage_config).
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from controller.config_loader import DEFAULT_CONFIG_DIR, DEFAULT_CONFIG_FILES, ConfigError, load_config
+from controller.logger import Logger
+from controller.runtime import RuntimeConfig
+from controller.safety_gate import SafetyConfig
+
+
+@dataclass(frozen=True)
+class ConfigBundle:
+    """One consistent set of controller configs; swapped in as a unit."""
+
+    version: int
+    safety: SafetyConfig
+    runtime: RuntimeConfig
+    file_hashes: Dict[str, str]
+
+
+@dataclass(frozen=True)
+class ReloadEvent:
+    version: int  # version staged (or still active, on error)
+    wall_ts: float
+    changed: Tuple[str, ...]
+    error: Optional[str] = None
+
+
+def build_bundle(data: Dict[str, Any], version: int, file_hashes: Dict[str, str]) -> ConfigBundle:
+    """Validate a merged config into a ConfigBundle (raises ConfigError)."""
+    return ConfigBundle(
+        version=version,
+        safety=SafetyConfig.from_config(data),
+        runtime=RuntimeConfig.from_config(data),
+        file_hashes=dict(file_hashes),
+    )
+
+
+# (mtime_ns, size) per file; None if missing
+_Stat = Optional[Tuple[int, int]]
+
+
+class ConfigWatcher:
+    """
+    poll(): stat every file; if nothing moved, return None (a few syscalls).
+    Otherwise reload through load_config() (content hashes; an mtime-only
+    touch is ignored), validate, and stage a new ConfigBundle on the controller.
+    A bad edit keeps the running configs and is recorded as a ReloadEvent with
+    its error. start() polls on a daemon thread every interval_s.
+
+    on_reload(event) is called for every applied or rejected change; with a
+    logger (e.g. Logger(run=RunLogger(...))) each one is also logged as a
+    "config_reload" (INFO) or "config_reload_rejected" (ERROR) event.
+    """
+
+    def __init__(
+        self,
+        controller: Any,
+        config_dir: Optional[Path] = None,
+        files: Optional[List[str]] = None,
+        *,
+        interval_s: float = 1.0,
+        on_reload: Optional[Callable[[ReloadEvent], None]] = None,
+        max_events: int = 256,
+        cache_dir: Optional[Path] = None,
+        logger: Optional[Logger] = None,
+    ):
+        self.controller = controller
+        self.config_dir = Path(config_dir or DEFAULT_CONFIG_DIR).resolve()
+        self.files = list(files) if files is not None else list(DEFAULT_CONFIG_FILES)
+        self.interval_s = float(interval_s)
+        self.on_reload = on_reload
+        self.cache_dir = cache_dir
+        self.logger = logger
+        self.events: Deque[ReloadEvent] = deque(maxlen=max_events)
+
+        self.version = int(getattr(controller, "config_version", 0))
+        self._stats: Dict[str, _Stat] = self._stat_all()
+        self._hashes: Dict[str, str] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _stat_all(self) -> Dict[str, _Stat]:
+        out: Dict[str, _Stat] = {}
+        for name in self.files:
+            try:
+                st = os.stat(self.config_dir / name)
+                out[name] = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                out[name] = None
+        return out
+
+    def _load(self) -> Any:
+        return load_config(config_dir=self.config_dir, files=self.files, cache_dir=self.cache_dir)
+
+    def load_initial(self) -> ConfigBundle:
+        """Build and stage a bundle from the current files (first version)."""
+        self._stats = self._stat_all()
+        loaded = self._load()
+        bundle = build_bundle(loaded.data, self.version + 1, loaded.file_hashes)
+        self._stage(bundle, tuple(self.files))
+        return bundle
+
+    def _stage(self, bundle: ConfigBundle, changed: Tuple[str, ...]) -> None:
+        self.version = bundle.version
+        self._hashes = dict(bundle.file_hashes)
+        self.controller.stage_config(bundle)
+        self._emit(ReloadEvent(bundle.version, time.time(), changed))
+
+    def _emit(self, event: ReloadEvent) -> None:
+        self.events.append(event)
+        if self.logger is not None:
+            data: Dict[str, Any] = {"version": event.version, "changed": list(event.changed)}
+            if event.error is None:
+                self.logger.info("config_reload", data)
+            else:
+                data["error"] = event.error
+                self.logger.error("config_reload_rejected", data)
+        if self.on_reload is not None:
+            self.on_reload(event)
+
+    def poll(self) -> Optional[ConfigBundle]:
+        stats = self._stat_all()
+        if stats == self._stats:
+            return None
+        old, self._stats = self._stats, stats
+        try:
+            loaded = self._load()
+            changed = tuple(n for n in self.files if loaded.file_hashes.get(n) != self._hashes.get(n))
+            if self._hashes and not changed:
+                return None  # touched, not edited
+            bundle = build_bundle(loaded.data, self.version + 1, loaded.file_hashes)
+        except ConfigError as e:
+            moved = tuple(n for n in self.files if stats.get(n) != old.get(n))
+            self._emit(ReloadEvent(self.version, time.time(), moved, error=str(e)))
+            return None
+        self._stage(bundle, changed)
+        return bundle
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_s):
+            try:
+                self.poll()
+            except Exception as e:  # never let the watcher thread die silently
+                self._emit(ReloadEvent(self.version, time.time(), (), error=f"{type(e).__name__}: {e}"))
+
+    def start(self) -> "ConfigWatcher":
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="config-watcher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = 1.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def __enter__(self) -> "ConfigWatcher":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
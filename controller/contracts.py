@@ -2,14 +2,24 @@
 # Deterministic interface contracts between controller and hardware
 
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import Optional
+from collections.abc import Sequence as _SequenceABC
+from dataclasses import dataclass, fields, make_dataclass
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+# Outward state / mode names; their index is the u1 code used in record arrays
+# (and in batch / binary event logs).
+STATE_NAMES: Tuple[str, ...] = ("S0_NORMAL", "S1_THROTTLE", "S2_BARRIER", "S3_SAFE_HALT")
+MODE_NAMES: Tuple[str, ...] = ("NORMAL", "THROTTLE", "BARRIER", "LOCK")
 
 
 # =========================
 # Sensor Frame (input)
 # =========================
-@dataclass
+@dataclass(slots=True)
 class SensorFrame:
     P_in: Optional[float] = None
     P_draw: Optional[float] = None
@@ -22,7 +32,7 @@ class SensorFrame:
 # =========================
 # Derived Metrics
 # =========================
-@dataclass
+@dataclass(slots=True)
 class DerivedMetrics:
     mismatch_power: Optional[float] = None
     mismatch_phase: Optional[float] = None
@@ -32,7 +42,7 @@ class DerivedMetrics:
 # =========================
 # Safety State
 # =========================
-@dataclass
+@dataclass(slots=True)
 class SafetyState:
     state: str = "S0_NORMAL"
     allow_control: bool = True
@@ -42,13 +52,232 @@ class SafetyState:
 # =========================
 # Control Output
 # =========================
-@dataclass
+@dataclass(slots=True)
 class ControlOutput:
     u_control: float = 0.0
     mode: str = "NORMAL"
     P_budget: float = 0.0
 
 
+# =========================
+# Frozen variants
+# =========================
+# Same fields and defaults, immutable and hashable (safe to share / use as keys).
+# FrozenSensorFrame, FrozenDerivedMetrics, FrozenSafetyState, FrozenControlOutput
+# are generated on first access (module __getattr__ below): each generated
+# dataclass costs import time that most processes never use.
+_CONTRACTS: Tuple[type, ...] = (SensorFrame, DerivedMetrics, SafetyState, ControlOutput)
+_FROZEN: Dict[type, type] = {}
+
+
+def _frozen_variant(cls: type) -> type:
+    frozen = _FROZEN.get(cls)
+    if frozen is None:
+        spec = [(f.name, f.type, f.default) for f in fields(cls)]
+        made = make_dataclass(f"Frozen{cls.__name__}", spec, frozen=True, slots=True)
+        made.__module__ = __name__  # picklable by reference
+        _LAYOUTS[made] = _LAYOUTS[cls]
+        frozen = _FROZEN.setdefault(cls, made)  # first one wins if two threads race
+    return frozen
+
+
+def freeze(obj: Any) -> Any:
+    """Frozen copy of a contract instance (frozen instances are returned as-is)."""
+    if type(obj) in _FROZEN.values():
+        return obj
+    if type(obj) not in _CONTRACTS:
+        raise TypeError(f"not a contract instance: {type(obj).__name__}")
+    return _frozen_variant(type(obj))(*(getattr(obj, f.name) for f in fields(obj)))
+
+
+# =========================
+# Record layouts
+# =========================
+# Per field: "f?" Optional[float] (None <-> NaN), "f" float, "b" bool,
+# or a names tuple (str stored as its u1 index). The dtypes are built on first
+# use so that importing the contracts does not import NumPy.
+_Kind = Union[str, Tuple[str, ...]]
+
+_LAYOUTS: Dict[type, Tuple[Tuple[str, _Kind], ...]] = {
+    SensorFrame: (
+        ("P_in", "f?"),
+        ("P_draw", "f?"),
+        ("Q", "f?"),
+        ("phase_error", "f?"),
+        ("temp_c", "f?"),
+        ("sensor_valid", "b"),
+    ),
+    DerivedMetrics: (
+        ("mismatch_power", "f?"),
+        ("mismatch_phase", "f?"),
+        ("coherence_score", "f"),
+    ),
+    SafetyState: (
+        ("state", STATE_NAMES),
+        ("allow_control", "b"),
+        ("P_budget", "f"),
+    ),
+    ControlOutput: (
+        ("u_control", "f"),
+        ("mode", MODE_NAMES),
+        ("P_budget", "f"),
+    ),
+}
+
+
+def _np_type(kind: _Kind) -> str:
+    if kind == "b":
+        return "?"
+    return "u1" if isinstance(kind, tuple) else "<f8"
+
+
+# Packed (unaligned) structured dtypes, one per contract (module attributes,
+# resolved lazily by __getattr__)
+_DTYPE_NAMES: Dict[str, type] = {
+    "SENSOR_FRAME_DTYPE": SensorFrame,
+    "DERIVED_METRICS_DTYPE": DerivedMetrics,
+    "SAFETY_STATE_DTYPE": SafetyState,
+    "CONTROL_OUTPUT_DTYPE": ControlOutput,
+}
+
+_DTYPES: Dict[type, np.dtype] = {}
+_CODES: Dict[Tuple[str, ...], Dict[str, int]] = {
+    names: {s: i for i, s in enumerate(names)} for names in (STATE_NAMES, MODE_NAMES)
+}
+_NAN = float("nan")
+
+
+def dtype_of(cls: type) -> np.dtype:
+    """Structured dtype of a contract class (mutable or frozen variant)."""
+    dt = _DTYPES.get(cls)
+    if dt is None:
+        if cls not in _LAYOUTS:
+            raise TypeError(f"not a contract class: {getattr(cls, '__name__', cls)!r}")
+        import numpy as np
+
+        dt = _DTYPES[cls] = np.dtype([(name, _np_type(kind)) for name, kind in _LAYOUTS[cls]])
+    return dt
+
+
+def __getattr__(name: str) -> Any:
+    cls = _DTYPE_NAMES.get(name)
+    if cls is not None:
+        return dtype_of(cls)
+    for cls in _CONTRACTS:
+        if name == f"Frozen{cls.__name__}":
+            return _frozen_variant(cls)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def to_records(items: Iterable[Any], cls: Optional[type] = None) -> np.recarray:
+    """
+    Pack contract instances into a record array (dtype_of(cls)); None -> NaN,
+    state / mode strings -> u1 codes. One column pass per field.
+
+    A ContractArray is unwrapped without copying; anything else is copied once
+    (the fields are boxed Python objects).
+    """
+    import numpy as np
+
+    if isinstance(items, ContractArray):
+        return items.records
+    items = items if isinstance(items, (list, tuple)) else list(items)
+    if cls is None:
+        if not items:
+            raise ValueError("cls is required for an empty batch")
+        cls = type(items[0])
+    out = np.empty(len(items), dtype=dtype_of(cls))
+    for name, kind in _LAYOUTS[cls]:
+        col = [getattr(x, name) for x in items]
+        if kind == "f?":
+            out[name] = [_NAN if v is None else v for v in col]
+        elif isinstance(kind, tuple):
+            codes = _CODES[kind]
+            try:
+                out[name] = [codes[v] for v in col]
+            except KeyError as e:
+                raise ValueError(f"{cls.__name__}.{name}: unknown value {e.args[0]!r}") from None
+        else:
+            out[name] = col
+    return out.view(np.recarray)
+
+
+def _decoders(cls: type) -> List[Tuple[str, Any]]:
+    out: List[Tuple[str, Any]] = []
+    for name, kind in _LAYOUTS[cls]:
+        if kind == "f?":
+            out.append((name, lambda v: None if v != v else v))
+        elif isinstance(kind, tuple):
+            out.append((name, kind.__getitem__))
+        else:
+            out.append((name, None))
+    return out
+
+
+class ContractArray(_SequenceABC):
+    """
+    Sequence of contract instances backed by a structured array.
+
+    Integer indexing builds one instance on demand; slicing returns a
+    ContractArray over a view of the same buffer (no copy); column(name) is a
+    zero-copy view of one field (NaN where the instance has None).
+    """
+
+    __slots__ = ("records", "cls", "_dec")
+
+    def __init__(self, records: np.ndarray, cls: type):
+        import numpy as np
+
+        if records.dtype != dtype_of(cls):
+            raise TypeError(f"record dtype does not match {cls.__name__}")
+        self.records = records.view(np.recarray)
+        self.cls = cls
+        self._dec = _decoders(cls)
+
+    @classmethod
+    def from_items(cls, items: Iterable[Any], contract: Optional[type] = None) -> "ContractArray":
+        items = items if isinstance(items, (list, tuple)) else list(items)
+        rec = to_records(items, contract)
+        return cls(rec, contract or type(items[0]))
+
+    def __len__(self) -> int:
+        return int(self.records.shape[0])
+
+    def __getitem__(self, idx: Any) -> Any:
+        import numpy as np
+
+        if isinstance(idx, (int, np.integer)):
+            row = self.records[idx]
+            return self.cls(*(
+                (dec(v) if dec is not None else v)
+                for (_, dec), v in zip(self._dec, row.item())
+            ))
+        return ContractArray(self.records[idx], self.cls)
+
+    def __iter__(self) -> Iterator[Any]:
+        cols = []
+        for name, dec in self._dec:
+            col = self.records[name].tolist()
+            cols.append(col if dec is None else [dec(v) for v in col])
+        cls = self.cls
+        for values in zip(*cols):
+            yield cls(*values)
+
+    def column(self, name: str) -> np.ndarray:
+        return self.records[name]
+
+    def to_list(self) -> List[Any]:
+        return list(self)
+
+    def __repr__(self) -> str:
+        return f"ContractArray({self.cls.__name__}, n={len(self)})"
+
+
+def from_records(records: np.ndarray, cls: type) -> ContractArray:
+    """Lazy contract view over a record array (no copy)."""
+    return ContractArray(records, cls)
+
+
 # =========================
 # Clamp utility
 # =========================
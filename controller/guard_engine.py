@@ -0,0 +1,330 @@
+# controller/guard_engine.py
+# Precompiled guard program for the declarative rules in configs/02_safety.yaml.
+# Rule text is parsed once at load time; the per-tick evaluator only walks flat tuples.
+# No clinical use.
+
+from __future__ import annotations
+
+import math
+import operator
+import re
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+from controller.config_loader import ConfigError
+
+
+# Per-tick input vector layout (index == position)
+VARIABLES: Tuple[str, ...] = (
+    "power_mismatch",
+    "phase_mismatch",
+    "coherence",
+    "missing_sensor",
+    "invalid_data",
+    "temperature_c",
+    "emergency_stop",
+)
+_VAR_INDEX = {name: i for i, name in enumerate(VARIABLES)}
+
+# Guard state -> canonical SafetyGate state (consumed by Runtime)
+CANONICAL_STATE: Dict[str, str] = {
+    "OK": "S0_NORMAL",
+    "WARN": "S1_THROTTLE",
+    "DEGRADED": "S2_BARRIER",
+    "SAFE_HOLD": "S3_SAFE_HALT",
+    "SHUTDOWN": "S3_SAFE_HALT",
+}
+
+_OPS: Dict[str, Callable[[float, float], bool]] = {
+    ">=": operator.ge,
+    "<=": operator.le,
+    ">": operator.gt,
+    "<": operator.lt,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
+
+_EXPR = re.compile(r"^\s*(?:abs\(\s*([\w.]+)\s*\)|([\w.]+))\s*(>=|<=|==|!=|>|<)\s*(.+?)\s*$")
+_TERM = re.compile(r"\s*([+-]?)\s*([\w.]+)\s*")
+
+
+
+class Cond(NamedTuple):
+    """One comparison; dwell_state >= 0 reads time-in-state instead of var_index."""
+
+    var_index: int
+    use_abs: bool
+    op: Callable[[float, float], bool]
+    threshold: float
+    dwell_state: int
+
+
+class Rule(NamedTuple):
+    to_state: int
+    require_all: bool
+    conds: Tuple[Cond, ...]
+
+
+
+@dataclass(frozen=True)
+class GuardProgram:
+    """
+    Flat decision program compiled from the `safety` section.
+
+    states:      state names in ordinal order (from `safety.states`)
+    rules:       rules[from_ordinal] = tuple of Rule(to_state, require_all, conds), first match wins
+    global_rules: escalations valid from any state (operator / sensor_rules)
+    patches:     immutable patch template per ordinal (from `safety.actions`)
+    canonical:   canonical SafetyGate state per ordinal
+    """
+
+    states: Tuple[str, ...]
+    rules: Tuple[Tuple[Rule, ...], ...]
+    global_rules: Tuple[Rule, ...]
+    patches: Tuple[Mapping[str, Any], ...]
+    canonical: Tuple[str, ...]
+    params: Mapping[str, float]
+
+    def ordinal(self, name: str) -> int:
+        return self.states.index(name)
+
+
+def _params(safety: Dict[str, Any]) -> Dict[str, float]:
+    """Threshold namespace: mismatch tiers (bare + qualified) plus invariant bounds."""
+    params: Dict[str, float] = {}
+    for group, tier in (safety.get("mismatch") or {}).items():
+        if not isinstance(tier, dict):
+            continue
+        for k, v in tier.items():
+            if isinstance(v, bool) or not isinstance(v, (int, float)):
+                continue
+            if k in params:
+                raise ConfigError(f"safety.mismatch: ambiguous threshold name {k!r}")
+            params[k] = float(v)
+            params[f"{group}.{k}"] = float(v)
+
+    inv = safety.get("invariants") or {}
+    coherence = inv.get("coherence") or {}
+    if "min" in coherence:
+        params["C_min"] = float(coherence["min"])
+    temperature = inv.get("temperature_c") or {}
+    if "max" in temperature:
+        params["max_temperature_c"] = float(temperature["max"])
+    return params
+
+
+def _rhs(text: str, params: Dict[str, float]) -> float:
+    text = text.strip()
+    if text.startswith("(") and text.endswith(")"):
+        text = text[1:-1]
+    total = 0.0
+    pos = 0
+    while pos < len(text):
+        m = _TERM.match(text, pos)
+        if not m or m.end() == pos:
+            raise ConfigError(f"guard expression: cannot parse {text!r}")
+        sign, name = m.group(1), m.group(2)
+        if name in ("true", "false"):
+            val = 1.0 if name == "true" else 0.0
+        elif name in params:
+            val = params[name]
+        else:
+            try:
+                val = float(name)
+            except ValueError:
+                raise ConfigError(f"guard expression: unknown name {name!r}") from None
+        total = total - val if sign == "-" else total + val
+        pos = m.end()
+    return total
+
+
+def _cond(expr: str, params: Dict[str, float], states: Sequence[str]) -> Cond:
+    m = _EXPR.match(str(expr))
+    if not m:
+        raise ConfigError(f"guard expression: cannot parse {expr!r}")
+    name = m.group(1) or m.group(2)
+    use_abs = m.group(1) is not None
+    op = _OPS[m.group(3)]
+    threshold = _rhs(m.group(4), params)
+
+    if name.endswith("_seconds"):
+        dwell = name[: -len("_seconds")].upper()
+        if dwell not in states:
+            raise ConfigError(f"guard expression: unknown state timer {name!r}")
+        return Cond(-1, use_abs, op, threshold, states.index(dwell))
+    if name not in _VAR_INDEX:
+        raise ConfigError(f"guard expression: unknown variable {name!r}")
+    return Cond(_VAR_INDEX[name], use_abs, op, threshold, -1)
+
+
+def _patch(actions: Dict[str, Any], state: str) -> Mapping[str, Any]:
+    flat: Dict[str, Any] = {"mode": state}
+    for group, body in (actions.get(state.lower()) or {}).items():
+        if isinstance(body, dict):
+            for k, v in body.items():
+                flat[f"{group}.{k}"] = v
+        else:
+            flat[group] = body
+    return MappingProxyType(flat)
+
+
+def compile_guards(cfg: Dict[str, Any]) -> GuardProgram:
+    """
+    Compile `safety.transitions`, `safety.sensor_rules` and `safety.operator`
+    into a GuardProgram. Accepts the merged config or the bare `safety` section.
+    Raises ConfigError on unknown states, variables or thresholds.
+    """
+    safety = cfg.get("safety", cfg) if isinstance(cfg, dict) else {}
+    states = tuple(str(s) for s in (safety.get("states") or {}))
+    if not states:
+        raise ConfigError("safety.states is empty")
+    params = _params(safety)
+
+    def ordinal(name: Any, where: str) -> int:
+        if name not in states:
+            raise ConfigError(f"{where}: unknown state {name!r}")
+        return states.index(name)
+
+    per_state: List[List[Rule]] = [[] for _ in states]
+    for i, tr in enumerate(safety.get("transitions") or []):
+        where = f"safety.transitions[{i}]"
+        src = ordinal(tr.get("from"), where)
+        dst = ordinal(tr.get("to"), where)
+        if "when_all" in tr:
+            require_all, exprs = True, tr.get("when_all") or []
+        else:
+            require_all, exprs = False, tr.get("when_any") or []
+        conds = tuple(_cond(e, params, states) for e in exprs)
+        per_state[src].append(Rule(dst, require_all, conds))
+
+    global_rules: List[Rule] = []
+    op_cfg = (safety.get("operator") or {}).get("emergency_stop") or {}
+    if op_cfg.get("enabled", False):
+        dst = ordinal(op_cfg.get("state", states[-1]), "safety.operator.emergency_stop")
+        global_rules.append(Rule(dst, False, (_cond("emergency_stop == true", params, states),)))
+    rules_cfg = safety.get("sensor_rules") or {}
+    for var, key in (("missing_sensor", "missing_sensor_policy"), ("invalid_data", "invalid_data_policy")):
+        if key in rules_cfg:
+            dst = ordinal(rules_cfg[key], f"safety.sensor_rules.{key}")
+            global_rules.append(Rule(dst, False, (_cond(f"{var} == true", params, states),)))
+
+    actions = safety.get("actions") or {}
+    return GuardProgram(
+        states=states,
+        rules=tuple(tuple(r) for r in per_state),
+        global_rules=tuple(global_rules),
+        patches=tuple(_patch(actions, s) for s in states),
+        canonical=tuple(CANONICAL_STATE.get(s, "S2_BARRIER") for s in states),
+        params=MappingProxyType(params),
+    )
+
+
+@dataclass
+class GuardEngine:
+    """
+    Stateful evaluator for a GuardProgram.
+
+    step(x, now) consumes an input vector laid out as VARIABLES (NaN = missing;
+    every comparison against NaN is false) and returns the new state ordinal.
+    Transitions chain within a tick until no rule fires (strictest state wins).
+    """
+
+    program: GuardProgram
+    state: int = 0
+    entered_at: float = 0.0
+    _max_hops: int = field(init=False, default=0)
+
+    def __post_init__(self) -> None:
+        self._max_hops = len(self.program.states)
+
+    def reset(self, now: float = 0.0) -> None:
+        self.state = 0
+        self.entered_at = now
+
+    def step(self, x: Sequence[float], now: float = 0.0) -> int:
+        prog = self.program
+        state = self.state
+
+        for to, require_all, conds in prog.global_rules:
+            if to > state and _match(conds, require_all, x, 0.0, state):
+                state = to
+
+        dwell = now - self.entered_at if state == self.state else 0.0
+        for _ in range(self._max_hops):
+            for to, require_all, conds in prog.rules[state]:
+                if _match(conds, require_all, x, dwell, state):
+                    state = to
+                    dwell = 0.0
+                    break
+            else:
+                break
+
+        if state != self.state:
+            self.state = state
+            self.entered_at = now
+        return state
+
+    @property
+    def name(self) -> str:
+        return self.program.states[self.state]
+
+    @property
+    def canonical(self) -> str:
+        return self.program.canonical[self.state]
+
+    @property
+    def patch(self) -> Mapping[str, Any]:
+        return self.program.patches[self.state]
+
+    @staticmethod
+    def observe(sensors: Dict[str, Any]) -> Tuple[float, ...]:
+        """Best-effort sensor dict -> VARIABLES vector (off the compiled hot path)."""
+        p_in = _num(sensors.get("P_in"))
+        p_draw = _num(sensors.get("P_draw"))
+        phase = _num(sensors.get("phase_error"))
+        coherence = _num(sensors.get("coherence", sensors.get("Q")))
+        missing = p_in != p_in or p_draw != p_draw or coherence != coherence
+        return (
+            p_draw - p_in,
+            abs(phase),
+            coherence,
+            1.0 if missing else 0.0,
+            1.0 if sensors.get("sensor_valid") is False else 0.0,
+            _num(sensors.get("temp_c", sensors.get("temperature_c"))),
+            1.0 if bool(sensors.get("emergency_stop", False)) else 0.0,
+        )
+
+
+def _match(conds: Tuple[Cond, ...], require_all: bool, x: Sequence[float], dwell: float, state: int) -> bool:
+    for idx, use_abs, op, threshold, dwell_state in conds:
+        if dwell_state >= 0:
+            v = dwell if dwell_state == state else 0.0
+        else:
+            v = x[idx]
+            if use_abs:
+                v = abs(v)
+        if op(v, threshold):
+            if not require_all:
+                return True
+        elif require_all:
+            return False
+    return require_all and bool(conds)
+
+
+def _num(x: Any) -> float:
+    if x is None:
+        return math.nan
+    try:
+        return float(x)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def load_guard_engine(data: Optional[Dict[str, Any]] = None) -> GuardEngine:
+    """Compile guards from a merged config (default: load_config())."""
+    if data is None:
+        from controller.config_loader import load_config
+
+        data = load_config().data
+    return GuardEngine(compile_guards(data))
@@ -0,0 +1,160 @@
+# controller/io/acquisition.py
+# Background sensor acquisition (simulation-only by default).
+# A dedicated thread calls sensor.read() and publishes each frame into a
+# single-producer / single-consumer latest-frame buffer; the control loop takes
+# the freshest complete frame without blocking on sensor I/O.
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# (sequence number, publish time ns, frame)
+Entry = Tuple[int, int, Dict[str, Any]]
+
+
+class LatestFrame:
+    """
+    Lock-free SPSC latest-value buffer.
+
+    The producer builds each entry off to the side (the back buffer) and
+    publishes it with a single reference store, which is atomic under the
+    interpreter lock; the consumer loads that reference once. Published entries
+    are never mutated, so the consumer cannot observe a torn frame and neither
+    side ever waits for the other. Unread entries are overwritten (dropped).
+    """
+
+    __slots__ = ("_entry", "published")
+
+    def __init__(self) -> None:
+        self._entry: Optional[Entry] = None
+        self.published = 0
+
+    def publish(self, frame: Dict[str, Any], t_ns: int) -> None:
+        self.published += 1
+        self._entry = (self.published, t_ns, frame)
+
+    def latest(self) -> Optional[Entry]:
+        return self._entry
+
+
+class SensorAcquisition:
+    """
+    Runs sensor.read() on a daemon thread; read() returns the freshest frame.
+
+    Frames returned by read() are copies of the published frame with:
+      sensor_age_ms:  time since the frame was acquired (SafetyConfig.sensor_timeout_ms)
+      sensor_seq:     producer sequence number of the frame
+      sensor_dropped: frames published but never consumed so far
+    Before the first frame arrives read() returns an invalid frame
+    (sensor_valid=False) aged from start().
+
+    period_s: minimum spacing between reads (0: read back to back; a real driver
+    paces itself on its own I/O). Sensor exceptions are counted and skipped.
+    """
+
+    def __init__(
+        self,
+        sensor: Any,
+        *,
+        period_s: float = 0.0,
+        clock: Callable[[], int] = time.perf_counter_ns,
+        name: str = "sensor-acquisition",
+    ):
+        self.sensor = sensor
+        self.period_s = float(period_s)
+        self.clock = clock
+        self.name = name
+        self.buffer = LatestFrame()
+
+        self.consumed = 0
+        self.dropped = 0
+        self.stale_reads = 0  # read() calls that found no new frame
+        self.errors = 0
+        self.last_age_ms: Optional[float] = None
+
+        self._seq = 0
+        self._started_ns = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # ------------------------------------------------------------
+    # Producer
+    # ------------------------------------------------------------
+    def start(self) -> "SensorAcquisition":
+        if self._thread is not None:
+            return self
+        self._stop.clear()
+        self._started_ns = self.clock()
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = 1.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        clock, read, publish = self.clock, self.sensor.read, self.buffer.publish
+        stop = self._stop
+        period_ns = int(self.period_s * 1e9)
+        while not stop.is_set():
+            t0 = clock()
+            try:
+                frame = read()
+            except Exception:
+                self.errors += 1
+                stop.wait(max(self.period_s, 1e-3))
+                continue
+            publish(frame, clock())
+            if period_ns:
+                rem = t0 + period_ns - clock()
+                if rem > 0:
+                    stop.wait(rem / 1e9)
+
+    def __enter__(self) -> "SensorAcquisition":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+    # ------------------------------------------------------------
+    # Consumer (control loop)
+    # ------------------------------------------------------------
+    def read(self) -> Dict[str, Any]:
+        """Freshest complete frame, annotated with its age; never blocks."""
+        entry = self.buffer.latest()
+        now = self.clock()
+        if entry is None:
+            self.stale_reads += 1
+            age_ms = (now - self._started_ns) / 1e6
+            self.last_age_ms = age_ms
+            return {"sensor_valid": False, "sensor_age_ms": age_ms, "sensor_seq": 0, "sensor_dropped": 0}
+
+        seq, t_ns, frame = entry
+        if seq == self._seq:
+            self.stale_reads += 1
+        else:
+            self.dropped += seq - self._seq - 1
+            self.consumed += 1
+            self._seq = seq
+        age_ms = (now - t_ns) / 1e6
+        self.last_age_ms = age_ms
+        out = dict(frame)
+        out["sensor_age_ms"] = age_ms
+        out["sensor_seq"] = seq
+        out["sensor_dropped"] = self.dropped
+        return out
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "published": self.buffer.published,
+            "consumed": self.consumed,
+            "dropped": self.dropped,
+            "stale_reads": self.stale_reads,
+            "errors": self.errors,
+            "last_age_ms": self.last_age_ms,
+        }
@@ -0,0 +1,524 @@
+# controller/io/event_sink.py
+# Pluggable event sinks for simulation runs (simulation-only).
+#
+#   JsonlSink  - one JSON line per tick (legacy run_simulation format)
+#   BinarySink - fixed-schema struct records, packed into preallocated chunk
+#                buffers and flushed (byte planes + zlib) by a background thread
+#
+# binary_to_jsonl() converts a binary log back into the JSONL form for inspection.
+
+from __future__ import annotations
+
+import json
+import operator
+import queue
+import struct
+import threading
+import zlib
+from dataclasses import asdict, dataclass, is_dataclass
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from controller.batch import MODE_NAMES, STATE_NAMES
+
+
+MAGIC = b"AMNEVT1\n"
+_CHUNK_HEADER = struct.Struct("<II")  # (records, payload bytes)
+_PLANE_SAMPLE = 8192  # bytes per plane test-compressed to decide zlib vs raw
+_PLANE_GAIN = 0.9  # a plane is compressed if its sample shrinks below this ratio
+
+# Sensor keys written by SensorStub.read(), in emission order.
+# kind: "f" float (stored as f8: an int value reads back as a float), "i" int (i8), "b" bool
+DEFAULT_SENSOR_FIELDS: Tuple[Tuple[str, str], ...] = (
+    ("ts", "f"),
+    ("f_ref", "f"),
+    ("phase_error", "f"),
+    ("Q", "f"),
+    ("P_draw", "f"),
+    ("P_in", "f"),
+    ("rate_change", "f"),
+    ("loop_closure", "b"),
+    ("state_integrity", "f"),
+    ("sensor_valid", "b"),
+    ("emergency_stop", "b"),
+    # optional (absent from plain SensorStub frames): held / timed-out frames of the
+    # realtime runner, SensorAcquisition.latest() frames
+    ("sensor_age_ms", "f"),
+    ("sensor_seq", "i"),
+    ("sensor_dropped", "i"),
+)
+# Trailing schema keys a frame may omit without leaving the write() fast path
+OPTIONAL_SENSOR_KEYS = frozenset({"sensor_age_ms", "sensor_seq", "sensor_dropped"})
+
+_MODE_CODE = {m: i for i, m in enumerate(MODE_NAMES)}
+_STATE_CODE = {s: i for i, s in enumerate(STATE_NAMES)}
+_NAN = float("nan")
+INT_ABSENT = -(1 << 63)  # "i" column value for a missing key
+
+_KIND_DTYPE = {"f": "<f8", "i": "<i8", "b": "i1"}
+_ABSENT = {"f": _NAN, "i": INT_ABSENT, "b": -1}
+
+
+def _coerce(kind: str, v: Any) -> Any:
+    """Column value for one sensor reading; absent if it does not convert."""
+    if v is None:
+        return _ABSENT[kind]
+    try:
+        if kind == "f":
+            return float(v)
+        if kind == "i":
+            i = int(v)
+            return i if INT_ABSENT < i < (1 << 63) else INT_ABSENT
+    except (TypeError, ValueError, OverflowError):
+        return _ABSENT[kind]
+    return (1 if v else 0) if isinstance(v, (bool, int, float)) else _ABSENT[kind]
+
+
+# ------------------------------------------------------------
+# JSONL (legacy)
+# ------------------------------------------------------------
+def _json_safe(x: Any) -> Any:
+    if is_dataclass(x):
+        return asdict(x)
+    if isinstance(x, (str, int, float, bool)) or x is None:
+        return x
+    if isinstance(x, dict):
+        return {str(k): _json_safe(v) for k, v in x.items()}
+    if isinstance(x, (list, tuple)):
+        return [_json_safe(v) for v in x]
+    return str(x)
+
+
+def json_default(x: Any) -> Any:
+    """
+    json.dumps(default=) for event logs: dataclasses as dicts, anything else as
+    str(). Part of the JSONL format: replay hashes (controller/io/replay.py)
+    depend on it, so changing it changes every recorded hash.
+    """
+    return asdict(x) if is_dataclass(x) else str(x)
+
+
+class JsonlSink:
+    """
+    One JSON object per line; byte-compatible with the original run_simulation
+    output, plus "config_version" (the controller's applied config, see
+    controller/config_watcher.py) when the runner passes one.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._f = open(path, "w", encoding="utf-8")
+
+    def write(
+        self,
+        tick: int,
+        ts: float,
+        dt_from_start_s: float,
+        sensors: Dict[str, Any],
+        output: Dict[str, Any],
+        actuator_last: Dict[str, Any],
+        config_version: Optional[int] = None,
+    ) -> None:
+        event: Dict[str, Any] = {"tick": tick, "ts": ts, "dt_from_start_s": dt_from_start_s}
+        if config_version is not None:
+            event["config_version"] = config_version
+        event["sensors"] = sensors
+        event["output"] = output
+        event["actuator_last"] = actuator_last
+        try:
+            line = json.dumps(event, ensure_ascii=False, default=json_default)
+        except (TypeError, ValueError):
+            line = json.dumps(_json_safe(event), ensure_ascii=False)
+        self._f.write(line + "\n")
+
+    def close(self) -> None:
+        self._f.close()
+
+    def __enter__(self) -> "JsonlSink":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+# ------------------------------------------------------------
+# Binary
+# ------------------------------------------------------------
+@dataclass(frozen=True)
+class EventSchema:
+    """
+    Fixed record layout. "Key absent" is NaN for float sensors, INT_ABSENT
+    for int sensors and -1 for bool sensors. Float sensors are stored as f8,
+    so an int written to an "f" field reads back as a float (76 -> 76.0);
+    give integer-valued keys kind "i" to keep them ints. None and values that
+    do not convert to the field's kind ("", "garbage", [], ...) are stored as
+    absent, as the controller's sanitizer treats them. Output fields follow
+    the AmnionController.step() contract; actuator_last is not stored (it
+    mirrors output). versioned: records carry config_version (INT_ABSENT if
+    the runner gave none); logs written before the column existed read back
+    with versioned=False.
+    """
+
+    sensor_fields: Tuple[Tuple[str, str], ...] = DEFAULT_SENSOR_FIELDS
+    versioned: bool = True
+
+    def fields(self) -> List[Tuple[str, str]]:
+        out = [("tick", "<i8"), ("ts", "<f8"), ("dt_from_start_s", "<f8")]
+        if self.versioned:
+            out.append(("config_version", "<i8"))
+        out += [(f"s.{name}", _KIND_DTYPE[kind]) for name, kind in self.sensor_fields]
+        out += [
+            ("u_control", "<f8"),
+            ("P_budget", "<f8"),
+            ("mode", "u1"),
+            ("state", "u1"),
+            ("allow_control", "?"),
+            ("mismatch_power", "<f8"),
+            ("mismatch_phase", "<f8"),
+            ("coherence_score", "<f8"),
+        ]
+        return out
+
+    def dtype(self) -> np.dtype:
+        return np.dtype(self.fields())
+
+    def record_struct(self) -> struct.Struct:
+        codes = {"<i8": "q", "<f8": "d", "i1": "b", "u1": "B", "?": "?"}
+        return struct.Struct("<" + "".join(codes[f] for _, f in self.fields()))
+
+    def __post_init__(self) -> None:
+        for name, kind in self.sensor_fields:
+            if kind not in _KIND_DTYPE:
+                raise ValueError(f"sensor field {name!r}: unknown kind {kind!r} (known: f, i, b)")
+
+    def to_header(self, codec: str) -> bytes:
+        meta = {"sensor_fields": [list(f) for f in self.sensor_fields], "codec": codec,
+                "versioned": self.versioned}
+        return json.dumps(meta).encode("utf-8") + b"\n"
+
+    @classmethod
+    def from_header(cls, line: bytes) -> Tuple["EventSchema", str]:
+        meta = json.loads(line.decode("utf-8"))
+        schema = cls(sensor_fields=tuple((str(n), str(k)) for n, k in meta["sensor_fields"]),
+                     versioned=bool(meta.get("versioned", False)))
+        return schema, str(meta.get("codec", "zlib"))
+
+
+class BinarySink:
+    """
+    Fixed-schema binary event sink.
+
+    write() packs one record into the current preallocated chunk buffer
+    (struct.pack_into, no per-tick allocation beyond the arg tuple). Frames
+    carrying exactly the schema keys, or all of them but the trailing
+    OPTIONAL_SENSOR_KEYS, take an itemgetter fast path. Full
+    chunks are handed to a writer thread that transposes them to columns,
+    compresses (zlib) and writes; buffers are recycled through a free pool.
+
+    File: MAGIC, schema header line, then chunks of
+          [u32 records][u32 payload bytes][payload]
+    Payload ("zlib-planes" codec): the chunk as a (records x record bytes)
+    matrix, transposed into byte planes (byte k of every record contiguous),
+    then [u8 flag per plane][zlib(flagged planes)][unflagged planes, raw].
+    Sign / exponent / integer planes compress well; the low mantissa bytes of
+    float columns are noise, and a short test-compression of each plane keeps
+    zlib off those. Codecs "zlib" / "raw" (column-major fields) are still
+    readable.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        schema: Optional[EventSchema] = None,
+        *,
+        chunk_records: int = 1 << 16,
+        buffers: int = 3,
+        compress_level: int = 1,
+    ):
+        self.path = path
+        self.schema = schema or EventSchema()
+        if not self.schema.versioned:
+            raise ValueError("BinarySink writes versioned records; versioned=False only reads older logs")
+        self._rec = self.schema.record_struct()
+        self._dtype = self.schema.dtype()
+        self._pack = self._rec.pack_into
+        self._size = self._rec.size
+        self._cap = max(1, int(chunk_records))
+        self._level = int(compress_level)
+        self._sensor_fields = self.schema.sensor_fields
+        # frame size -> (getter, absent values of the omitted trailing optional keys)
+        self._fast: Dict[int, Tuple[Callable[[Dict[str, Any]], Tuple[Any, ...]], Tuple[Any, ...]]] = {}
+        fields = list(self._sensor_fields)
+        tail: Tuple[Any, ...] = ()
+        while fields:
+            names = [name for name, _ in fields]
+            self._fast[len(names)] = (
+                operator.itemgetter(*names) if len(names) > 1 else (lambda d, k=names[0]: (d[k],)),
+                tail,
+            )
+            name, kind = fields[-1]
+            if name not in OPTIONAL_SENSOR_KEYS:
+                break
+            tail = (_ABSENT[kind],) + tail
+            fields.pop()
+        self._get_output = operator.itemgetter("u_control", "P_budget", "mode", "state", "allow_control",
+                                               "derived_metrics")
+        self._get_metrics = operator.itemgetter("mismatch_power", "mismatch_phase", "coherence_score")
+
+        self._free: "queue.Queue[bytearray]" = queue.Queue()
+        for _ in range(max(2, int(buffers))):
+            self._free.put(bytearray(self._cap * self._size))
+        self._pending: "queue.Queue[Optional[Tuple[bytearray, int]]]" = queue.Queue()
+        self._buf = self._free.get()
+        self._n = 0
+        self._error: Optional[BaseException] = None
+
+        self._f: BinaryIO = open(path, "wb")
+        self._f.write(MAGIC)
+        self._f.write(self.schema.to_header("zlib-planes" if self._level > 0 else "planes"))
+        self._writer = threading.Thread(target=self._run_writer, name="amnion-event-writer", daemon=True)
+        self._writer.start()
+        self._closed = False
+
+    # --- hot path ---
+    def write(
+        self,
+        tick: int,
+        ts: float,
+        dt_from_start_s: float,
+        sensors: Dict[str, Any],
+        output: Dict[str, Any],
+        actuator_last: Optional[Dict[str, Any]] = None,
+        config_version: Optional[int] = None,
+    ) -> None:
+        svals: Any = None
+        fast = self._fast.get(len(sensors))
+        if fast is not None:
+            try:
+                svals = fast[0](sensors) + fast[1]
+            except KeyError:
+                pass
+        if svals is None:
+            svals = self._sensor_values(sensors)
+
+        u, budget, mode, state, allow, dm = self._get_output(output)
+        mp, mph, coh = self._get_metrics(dm)
+        if mp is None:
+            mp = _NAN
+        mode, state = _MODE_CODE[mode], _STATE_CODE[state]
+        if config_version is None:
+            config_version = INT_ABSENT
+        off = self._n * self._size
+        try:
+            self._pack(self._buf, off, tick, ts, dt_from_start_s, config_version, *svals,
+                       u, budget, mode, state, allow, mp, mph, coh)
+        except struct.error:
+            # fast path took raw values (None / non-numeric); normalize and retry
+            self._pack(self._buf, off, tick, ts, dt_from_start_s, config_version, *self._sensor_values(sensors),
+                       u, budget, mode, state, allow, mp, mph, coh)
+        self._n += 1
+        if self._n == self._cap:
+            self._submit()
+
+    def _sensor_values(self, sensors: Dict[str, Any]) -> List[Any]:
+        vals: List[Any] = []
+        seen = 0
+        for name, kind in self._sensor_fields:
+            if name not in sensors:
+                vals.append(_ABSENT[kind])
+                continue
+            seen += 1
+            vals.append(_coerce(kind, sensors[name]))
+        if seen != len(sensors):
+            self._check_keys(sensors)
+        return vals
+
+    def _check_keys(self, sensors: Dict[str, Any]) -> None:
+        known = {k for k, _ in self._sensor_fields}
+        extra = [k for k in sensors if k not in known]
+        if extra:
+            raise ValueError(f"sensor keys not representable in binary schema: {extra}")
+
+    def _submit(self) -> None:
+        if self._error is not None:
+            raise RuntimeError("event writer failed") from self._error
+        if self._n:
+            self._pending.put((self._buf, self._n))
+            self._buf = self._free.get()
+            self._n = 0
+
+    # --- writer thread ---
+    def _run_writer(self) -> None:
+        while True:
+            item = self._pending.get()
+            if item is None:
+                return
+            buf, n = item
+            try:
+                if self._error is None:
+                    payload = _encode_planes(buf, n, self._size, self._level)
+                    self._f.write(_CHUNK_HEADER.pack(n, len(payload)))
+                    self._f.write(payload)
+            except BaseException as e:  # surfaced on next write()/close()
+                self._error = e
+            finally:
+                self._free.put(buf)
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            if self._error is None and self._n:
+                self._pending.put((self._buf, self._n))
+                self._n = 0
+        finally:
+            self._pending.put(None)
+            self._writer.join()
+            self._f.close()
+        if self._error is not None:
+            raise RuntimeError("event writer failed") from self._error
+
+    def __enter__(self) -> "BinarySink":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def _encode_planes(buf: bytearray, n: int, size: int, level: int) -> bytes:
+    planes = np.frombuffer(buf, dtype=np.uint8, count=n * size).reshape(n, size).T
+    if level <= 0:
+        return planes.tobytes()
+    m = min(n, _PLANE_SAMPLE)
+    flags = np.array(
+        [len(zlib.compress(planes[k, :m].tobytes(), level)) < _PLANE_GAIN * m for k in range(size)],
+        dtype=bool,
+    )
+    return flags.view(np.uint8).tobytes() + zlib.compress(planes[flags].tobytes(), level) + planes[~flags].tobytes()
+
+
+def _decode_planes(payload: bytes, n: int, dtype: np.dtype, compressed: bool) -> np.ndarray:
+    size = dtype.itemsize
+    planes = np.empty((size, n), dtype=np.uint8)
+    if compressed:
+        flags = np.frombuffer(payload, dtype=bool, count=size)
+        z = zlib.decompressobj()
+        planes[flags] = np.frombuffer(z.decompress(payload[size:]), dtype=np.uint8).reshape(-1, n)
+        planes[~flags] = np.frombuffer(z.unused_data, dtype=np.uint8).reshape(-1, n)
+    else:
+        planes[:] = np.frombuffer(payload, dtype=np.uint8).reshape(size, n)
+    return np.ascontiguousarray(planes.T).view(dtype).reshape(n)
+
+
+# ------------------------------------------------------------
+# Readers / converter
+# ------------------------------------------------------------
+def iter_chunks(path: str) -> Iterator[np.ndarray]:
+    """Yield structured record arrays, one per stored chunk (bounded memory)."""
+    with open(path, "rb") as f:
+        if f.readline() != MAGIC:
+            raise ValueError(f"not an AMNION binary event log: {path}")
+        schema, codec = EventSchema.from_header(f.readline())
+        dtype = schema.dtype()
+        while True:
+            head = f.read(_CHUNK_HEADER.size)
+            if not head:
+                return
+            n, nbytes = _CHUNK_HEADER.unpack(head)
+            payload = f.read(nbytes)
+            if codec.endswith("planes"):
+                yield _decode_planes(payload, n, dtype, codec == "zlib-planes")
+                continue
+            data = zlib.decompress(payload) if codec == "zlib" else payload
+            rec = np.empty(n, dtype=dtype)
+            pos = 0
+            for name in dtype.names:
+                ft = dtype.fields[name][0]
+                rec[name] = np.frombuffer(data, dtype=ft, count=n, offset=pos)
+                pos += ft.itemsize * n
+            yield rec
+
+
+def read_records(path: str) -> np.ndarray:
+    """Whole log as one structured array (analytics; loads everything)."""
+    chunks = list(iter_chunks(path))
+    if not chunks:
+        return np.empty(0, dtype=_schema_of(path).dtype())
+    return np.concatenate(chunks)
+
+
+def _schema_of(path: str) -> EventSchema:
+    with open(path, "rb") as f:
+        f.readline()
+        return EventSchema.from_header(f.readline())[0]
+
+
+def binary_to_jsonl(src: str, dst: str) -> int:
+    """Convert a BinarySink log to run_simulation JSONL. Returns number of events."""
+    schema = _schema_of(src)
+    sensor_cols = [(f"s.{name}", name, kind) for name, kind in schema.sensor_fields]
+    n_events = 0
+    with open(dst, "w", encoding="utf-8") as out:
+        for rec in iter_chunks(src):
+            for r in rec.tolist():
+                row = dict(zip(rec.dtype.names, r))
+                sensors: Dict[str, Any] = {}
+                for col, name, kind in sensor_cols:
+                    v = row[col]
+                    if kind == "f":
+                        if v == v:
+                            sensors[name] = v
+                    elif kind == "i":
+                        if v != INT_ABSENT:
+                            sensors[name] = v
+                    elif v >= 0:
+                        sensors[name] = bool(v)
+                mp = row["mismatch_power"]
+                output = {
+                    "u_control": row["u_control"],
+                    "mode": MODE_NAMES[row["mode"]],
+                    "P_budget": row["P_budget"],
+                    "state": STATE_NAMES[row["state"]],
+                    "allow_control": bool(row["allow_control"]),
+                    "derived_metrics": {
+                        "mismatch_power": None if mp != mp else mp,
+                        "mismatch_phase": row["mismatch_phase"],
+                        "coherence_score": row["coherence_score"],
+                    },
+                }
+                event: Dict[str, Any] = {"tick": row["tick"], "ts": row["ts"], "dt_from_start_s": row["dt_from_start_s"]}
+                if row.get("config_version", INT_ABSENT) != INT_ABSENT:
+                    event["config_version"] = row["config_version"]
+                event["sensors"] = sensors
+                event["output"] = output
+                event["actuator_last"] = output
+                out.write(json.dumps(event, ensure_ascii=False) + "\n")
+                n_events += 1
+    return n_events
+
+
+def open_sink(path: str, fmt: str = "jsonl") -> Any:
+    """Sink factory: fmt 'jsonl' or 'binary'."""
+    if fmt == "jsonl":
+        return JsonlSink(path)
+    if fmt == "binary":
+        return BinarySink(path)
+    raise ValueError(f"unknown event sink format: {fmt!r}")
+
+
+def main() -> int:
+    import argparse
+
+    ap = argparse.ArgumentParser(prog="amnion-events", description="Convert binary event logs to JSONL.")
+    ap.add_argument("src", help="BinarySink log")
+    ap.add_argument("dst", help="Output JSONL path")
+    args = ap.parse_args()
+    n = binary_to_jsonl(args.src, args.dst)
+    print(f"OK: {n} events -> {args.dst}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,176 @@
+# controller/io/fault_injection.py
+# Seeded, composable sensor fault processes (simulation-only).
+# FaultySensor wraps any source with read() -> dict (SensorStub, replay, ...)
+# and applies a list of fault processes to every frame, in order.
+
+from __future__ import annotations
+
+import copy
+import math
+import random
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, ClassVar, Dict, List, Sequence, Tuple
+
+# SensorStub frame keys by kind
+NUMERIC_KEYS: Tuple[str, ...] = ("Q", "P_draw", "P_in", "phase_error", "rate_change", "f_ref", "state_integrity")
+FLAG_KEYS: Tuple[str, ...] = ("loop_closure", "sensor_valid")
+
+# what a corrupted field may turn into
+GARBAGE: Tuple[Any, ...] = (math.nan, math.inf, -math.inf, None, "nan", "", "garbage", "1e999", [], {})
+
+
+@dataclass
+class Fault(ABC):
+    """
+    One fault process. apply() mutates the frame in place and may keep state
+    across ticks (a fresh copy is made per FaultySensor). Every process draws
+    only from its own rng, seeded from (run seed, name): adding or removing
+    another process never changes what this one does.
+    """
+
+    kind: ClassVar[str] = "fault"
+    name: str = ""  # defaults to kind; must be unique within one FaultySensor
+
+    @property
+    def label(self) -> str:
+        return self.name or self.kind
+
+    @abstractmethod
+    def apply(self, frame: Dict[str, Any], tick: int, rng: random.Random) -> None:
+        ...
+
+
+@dataclass
+class Dropout(Fault):
+    """Each key goes missing with probability rate."""
+
+    kind: ClassVar[str] = "dropout"
+    rate: float = 0.02
+    keys: Tuple[str, ...] = NUMERIC_KEYS + FLAG_KEYS
+
+    def apply(self, frame: Dict[str, Any], tick: int, rng: random.Random) -> None:
+        for k in self.keys:
+            if rng.random() < self.rate:
+                frame.pop(k, None)
+
+
+@dataclass
+class Garbage(Fault):
+    """Each key is replaced by a non-finite number, None or a non-numeric string with probability rate."""
+
+    kind: ClassVar[str] = "garbage"
+    rate: float = 0.01
+    keys: Tuple[str, ...] = NUMERIC_KEYS
+    values: Tuple[Any, ...] = GARBAGE
+
+    def apply(self, frame: Dict[str, Any], tick: int, rng: random.Random) -> None:
+        for k in self.keys:
+            if rng.random() < self.rate:
+                frame[k] = copy.copy(self.values[rng.randrange(len(self.values))])
+
+
+@dataclass
+class Spike(Fault):
+    """Impulses: value += scale * N(0, 1) with probability rate per numeric key."""
+
+    kind: ClassVar[str] = "spike"
+    rate: float = 0.01
+    scale: float = 1.0
+    keys: Tuple[str, ...] = NUMERIC_KEYS
+
+    def apply(self, frame: Dict[str, Any], tick: int, rng: random.Random) -> None:
+        for k in self.keys:
+            if rng.random() < self.rate and isinstance(frame.get(k), (int, float)) and not isinstance(frame[k], bool):
+                frame[k] = frame[k] + self.scale * rng.gauss(0.0, 1.0)
+
+
+@dataclass
+class Drift(Fault):
+    """Random-walk offset per key (phase drift, power mismatch): sigma per tick."""
+
+    kind: ClassVar[str] = "drift"
+    sigma: float = 0.002
+    keys: Tuple[str, ...] = ("P_draw", "phase_error", "f_ref")
+    _offset: Dict[str, float] = field(default_factory=dict, repr=False)
+
+    def apply(self, frame: Dict[str, Any], tick: int, rng: random.Random) -> None:
+        for k in self.keys:
+            off = self._offset[k] = self._offset.get(k, 0.0) + rng.gauss(0.0, self.sigma)
+            if isinstance(frame.get(k), (int, float)) and not isinstance(frame[k], bool):
+                frame[k] = frame[k] + off
+
+
+@dataclass
+class StuckAt(Fault):
+    """With probability rate a key freezes at its current value for 1..max_ticks ticks."""
+
+    kind: ClassVar[str] = "stuck"
+    rate: float = 0.005
+    max_ticks: int = 200
+    keys: Tuple[str, ...] = NUMERIC_KEYS + FLAG_KEYS
+    _stuck: Dict[str, List[Any]] = field(default_factory=dict, repr=False)  # key -> [value, ticks left]
+
+    def apply(self, frame: Dict[str, Any], tick: int, rng: random.Random) -> None:
+        for k in self.keys:
+            held = self._stuck.get(k)
+            if held is not None:
+                frame[k] = held[0]
+                held[1] -= 1
+                if held[1] <= 0:
+                    del self._stuck[k]
+            elif k in frame and rng.random() < self.rate:
+                self._stuck[k] = [frame[k], rng.randint(1, self.max_ticks)]
+
+
+@dataclass
+class FlappingEStop(Fault):
+    """Operator error: emergency_stop toggles with probability rate per tick (latched between toggles)."""
+
+    kind: ClassVar[str] = "estop"
+    rate: float = 0.01
+    _on: bool = field(default=False, repr=False)
+
+    def apply(self, frame: Dict[str, Any], tick: int, rng: random.Random) -> None:
+        if rng.random() < self.rate:
+            self._on = not self._on
+        if self._on:
+            frame["emergency_stop"] = True
+
+
+FAULT_TYPES: Dict[str, type] = {c.kind: c for c in (Dropout, Garbage, Spike, Drift, StuckAt, FlappingEStop)}
+
+
+def make_faults(kinds: Sequence[str], **params: Dict[str, Any]) -> List[Fault]:
+    """Fault processes by kind with default parameters; params: {kind: {field: value}}."""
+    out = []
+    for kind in kinds:
+        if kind not in FAULT_TYPES:
+            raise ValueError(f"unknown fault {kind!r} (known: {sorted(FAULT_TYPES)})")
+        out.append(FAULT_TYPES[kind](**(params.get(kind) or {})))
+    return out
+
+
+class FaultySensor:
+    """
+    Sensor source wrapper: read() = source.read() with every fault applied.
+    Deterministic for a given (seed, faults, source).
+    """
+
+    def __init__(self, source: Any, faults: Sequence[Fault], seed: int, *, start_tick: int = 0):
+        labels = [f.label for f in faults]
+        if len(set(labels)) != len(labels):
+            raise ValueError(f"fault names must be unique: {labels}")
+        self.source = source
+        self.seed = int(seed)
+        self.faults = [copy.deepcopy(f) for f in faults]
+        self._rngs = [random.Random(f"{self.seed}/{f.label}") for f in self.faults]
+        self._tick = int(start_tick)
+
+    def read(self) -> Dict[str, Any]:
+        frame = dict(self.source.read())
+        tick = self._tick
+        self._tick += 1
+        for f, rng in zip(self.faults, self._rngs):
+            f.apply(frame, tick, rng)
+        return frame
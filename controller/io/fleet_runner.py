@@ -0,0 +1,218 @@
+# controller/io/fleet_runner.py
+# Multi-process fleet simulation (simulation-only).
+# Shards N independent SensorStub -> AmnionController -> ActuatorStub chains
+# across a process pool. Each capsule is exactly one run_simulation() call.
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from controller.amnion_controller import AmnionController
+from controller.clock import Clock, VirtualClock
+from controller.io.fault_injection import Fault, FaultySensor, make_faults
+from controller.io.sensor_stub import SensorStub
+from controller.io.simulation_runner import run_simulation
+from controller.runtime import Runtime, RuntimeConfig
+from controller.safety_gate import SafetyConfig, SafetyGate
+
+
+@dataclass(frozen=True)
+class CapsuleSpec:
+    """
+    Fully deterministic description of one capsule run.
+    seed: seeds the capsule's sensor fault processes (FaultySensor)
+    faults: fault processes applied to the capsule's SensorStub frames; none = clean sensor
+    safety / runtime: field overrides for SafetyConfig / RuntimeConfig (the capsule profile).
+    dt: tick period of a simulated clock (controller/clock.py VirtualClock); None = real time.
+    """
+
+    capsule_id: int
+    seed: int
+    ticks: int
+    base_freq: float = 76.4
+    profile: str = "default"
+    safety: Dict[str, Any] = field(default_factory=dict)
+    runtime: Dict[str, Any] = field(default_factory=dict)
+    dt: Optional[float] = None
+    faults: Tuple[Fault, ...] = ()
+
+    def build_sensor(self, clock: Optional[Clock] = None) -> Any:
+        stub = SensorStub(base_freq=self.base_freq, clock=clock)
+        return FaultySensor(stub, self.faults, self.seed) if self.faults else stub
+
+    def build_controller(self) -> AmnionController:
+        return AmnionController(
+            safety=SafetyGate(SafetyConfig(**self.safety)),
+            runtime=Runtime(RuntimeConfig(**self.runtime)),
+        )
+
+
+@dataclass(frozen=True)
+class CapsuleResult:
+    capsule_id: int
+    ticks: int
+    seconds: float
+    path: str
+
+
+@dataclass(frozen=True)
+class FleetResult:
+    capsules: List[CapsuleResult]
+    workers: int
+    wall_s: float
+    merged_path: Optional[str] = None
+
+    @property
+    def total_ticks(self) -> int:
+        return sum(c.ticks for c in self.capsules)
+
+    @property
+    def ticks_per_s(self) -> float:
+        return self.total_ticks / self.wall_s if self.wall_s > 0 else 0.0
+
+
+def make_fleet(
+    n: int,
+    ticks: int,
+    *,
+    fleet_seed: int = 764,
+    base_freq: float = 76.4,
+    freq_jitter: float = 0.5,
+    profiles: Optional[Dict[str, Dict[str, Dict[str, Any]]]] = None,
+    dt: Optional[float] = None,
+    faults: Sequence[Fault] = (),
+) -> List[CapsuleSpec]:
+    """
+    Deterministic capsule parameters: capsule i draws its profile, base_freq and
+    fault seed from random.Random(f"{fleet_seed}/{i}"), so a capsule's parameters
+    do not depend on fleet size or worker count.
+
+    profiles: {"name": {"safety": {...}, "runtime": {...}}}; one drawn per capsule.
+    faults: fault processes for every capsule; each capsule's seed gives it its own draws.
+    """
+    profiles = profiles or {"default": {}}
+    names = sorted(profiles)
+    specs: List[CapsuleSpec] = []
+    for i in range(int(n)):
+        rng = random.Random(f"{fleet_seed}/{i}")
+        name = names[rng.randrange(len(names))]
+        prof = profiles[name]
+        specs.append(
+            CapsuleSpec(
+                capsule_id=i,
+                seed=rng.getrandbits(63),
+                ticks=int(ticks),
+                base_freq=base_freq + rng.uniform(-freq_jitter, freq_jitter),
+                profile=name,
+                safety=dict(prof.get("safety") or {}),
+                runtime=dict(prof.get("runtime") or {}),
+                dt=dt,
+                faults=tuple(faults),
+            )
+        )
+    return specs
+
+
+def capsule_path(out_dir: str, capsule_id: int) -> str:
+    return os.path.join(out_dir, f"capsule_{capsule_id:05d}.jsonl")
+
+
+def run_capsule(spec: CapsuleSpec, out_dir: str) -> CapsuleResult:
+    """Worker entry point: one capsule, one output file."""
+    path = capsule_path(out_dir, spec.capsule_id)
+    t0 = time.perf_counter()
+    clock = VirtualClock(spec.dt) if spec.dt is not None else None
+    run_simulation(
+        ticks=spec.ticks,
+        out_path=path,
+        controller=spec.build_controller(),
+        clock=clock,
+        sensor=spec.build_sensor(clock),
+    )
+    return CapsuleResult(spec.capsule_id, spec.ticks, time.perf_counter() - t0, path)
+
+
+def _merge(results: Sequence[CapsuleResult], merged_path: str) -> None:
+    # Splice the capsule id into each event line; no JSON re-encoding.
+    os.makedirs(os.path.dirname(merged_path) or ".", exist_ok=True)
+    with open(merged_path, "w", encoding="utf-8") as out:
+        for r in sorted(results, key=lambda x: x.capsule_id):
+            prefix = '{"capsule": %d, ' % r.capsule_id
+            with open(r.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    out.write(prefix + line[1:])
+
+
+def run_fleet(
+    specs: Sequence[CapsuleSpec],
+    out_dir: str = "results/fleet",
+    *,
+    workers: Optional[int] = None,
+    merged_path: Optional[str] = None,
+) -> FleetResult:
+    """
+    Runs every capsule in its own worker task. Output files are identical to
+    calling run_simulation() per capsule in one process (wall-clock fields aside).
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    n_workers = max(1, int(workers or os.cpu_count() or 1))
+    # Longest capsules first: keeps the pool busy until the tail.
+    ordered = sorted(specs, key=lambda s: (-s.ticks, s.capsule_id))
+
+    t0 = time.perf_counter()
+    results: List[CapsuleResult] = []
+    if n_workers == 1:
+        results = [run_capsule(s, out_dir) for s in ordered]
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            futures = [pool.submit(run_capsule, s, out_dir) for s in ordered]
+            for fut in as_completed(futures):
+                results.append(fut.result())
+    wall = time.perf_counter() - t0
+
+    results.sort(key=lambda r: r.capsule_id)
+    if merged_path:
+        _merge(results, merged_path)
+    return FleetResult(capsules=results, workers=n_workers, wall_s=wall, merged_path=merged_path)
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(prog="amnion-fleet")
+    ap.add_argument("--capsules", type=int, default=8)
+    ap.add_argument("--ticks", type=int, default=3000)
+    ap.add_argument("--workers", type=int, default=0, help="0 = os.cpu_count()")
+    ap.add_argument("--seed", type=int, default=764)
+    ap.add_argument("--base-freq", type=float, default=76.4)
+    ap.add_argument("--freq-jitter", type=float, default=0.5)
+    ap.add_argument("--out-dir", default="results/fleet")
+    ap.add_argument("--merged", default="", help="Optional merged JSONL path")
+    ap.add_argument("--virtual-dt", type=float, default=0.0,
+                    help="Simulated clock, seconds per tick (reproducible timestamps); 0 = real time")
+    ap.add_argument("--faults", nargs="*", default=[], help="Sensor fault kinds per capsule (fault_injection)")
+    args = ap.parse_args()
+
+    specs = make_fleet(
+        args.capsules,
+        args.ticks,
+        fleet_seed=args.seed,
+        base_freq=args.base_freq,
+        freq_jitter=args.freq_jitter,
+        dt=args.virtual_dt or None,
+        faults=make_faults(args.faults),
+    )
+    res = run_fleet(specs, args.out_dir, workers=args.workers or None, merged_path=args.merged or None)
+    print(
+        f"OK: capsules={len(res.capsules)} workers={res.workers} ticks={res.total_ticks} "
+        f"wall={res.wall_s:.2f}s ticks/s={res.ticks_per_s:.0f}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
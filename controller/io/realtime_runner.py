@@ -0,0 +1,387 @@
+# controller/io/realtime_runner.py
+# Fixed-rate asyncio control loop (simulation-only by default).
+# Wires: sensor.read() -> AmnionController.step -> actuator.apply() on an absolute
+# time grid, with jitter / overrun / deadline-miss accounting and the sensor
+# timeout of configs/02_safety.yaml (safety.sensor_rules.timeout_ms).
+#
+#   python -m controller.io.realtime_runner --rate-hz 1000 --ticks 10000
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import inspect
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, Sequence, Union
+
+from controller.amnion_controller import AmnionController
+from controller.clock import Clock, VirtualClock, ns_source
+from controller.io.actuator_stub import ActuatorStub
+from controller.io.sensor_stub import SensorStub
+from controller.stage_timing import StageTimer
+
+
+# Per-tick timing stages: stamps are [scheduled, start, read, step, end]
+LOOP_STAGES = ("lateness", "sensor", "step", "actuator")
+
+# Miss kinds passed to on_miss(tick, kind, value)
+MISS_DEADLINE = "deadline"  # tick finished after the next grid point (value: ms late)
+MISS_SKIPPED = "skipped"  # grid slots dropped to re-align (value: slot count)
+MISS_SENSOR = "sensor_deadline"  # read not done within its budget, last frame held (value: age ms)
+MISS_SENSOR_TIMEOUT = "sensor_timeout"  # held frame older than timeout_ms (value: age ms)
+
+NS = 1_000_000_000
+
+
+@dataclass(frozen=True)
+class RealtimeConfig:
+    """
+    rate_hz:           tick rate; tick k is scheduled at t0 + k / rate_hz
+    sensor_budget:     fraction of the period an async sensor read may take before
+                       the tick proceeds with the last good frame (the read keeps
+                       running and is picked up by a later tick)
+    sensor_timeout_ms: once the last good frame is older than this, step() gets a
+                       frame without measurements and sensor_valid=False, so
+                       SafetyGate / the guard program apply the configured
+                       missing-sensor policy (safety.sensor_rules)
+    spin_s:            below this remaining time the loop yields with sleep(0)
+                       instead of sleeping (epoll waits are 1 ms granular)
+    """
+
+    rate_hz: float = 1000.0
+    sensor_budget: float = 0.5
+    sensor_timeout_ms: float = 500.0
+    spin_s: float = 0.002
+
+    @classmethod
+    def from_config(cls, data: Dict[str, Any], **overrides: Any) -> "RealtimeConfig":
+        """Build from a merged config (00_system.yaml limits + 02_safety.yaml sensor_rules)."""
+        limits = data.get("limits") or {}
+        rules = (data.get("safety") or {}).get("sensor_rules") or {}
+        kw: Dict[str, Any] = {
+            "rate_hz": float(limits.get("update_rate_hz", cls.rate_hz)),
+            "sensor_timeout_ms": float(rules.get("timeout_ms", cls.sensor_timeout_ms)),
+        }
+        kw.update(overrides)
+        return cls(**kw)
+
+    @property
+    def period_ns(self) -> int:
+        return int(round(NS / float(self.rate_hz)))
+
+
+@dataclass
+class LoopStats:
+    ticks: int = 0
+    overruns: int = 0  # tick work (read + step + write) longer than one period
+    deadline_misses: int = 0
+    skipped: int = 0
+    sensor_deadline_misses: int = 0
+    sensor_timeouts: int = 0
+    sensor_errors: int = 0
+    max_lateness_ns: int = 0
+    timer: StageTimer = field(default_factory=lambda: StageTimer(LOOP_STAGES), repr=False)
+
+
+@dataclass(frozen=True)
+class RealtimeReport:
+    rate_hz: float
+    ticks: int
+    wall_s: float
+    overruns: int
+    deadline_misses: int
+    skipped: int
+    sensor_deadline_misses: int
+    sensor_timeouts: int
+    sensor_errors: int
+    max_lateness_us: float
+    stages: Dict[str, Dict[str, Any]]
+
+    @property
+    def achieved_hz(self) -> float:
+        return self.ticks / self.wall_s if self.wall_s > 0 else 0.0
+
+    @property
+    def miss_rate(self) -> float:
+        slots = self.ticks + self.skipped
+        return (self.deadline_misses + self.skipped) / slots if slots else 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.deadline_misses == 0 and self.skipped == 0
+
+    def format(self) -> str:
+        lines = [
+            f"rate={self.rate_hz:.0f}Hz achieved={self.achieved_hz:.1f}Hz ticks={self.ticks} wall={self.wall_s:.2f}s",
+            f"deadline_misses={self.deadline_misses} skipped={self.skipped} overruns={self.overruns} "
+            f"max_lateness={self.max_lateness_us:.0f}us",
+            f"sensor: deadline_misses={self.sensor_deadline_misses} timeouts={self.sensor_timeouts} "
+            f"errors={self.sensor_errors}",
+            f"{'stage':<10} {'p50 us':>9} {'p99 us':>9} {'p999 us':>9} {'max us':>9}",
+        ]
+        for name, r in self.stages.items():
+            if r.get("count"):
+                lines.append(
+                    f"{name:<10} {r['p50_us']:>9.1f} {r['p99_us']:>9.1f} {r['p999_us']:>9.1f} {r['max_us']:>9.1f}"
+                )
+        return "\n".join(lines)
+
+
+class RealtimeRunner:
+    """
+    Runs controller.step() on an absolute time grid.
+
+    sensor.read() and actuator.apply(out) may be plain methods or coroutines.
+    An async read gets cfg.sensor_budget of the period; if it is not done the
+    tick runs on the last good frame (sensor_age_ms is added) and the read is
+    left in flight. A sync read cannot be preempted: a late one is counted as a
+    sensor deadline miss and its frame is used.
+
+    Ticks never burst to catch up: when a tick ends past the start of a later
+    slot, the slots in between are skipped (and counted).
+
+    on_miss(tick, kind, value) is called for every MISS_* event.
+    sink: optional event sink (see controller/io/event_sink.py); written per tick,
+    closed when the run ends.
+    clock: a Clock (controller/clock.py) or a nanosecond callable. With a
+    VirtualClock the grid, frame ages and sensor timeouts run in simulated time:
+    waits jump the clock forward instead of sleeping, so a run takes only the
+    CPU time of its ticks and is reproducible (the timing stats stay zero).
+    """
+
+    def __init__(
+        self,
+        controller: Optional[AmnionController] = None,
+        sensor: Any = None,
+        actuator: Any = None,
+        cfg: Optional[RealtimeConfig] = None,
+        *,
+        sink: Any = None,
+        on_miss: Optional[Callable[[int, str, float], None]] = None,
+        clock: Union[Clock, Callable[[], int]] = time.perf_counter_ns,
+    ):
+        clk = clock if isinstance(clock, Clock) else None
+        self.ctrl = controller or AmnionController()
+        self.sensor = sensor if sensor is not None else SensorStub(clock=clk)
+        self.actuator = actuator if actuator is not None else ActuatorStub()
+        self.cfg = cfg or RealtimeConfig()
+        self.sink = sink
+        self.on_miss = on_miss
+        self.clock: Callable[[], int] = ns_source(clock)
+        self._now: Callable[[], float] = clk.time if clk is not None else time.time
+        self._virtual: Optional[Clock] = clk if clk is not None and clk.virtual else None
+        self.stats = LoopStats()
+
+        self._read_async = inspect.iscoroutinefunction(self.sensor.read)
+        self._apply_async = inspect.iscoroutinefunction(self.actuator.apply)
+        self._read_task: Optional[asyncio.Task] = None
+        self._last: Dict[str, Any] = {}
+        self._last_ns = 0
+        self._stop = False
+
+    def stop(self) -> None:
+        """Finish the current tick and return from run()."""
+        self._stop = True
+
+    def _miss(self, tick: int, kind: str, value: float) -> None:
+        if self.on_miss is not None:
+            self.on_miss(tick, kind, value)
+
+    async def _sleep_until(self, t_ns: int) -> None:
+        clock = self.clock
+        if self._virtual is not None:
+            rem = t_ns - clock()
+            if rem > 0:
+                self._virtual.sleep(rem / NS)
+            await asyncio.sleep(0)
+            return
+        spin_ns = int(self.cfg.spin_s * NS)
+        while True:
+            rem = t_ns - clock()
+            if rem <= 0:
+                return
+            await asyncio.sleep((rem - spin_ns) / NS if rem > spin_ns else 0)
+
+    async def _read(self, tick: int, t_start: int, period: int) -> Dict[str, Any]:
+        clock = self.clock
+        st = self.stats
+        fresh = False
+        if self._read_async:
+            task = self._read_task
+            if task is None:
+                task = self._read_task = asyncio.ensure_future(self.sensor.read())
+            if not task.done():
+                budget = max(0, t_start + int(period * self.cfg.sensor_budget) - clock())
+                if self._virtual is not None:
+                    # simulated time: the read gets one loop turn, then the budget is spent
+                    await asyncio.sleep(0)
+                    if not task.done():
+                        self._virtual.sleep(budget / NS)
+                else:
+                    await asyncio.wait((task,), timeout=budget / NS)
+            if task.done():
+                self._read_task = None
+                if task.cancelled() or task.exception() is not None:
+                    st.sensor_errors += 1
+                else:
+                    self._last, self._last_ns, fresh = task.result(), clock(), True
+        else:
+            try:
+                frame = self.sensor.read()
+            except Exception:
+                st.sensor_errors += 1
+            else:
+                self._last, self._last_ns, fresh = frame, clock(), True
+                if self._last_ns - t_start > period * self.cfg.sensor_budget:
+                    st.sensor_deadline_misses += 1
+                    self._miss(tick, MISS_SENSOR, (self._last_ns - t_start) / 1e6)
+        if fresh:
+            return self._last
+
+        age_ms = (clock() - self._last_ns) / 1e6
+        if age_ms > self.cfg.sensor_timeout_ms:
+            st.sensor_timeouts += 1
+            self._miss(tick, MISS_SENSOR_TIMEOUT, age_ms)
+            # no usable measurements: missing-sensor frame (safety.sensor_rules policy)
+            return {
+                "ts": self._now(),
+                "sensor_valid": False,
+                "sensor_age_ms": age_ms,
+                "emergency_stop": bool(self._last.get("emergency_stop", False)),
+            }
+        st.sensor_deadline_misses += 1
+        self._miss(tick, MISS_SENSOR, age_ms)
+        return {**self._last, "sensor_age_ms": age_ms}
+
+    async def run(self, ticks: Optional[int] = None) -> RealtimeReport:
+        """Run `ticks` ticks (None: until stop()); returns the timing report."""
+        clock = self.clock
+        st = self.stats
+        timer = st.timer
+        period = self.cfg.period_ns
+        ctrl, actuator, sink = self.ctrl, self.actuator, self.sink
+
+        t0 = clock() + period
+        self._last_ns = t0
+        slot = 0
+        self._stop = False
+        try:
+            while not self._stop and (ticks is None or st.ticks < ticks):
+                scheduled = t0 + slot * period
+                await self._sleep_until(scheduled)
+                t_start = clock()
+                tick = st.ticks
+
+                sensors = await self._read(tick, t_start, period)
+                t_read = clock()
+                out = ctrl.step(sensors)
+                t_step = clock()
+                if self._apply_async:
+                    await actuator.apply(out)
+                else:
+                    actuator.apply(out)
+                t_end = clock()
+
+                if sink is not None:
+                    ts = self._now()
+                    sink.write(tick, ts, (t_start - t0) / NS, sensors, out, actuator.get_last(),
+                               self.ctrl.config_version)
+                timer.record((scheduled, t_start, t_read, t_step, t_end))
+                st.ticks += 1
+
+                late = t_start - scheduled
+                if late > st.max_lateness_ns:
+                    st.max_lateness_ns = late
+                if t_end - t_start > period:
+                    st.overruns += 1
+                if t_end > scheduled + period:
+                    st.deadline_misses += 1
+                    self._miss(tick, MISS_DEADLINE, (t_end - scheduled - period) / 1e6)
+
+                # next slot; if we are already inside a later one, run that one now
+                nxt = max(slot + 1, (t_end - t0) // period)
+                if nxt > slot + 1:
+                    st.skipped += nxt - slot - 1
+                    self._miss(tick, MISS_SKIPPED, float(nxt - slot - 1))
+                slot = nxt
+        finally:
+            if self._read_task is not None:
+                self._read_task.cancel()
+                self._read_task = None
+            if sink is not None:
+                sink.close()
+
+        wall = (clock() - t0) / NS
+        return self.report(wall)
+
+    def report(self, wall_s: float) -> RealtimeReport:
+        st = self.stats
+        return RealtimeReport(
+            rate_hz=float(self.cfg.rate_hz),
+            ticks=st.ticks,
+            wall_s=wall_s,
+            overruns=st.overruns,
+            deadline_misses=st.deadline_misses,
+            skipped=st.skipped,
+            sensor_deadline_misses=st.sensor_deadline_misses,
+            sensor_timeouts=st.sensor_timeouts,
+            sensor_errors=st.sensor_errors,
+            max_lateness_us=st.max_lateness_ns / 1e3,
+            stages=st.timer.snapshot(),
+        )
+
+
+def run_realtime(
+    ticks: int,
+    *,
+    cfg: Optional[RealtimeConfig] = None,
+    controller: Optional[AmnionController] = None,
+    sensor: Any = None,
+    actuator: Any = None,
+    sink: Any = None,
+    on_miss: Optional[Callable[[int, str, float], None]] = None,
+    clock: Union[Clock, Callable[[], int]] = time.perf_counter_ns,
+) -> RealtimeReport:
+    """Blocking wrapper: run `ticks` ticks in a fresh event loop."""
+    runner = RealtimeRunner(controller, sensor, actuator, cfg, sink=sink, on_miss=on_miss, clock=clock)
+    return asyncio.run(runner.run(ticks))
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    ap = argparse.ArgumentParser(prog="amnion-realtime", description="Fixed-rate control loop (simulation).")
+    ap.add_argument("--config-dir", default="", help="Config folder (rate / sensor timeout defaults)")
+    ap.add_argument("--rate-hz", type=float, default=0.0, help="Tick rate (default: limits.update_rate_hz)")
+    ap.add_argument("--ticks", type=int, default=5000)
+    ap.add_argument("--max-miss-rate", type=float, default=0.001, help="Fail above this deadline-miss ratio")
+    ap.add_argument("--spin-s", type=float, default=RealtimeConfig.spin_s)
+    ap.add_argument("--virtual", action="store_true", help="Simulated clock: run as fast as possible")
+    args = ap.parse_args(argv)
+
+    from pathlib import Path
+
+    from controller.config_loader import load_config
+
+    data = load_config(config_dir=Path(args.config_dir) if args.config_dir else None).data
+    overrides: Dict[str, Any] = {"spin_s": args.spin_s}
+    if args.rate_hz > 0:
+        overrides["rate_hz"] = args.rate_hz
+    cfg = RealtimeConfig.from_config(data, **overrides)
+
+    clock = VirtualClock(1.0 / cfg.rate_hz) if args.virtual else time.perf_counter_ns
+    rep = run_realtime(args.ticks, cfg=cfg, clock=clock)
+    print(rep.format())
+    if rep.miss_rate > args.max_miss_rate:
+        print(
+            f"FAIL: deadline miss rate {rep.miss_rate * 100:.3f}% > {args.max_miss_rate * 100:.3f}% "
+            f"at {cfg.rate_hz:.0f} Hz",
+            file=sys.stderr,
+        )
+        return 1
+    print(f"OK: miss rate {rep.miss_rate * 100:.3f}%")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
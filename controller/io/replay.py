@@ -0,0 +1,337 @@
+# controller/io/replay.py
+# Deterministic replay / verification of recorded runs (docs/09_TEST_PROTOCOLS.md, T10).
+# Re-drives a fresh AmnionController with the recorded sensors and diffs every tick
+# against the recorded output. Streams the log (bounded memory) and can verify
+# checkpoint-delimited chunks on a process pool.
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from controller.amnion_controller import AmnionController
+from controller.io.event_sink import json_default
+
+
+# Hashes are built per block of ticks (sha256 of the block's canonical lines), then
+# sha256 over the block digests; checkpoints sit on block boundaries, so the result
+# does not depend on how the log is chunked or how many workers verify it.
+HASH_BLOCK_TICKS = 4096
+DEFAULT_CHECKPOINT_TICKS = 16 * HASH_BLOCK_TICKS
+READ_BLOCK = 1 << 20
+MAX_DIFFS = 20
+
+ControllerFactory = Callable[[], AmnionController]
+
+
+@dataclass(frozen=True)
+class Checkpoint:
+    """Chunk start: line index (== tick position) and byte offset in the log."""
+
+    line: int
+    offset: int
+
+
+@dataclass(frozen=True)
+class TickDiff:
+    line: int
+    tick: Any
+    keys: Tuple[str, ...]
+    recorded: Dict[str, Any]
+    replayed: Dict[str, Any]
+
+
+@dataclass
+class ChunkResult:
+    line: int
+    ticks: int = 0
+    compared: int = 0
+    mismatches: int = 0
+    input_blocks: List[str] = field(default_factory=list)
+    output_blocks: List[str] = field(default_factory=list)
+    diffs: List[TickDiff] = field(default_factory=list)
+    log_sha256: str = ""  # raw bytes of the chunk (sequential mode only)
+
+
+@dataclass(frozen=True)
+class ReplayReport:
+    run_id: str
+    log_path: str
+    ticks: int
+    compared: int
+    mismatches: int
+    config_hash: str
+    input_hash: str
+    log_hash: str
+    output_hash: str
+    chunks: int
+    workers: int
+    wall_s: float
+    diffs: List[TickDiff]
+
+    @property
+    def result(self) -> str:
+        return "PASS" if self.mismatches == 0 else "FAIL"
+
+    def manifest(self) -> Dict[str, Any]:
+        """docs/09_TEST_PROTOCOLS.md §2.2 run export (plus replay details)."""
+        return {
+            "run_id": self.run_id,
+            "log_path": self.log_path,
+            "config_hash": self.config_hash,
+            "input_hash": self.input_hash,
+            "log_hash": self.log_hash,
+            "output_hash": self.output_hash,
+            "ticks": self.ticks,
+            "compared": self.compared,
+            "mismatches": self.mismatches,
+            "chunks": self.chunks,
+            "result": self.result,
+            "diffs": [asdict(d) for d in self.diffs],
+        }
+
+
+def canonical_json(obj: Any) -> str:
+    """Key-sorted, whitespace-free JSON used for every hash and comparison."""
+    return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=json_default)
+
+
+def config_hash(config_dir: Optional[str] = None) -> str:
+    """sha256 of the merged config (canonical JSON), independent of YAML formatting."""
+    from controller.config_loader import load_config
+
+    data = load_config(config_dir=config_dir).data if config_dir else load_config().data
+    return hashlib.sha256(canonical_json(data).encode("utf-8")).hexdigest()
+
+
+def _fold(block_digests: Sequence[str]) -> str:
+    h = hashlib.sha256()
+    for d in block_digests:
+        h.update(bytes.fromhex(d))
+    return h.hexdigest()
+
+
+def _split_event(event: Dict[str, Any]) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+    # run_simulation event line, or a bare recorded sensor frame
+    if "sensors" in event:
+        return event.get("sensors") or {}, event.get("output")
+    return event, None
+
+
+def _diff_keys(recorded: Dict[str, Any], replayed: Dict[str, Any]) -> Tuple[str, ...]:
+    keys = sorted(set(recorded) | set(replayed))
+    return tuple(k for k in keys if canonical_json(recorded.get(k)) != canonical_json(replayed.get(k)))
+
+
+def _iter_lines(path: str, start: int, end: Optional[int]) -> Iterator[bytes]:
+    with open(path, "rb") as f:
+        f.seek(start)
+        pos = start
+        for raw in f:
+            if end is not None and pos >= end:
+                break
+            pos += len(raw)
+            yield raw
+
+
+def verify_chunk(
+    path: str,
+    start: int = 0,
+    end: Optional[int] = None,
+    first_line: int = 0,
+    controller_factory: ControllerFactory = AmnionController,
+    *,
+    hash_log: bool = False,
+    max_diffs: int = MAX_DIFFS,
+) -> ChunkResult:
+    """
+    Replay log bytes [start, end) through one fresh controller.
+    first_line must be a multiple of HASH_BLOCK_TICKS (a checkpoint).
+    """
+    if first_line % HASH_BLOCK_TICKS:
+        raise ValueError("chunks must start on a HASH_BLOCK_TICKS boundary")
+    ctrl = controller_factory()
+    res = ChunkResult(line=first_line)
+    log_h = hashlib.sha256() if hash_log else None
+    in_h = hashlib.sha256()
+    out_h = hashlib.sha256()
+    n_block = 0
+
+    for raw in _iter_lines(path, start, end):
+        if log_h is not None:
+            log_h.update(raw)
+        if not raw.strip():
+            continue
+        event = json.loads(raw)
+        sensors, recorded = _split_event(event)
+        replayed = ctrl.step(sensors)
+
+        in_h.update(canonical_json(sensors).encode("utf-8") + b"\n")
+        rep = canonical_json(replayed)
+        out_h.update(rep.encode("utf-8") + b"\n")
+        if recorded is not None:
+            res.compared += 1
+            if canonical_json(recorded) != rep:
+                res.mismatches += 1
+                if len(res.diffs) < max_diffs:
+                    replayed = json.loads(rep)
+                    res.diffs.append(
+                        TickDiff(
+                            line=first_line + res.ticks,
+                            tick=event.get("tick", first_line + res.ticks),
+                            keys=_diff_keys(recorded, replayed),
+                            recorded=recorded,
+                            replayed=replayed,
+                        )
+                    )
+        res.ticks += 1
+        n_block += 1
+        if n_block == HASH_BLOCK_TICKS:
+            res.input_blocks.append(in_h.hexdigest())
+            res.output_blocks.append(out_h.hexdigest())
+            in_h, out_h, n_block = hashlib.sha256(), hashlib.sha256(), 0
+
+    if n_block:
+        res.input_blocks.append(in_h.hexdigest())
+        res.output_blocks.append(out_h.hexdigest())
+    if log_h is not None:
+        res.log_sha256 = log_h.hexdigest()
+    return res
+
+
+def scan_checkpoints(path: str, every: int = DEFAULT_CHECKPOINT_TICKS) -> Tuple[List[Checkpoint], int, str]:
+    """
+    One streaming pass over the raw log: byte offset of every `every`-th line
+    (rounded up to HASH_BLOCK_TICKS) plus the total line count and sha256 of the bytes.
+    Assumes one event per line and no blank lines (as written by JsonlSink).
+    """
+    every = max(HASH_BLOCK_TICKS, -(-int(every) // HASH_BLOCK_TICKS) * HASH_BLOCK_TICKS)
+    h = hashlib.sha256()
+    checkpoints = [Checkpoint(0, 0)]
+    lines = 0
+    offset = 0
+    tail = False  # last block did not end with a newline
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(READ_BLOCK), b""):
+            h.update(block)
+            n = block.count(b"\n")
+            next_cp = checkpoints[-1].line + every
+            pos = 0
+            while lines + n >= next_cp:
+                # advance to the newline that ends line next_cp - 1
+                for _ in range(next_cp - lines):
+                    pos = block.index(b"\n", pos) + 1
+                n -= next_cp - lines
+                lines = next_cp
+                checkpoints.append(Checkpoint(lines, offset + pos))
+                next_cp += every
+            lines += n
+            offset += len(block)
+            tail = not block.endswith(b"\n")
+    if tail:
+        lines += 1
+    if checkpoints[-1].offset >= offset and len(checkpoints) > 1:
+        checkpoints.pop()  # log ends exactly on a checkpoint
+    return checkpoints, lines, h.hexdigest()
+
+
+def replay(
+    log_path: str,
+    *,
+    workers: int = 1,
+    checkpoint_ticks: int = DEFAULT_CHECKPOINT_TICKS,
+    controller_factory: ControllerFactory = AmnionController,
+    config_dir: Optional[str] = None,
+    run_id: Optional[str] = None,
+) -> ReplayReport:
+    """
+    Verify a recorded run.
+
+    workers == 1: single streaming pass with one controller (exact for any controller).
+    workers > 1:  checkpoint-delimited chunks on a process pool; each chunk starts a
+                  fresh controller_factory() controller, so this is exact only while
+                  the controller carries no output-relevant state across ticks (the
+                  default pipeline; not stateful guard engines). controller_factory
+                  must be picklable.
+    """
+    t0 = time.perf_counter()
+    n_workers = max(1, int(workers or os.cpu_count() or 1))
+
+    if n_workers == 1:
+        chunks = [verify_chunk(log_path, controller_factory=controller_factory, hash_log=True)]
+        log_hash = chunks[0].log_sha256
+    else:
+        cps, _, log_hash = scan_checkpoints(log_path, checkpoint_ticks)
+        bounds = [(cp.offset, nxt.offset if nxt else None, cp.line) for cp, nxt in zip(cps, cps[1:] + [None])]
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            futures = [
+                pool.submit(verify_chunk, log_path, start, end, line, controller_factory)
+                for start, end, line in bounds
+            ]
+            chunks = [f.result() for f in futures]
+
+    diffs: List[TickDiff] = []
+    for c in chunks:
+        diffs.extend(c.diffs)
+    return ReplayReport(
+        run_id=run_id or Path(log_path).stem,
+        log_path=str(log_path),
+        ticks=sum(c.ticks for c in chunks),
+        compared=sum(c.compared for c in chunks),
+        mismatches=sum(c.mismatches for c in chunks),
+        config_hash=config_hash(config_dir),
+        input_hash=_fold([d for c in chunks for d in c.input_blocks]),
+        log_hash=log_hash,
+        output_hash=_fold([d for c in chunks for d in c.output_blocks]),
+        chunks=len(chunks),
+        workers=n_workers,
+        wall_s=time.perf_counter() - t0,
+        diffs=diffs[:MAX_DIFFS],
+    )
+
+
+def write_manifest(report: ReplayReport, path: str) -> None:
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report.manifest(), f, indent=2, sort_keys=True, ensure_ascii=False, default=json_default)
+        f.write("\n")
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(prog="amnion-replay", description="Replay a recorded run and verify outputs.")
+    ap.add_argument("log", help="run_simulation JSONL log (or JSONL sensor frames)")
+    ap.add_argument("--workers", type=int, default=1, help="0 = os.cpu_count()")
+    ap.add_argument("--checkpoint-ticks", type=int, default=DEFAULT_CHECKPOINT_TICKS)
+    ap.add_argument("--config-dir", default="", help="Config folder hashed into config_hash")
+    ap.add_argument("--manifest", default="", help="Write the hash manifest JSON here")
+    ap.add_argument("--run-id", default="")
+    args = ap.parse_args()
+
+    rep = replay(
+        args.log,
+        workers=args.workers if args.workers > 0 else (os.cpu_count() or 1),
+        checkpoint_ticks=args.checkpoint_ticks,
+        config_dir=args.config_dir or None,
+        run_id=args.run_id or None,
+    )
+    if args.manifest:
+        write_manifest(rep, args.manifest)
+    for d in rep.diffs:
+        print(f"DIFF line={d.line} tick={d.tick} keys={','.join(d.keys)}")
+    print(
+        f"{rep.result}: ticks={rep.ticks} compared={rep.compared} mismatches={rep.mismatches} "
+        f"chunks={rep.chunks} workers={rep.workers} wall={rep.wall_s:.2f}s"
+    )
+    print(f"config_hash={rep.config_hash}\ninput_hash={rep.input_hash}\nlog_hash={rep.log_hash}")
+    return 0 if rep.result == "PASS" else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
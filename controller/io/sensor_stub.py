@@ -5,8 +5,24 @@
 from __future__ import annotations
 
 import math
-import time
-from typing import Dict, Any
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+from controller.clock import Clock, time_source
+
+# read() keys in order; columns of read_batch() (numpy dtype names)
+BATCH_FIELDS: Tuple[Tuple[str, str], ...] = (
+    ("ts", "float64"),
+    ("f_ref", "float64"),
+    ("phase_error", "float64"),
+    ("Q", "float64"),
+    ("P_draw", "float64"),
+    ("P_in", "float64"),
+    ("rate_change", "float64"),
+    ("loop_closure", "bool"),
+    ("state_integrity", "float64"),
+    ("sensor_valid", "bool"),
+    ("emergency_stop", "bool"),
+)
 
 
 class SensorStub:
@@ -17,13 +33,24 @@ class SensorStub:
     for reproducible controller ticks.
 
     No hardware access is implemented.
+
+    clock: source of the "ts" field -- a Clock (controller/clock.py) or a
+    callable returning seconds (default time.time); every other field depends
+    only on the tick index.
     """
 
-    def __init__(self, base_freq: float = 76.4):
+    def __init__(self, base_freq: float = 76.4, clock: Union[Clock, Callable[[], float], None] = None):
         self.base_freq = float(base_freq)
-        self._t0 = time.time()
+        self._source = clock
+        self.clock: Callable[[], float] = time_source(clock)
+        self._t0 = self.clock()
         self._tick = 0
 
+    @property
+    def tick(self) -> int:
+        """Index of the frame the next read() returns."""
+        return self._tick
+
     def read(self) -> Dict[str, Any]:
         """
         Produce a synthetic sensor frame.
@@ -39,7 +66,7 @@ class SensorStub:
         power_in = 0.5
 
         return {
-            "ts": time.time(),
+            "ts": self.clock(),
             "f_ref": self.base_freq,
             "phase_error": abs(math.sin(phase)) * 0.2,
             "Q": max(0.0, q),
@@ -52,4 +79,62 @@ class SensorStub:
             "emergency_stop": False,
         }
 
-  
+    @staticmethod
+    def alloc_batch(n: int) -> Dict[str, Any]:
+        """Empty columns (BATCH_FIELDS) for n frames, reusable as read_batch(out=...)."""
+        import numpy as np
+
+        return {key: np.empty(int(n), dtype=dtype) for key, dtype in BATCH_FIELDS}
+
+    def read_batch(self, start_tick: int, n: int, out: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Frames start_tick .. start_tick + n - 1 as columns (BATCH_FIELDS, one
+        1-D array per key): row i equals the read() that returns tick
+        start_tick + i, except "ts": Clock.times(n) (one dt step per row on a
+        VirtualClock) for a Clock, else one clock() reading for the whole
+        batch. Does not move the read() position.
+
+        out: preallocated columns (see alloc_batch()) of length >= n; the first
+        n rows are written in place and views of them returned. The result
+        feeds AmnionController.step_batch() directly.
+        """
+        import numpy as np
+
+        n = int(n)
+        if out is None:
+            out = self.alloc_batch(n)
+        cols = {key: out[key][:n] for key, _ in BATCH_FIELDS}
+        for key, arr in cols.items():
+            if arr.shape[0] != n:
+                raise ValueError(f"buffer {key!r} holds {arr.shape[0]} rows, need {n}")
+
+        # same float64 operations, in the same order, as read()
+        t = np.arange(int(start_tick), int(start_tick) + n, dtype=np.float64)
+        q = cols["Q"]
+        np.multiply(0.0001, t, out=q)
+        np.subtract(0.9, q, out=q)
+        np.maximum(q, 0.0, out=q)
+
+        phase = np.multiply(0.05, t, out=t)
+        s = cols["P_draw"]
+        np.sin(phase, out=s)
+        pe = cols["phase_error"]
+        np.abs(s, out=pe)
+        pe *= 0.2
+        s *= 0.1
+        s += 0.5
+        rc = cols["rate_change"]
+        np.cos(phase, out=rc)
+        rc *= 0.01
+
+        if isinstance(self._source, Clock):
+            cols["ts"][:] = self._source.times(n)
+        else:
+            cols["ts"].fill(self.clock())
+        cols["f_ref"].fill(self.base_freq)
+        cols["P_in"].fill(0.5)
+        cols["state_integrity"].fill(0.95)
+        cols["loop_closure"].fill(True)
+        cols["sensor_valid"].fill(True)
+        cols["emergency_stop"].fill(False)
+        return cols
@@ -1,31 +1,19 @@
 # controller/io/simulation_runner.py
 # Simulation runner for AMNION-ORACLE (simulation-only).
 # Wires: SensorStub -> AmnionController -> ActuatorStub
-# Produces deterministic-ish logs (deterministic by tick, timestamps are real-time).
+# Logs are deterministic by tick; timestamps come from the clock (RealClock by
+# default, VirtualClock for byte-reproducible, faster-than-real-time runs).
 
 from __future__ import annotations
 
-import json
 import os
-import time
-from dataclasses import asdict, is_dataclass
 from typing import Any, Dict, Optional
 
 from controller.amnion_controller import AmnionController
-from controller.io.sensor_stub import SensorStub, SensorStubConfig
+from controller.clock import Clock, RealClock, VirtualClock
+from controller.io.sensor_stub import SensorStub
 from controller.io.actuator_stub import ActuatorStub
-
-
-def _json_safe(x: Any) -> Any:
-    if is_dataclass(x):
-        return asdict(x)
-    if isinstance(x, (str, int, float, bool)) or x is None:
-        return x
-    if isinstance(x, dict):
-        return {str(k): _json_safe(v) for k, v in x.items()}
-    if isinstance(x, (list, tuple)):
-        return [_json_safe(v) for v in x]
-    return str(x)
+from controller.io.event_sink import open_sink
 
 
 def run_simulation(
@@ -34,6 +22,10 @@ def run_simulation(
     base_freq: float = 76.4,
     sleep_s: float = 0.0,
     controller: Optional[AmnionController] = None,
+    sink: Any = None,
+    fmt: str = "jsonl",
+    clock: Optional[Clock] = None,
+    sensor: Any = None,
 ) -> str:
     """
     Runs a simulation-only control loop.
@@ -43,44 +35,57 @@ def run_simulation(
     - base_freq: reference frequency for SensorStub
     - sleep_s: optional sleep between ticks (0 = as fast as possible)
     - controller: optionally pass an existing controller instance
+    - sink: optional event sink (write(...)/close(), see controller/io/event_sink.py);
+            it is closed when the run ends and its .path is returned
+    - fmt: sink format when no sink is given: "jsonl" (default) or "binary"
+    - clock: time source for frame "ts", event ts and dt_from_start_s (default
+             RealClock). A VirtualClock advances one dt per tick and sleep_s
+             only moves simulated time, so the log is byte-reproducible.
+    - sensor: optional source with read() -> dict (default SensorStub(base_freq, clock))
     """
-    os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
+    if sink is None:
+        os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
+        sink = open_sink(out_path, fmt)
 
     ctrl = controller or AmnionController()
-    sensor = SensorStub(SensorStubConfig(base_freq=base_freq))
+    clk = clock or RealClock()
+    if sensor is None:
+        sensor = SensorStub(base_freq=base_freq, clock=clk)
     actuator = ActuatorStub()
+    now, advance = clk.time, clk.advance
+    sleep_s = float(sleep_s or 0.0)
 
-    t_start = time.time()
+    t_start = now()
 
-    with open(out_path, "w", encoding="utf-8") as f:
+    try:
         for i in range(int(ticks)):
             sensors: Dict[str, Any] = sensor.read()
             out: Dict[str, Any] = ctrl.step(sensors)
             actuator.apply(out)
 
-            event = {
-                "tick": i,
-                "ts": time.time(),
-                "dt_from_start_s": time.time() - t_start,
-                "sensors": sensors,
-                "output": out,
-                "actuator_last": actuator.get_last(),
-            }
-            f.write(json.dumps(_json_safe(event), ensure_ascii=False) + "\n")
+            ts = now()
+            sink.write(i, ts, ts - t_start, sensors, out, actuator.get_last(), ctrl.config_version)
 
-            if sleep_s and sleep_s > 0:
-                time.sleep(float(sleep_s))
+            if sleep_s > 0:
+                clk.sleep(sleep_s)
+            advance()
+    finally:
+        sink.close()
 
-    return out_path
+    return sink.path
 
 
 if __name__ == "__main__":
     # Minimal CLI run without extra dependencies.
+    # AMNION_VIRTUAL_DT=<seconds>: simulated clock advancing that much per tick.
+    virtual_dt = os.getenv("AMNION_VIRTUAL_DT")
     path = run_simulation(
         ticks=int(os.getenv("AMNION_TICKS", "3000")),
         out_path=os.getenv("AMNION_OUT", "results/sim_events.jsonl"),
         base_freq=float(os.getenv("AMNION_BASE_FREQ", "76.4")),
         sleep_s=float(os.getenv("AMNION_SLEEP_S", "0.0")),
+        fmt=os.getenv("AMNION_FORMAT", "jsonl"),
+        clock=VirtualClock(float(virtual_dt)) if virtual_dt else None,
     )
     print(f"OK: wrote {path}")
 
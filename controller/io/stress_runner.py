@@ -0,0 +1,327 @@
+# controller/io/stress_runner.py
+# Seeded fault-injection stress campaign (simulation-only).
+# Every trial is SensorStub -> FaultySensor -> AmnionController with the
+# safety invariants checked online after each tick; the first violation ends
+# the trial. Failures are shrunk to a minimal reproducer (seed, tick count,
+# fault set) instead of being logged in full. Trials run across a process pool.
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from controller.io.fault_injection import FAULT_TYPES, Fault, FaultySensor, make_faults
+from controller.runtime import RuntimeConfig
+from controller.safety_gate import STATE_ORDER, SafetyConfig
+
+INVARIANTS: Tuple[str, ...] = (
+    "exception",        # step() raised
+    "undefined_state",  # state outside S0..S3
+    "escalation",       # final state below what a raised flag demands (monotonic within a tick)
+    "allow_control",    # allow_control must be False exactly in S2 / S3
+    "u_zero",           # u_control == 0 whenever allow_control is False
+    "u_bounds",         # u_control finite and within [u_min, u_max]
+    "budget",           # P_budget finite, within [0, P_max]; 0 in S3, <= P_budget_min in S2
+    "invalid_sensor",   # sensor_valid False or Q missing / non-finite must reach S2 (I4)
+)
+
+_BARRIER_FLAGS = frozenset(("power_overflow", "Q_crit", "phase_trip", "rate_trip"))
+
+
+def _flag_rank(flag: str, cfg: SafetyConfig) -> int:
+    """Lowest state rank a SafetyGate flag requires (0: informational)."""
+    if flag == "emergency_stop=true":
+        return 3
+    if flag in _BARRIER_FLAGS or flag.startswith(("sensor_invalid:", "abraxas:")):
+        return 2
+    if flag in ("rate_limit", "lawx:UNKNOWN_MODE"):
+        return 1
+    if flag == "lawx:DEGRADE":
+        return STATE_ORDER[cfg.lawx_degrade_to]
+    if flag == "lawx:ISOLATE":
+        return STATE_ORDER[cfg.lawx_isolate_to]
+    if flag == "lawx:THROTTLE":
+        return STATE_ORDER[cfg.lawx_throttle_to]
+    return 0
+
+
+def _finite(x: Any) -> Optional[float]:
+    if isinstance(x, bool):
+        return None
+    try:
+        v = float(x)
+    except (TypeError, ValueError):
+        return None
+    return v if math.isfinite(v) else None
+
+
+def check_tick(
+    frame: Dict[str, Any],
+    out: Dict[str, Any],
+    safety: Dict[str, Any],
+    scfg: SafetyConfig,
+    rcfg: RuntimeConfig,
+) -> Optional[Tuple[str, str]]:
+    """(invariant, detail) for the first invariant this tick breaks, else None."""
+    state = out.get("state")
+    rank = STATE_ORDER.get(state)
+    if rank is None:
+        return "undefined_state", f"state={state!r}"
+    for flag in safety.get("flags") or ():
+        if _flag_rank(flag, scfg) > rank:
+            return "escalation", f"flag {flag!r} with state {state}"
+    allow = out.get("allow_control")
+    if allow is not (rank < 2):
+        return "allow_control", f"allow_control={allow!r} in {state}"
+    u = out.get("u_control")
+    if _finite(u) is None or not rcfg.u_min <= u <= rcfg.u_max:
+        return "u_bounds", f"u_control={u!r}"
+    if not allow and u != 0.0:
+        return "u_zero", f"u_control={u!r} with allow_control=False"
+    p = out.get("P_budget")
+    if _finite(p) is None or not 0.0 <= p <= scfg.P_max:
+        return "budget", f"P_budget={p!r} outside [0, {scfg.P_max}]"
+    if (rank == 3 and p != 0.0) or (rank == 2 and p > max(scfg.P_budget_min, rcfg.P_budget_min)):
+        return "budget", f"P_budget={p!r} in {state}"
+    if rank < 2 and (frame.get("sensor_valid") is False or _finite(frame.get("Q")) is None):
+        return "invalid_sensor", f"Q={frame.get('Q')!r} sensor_valid={frame.get('sensor_valid')!r} passed as {state}"
+    return None
+
+
+@dataclass(frozen=True)
+class StressSpec:
+    """Campaign definition; faults are templates (each trial runs fresh copies)."""
+
+    faults: Tuple[Fault, ...] = field(default_factory=lambda: tuple(make_faults(sorted(FAULT_TYPES))))
+    ticks: int = 5000
+    base_freq: float = 76.4
+    safety: Dict[str, Any] = field(default_factory=dict)
+    runtime: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class Failure:
+    """Minimal reproducer: run_trial(seed, spec, faults=<these>, ticks=ticks) fails the same way."""
+
+    seed: int
+    invariant: str
+    tick: int
+    faults: Tuple[str, ...]
+    detail: str
+    frame: Dict[str, Any]
+
+    @property
+    def ticks(self) -> int:
+        return self.tick + 1
+
+
+def run_trial(
+    seed: int,
+    spec: StressSpec,
+    *,
+    faults: Optional[Sequence[Fault]] = None,
+    ticks: Optional[int] = None,
+) -> Tuple[int, Optional[Failure]]:
+    """One seeded trial; returns (ticks run, first violation or None)."""
+    from controller.amnion_controller import AmnionController
+    from controller.clock import VirtualClock
+    from controller.io.sensor_stub import SensorStub
+    from controller.metrics import Metrics, MetricsConfig
+    from controller.runtime import Runtime
+    from controller.safety_gate import SafetyGate
+
+    faults = spec.faults if faults is None else faults
+    scfg, rcfg = SafetyConfig(**spec.safety), RuntimeConfig(**spec.runtime)
+    ctrl = AmnionController(
+        safety=SafetyGate(scfg),
+        runtime=Runtime(rcfg),
+        metrics=Metrics(cfg=MetricsConfig(enabled=False)),
+    )
+    ctx = ctrl.context
+    clock = VirtualClock()  # frame "ts" = tick * dt: failures replay byte-identical
+    sensor = FaultySensor(SensorStub(base_freq=spec.base_freq, clock=clock), faults, seed)
+    labels = tuple(f.label for f in faults)
+
+    n = int(spec.ticks if ticks is None else ticks)
+    for tick in range(n):
+        frame = sensor.read()
+        try:
+            out = ctrl.step(frame)
+        except Exception as e:
+            return tick + 1, Failure(seed, "exception", tick, labels, f"{type(e).__name__}: {e}", frame)
+        bad = check_tick(frame, out, ctx.safety, scfg, rcfg)
+        if bad is not None:
+            return tick + 1, Failure(seed, bad[0], tick, labels, bad[1], frame)
+        clock.advance()
+    return n, None
+
+
+def shrink(spec: StressSpec, failure: Failure) -> Failure:
+    """
+    Drop fault processes one at a time while the trial still breaks the same
+    invariant (each process has its own rng, so the others replay unchanged),
+    and cut the run at the failing tick. Passes repeat until nothing more can
+    go: a process may only become removable once another one is gone.
+    """
+    by_label = {f.label: f for f in spec.faults}
+    faults = [by_label[label] for label in failure.faults]
+    changed = True
+    while changed and len(faults) > 1:
+        changed = False
+        i = 0
+        while i < len(faults) and len(faults) > 1:
+            trial = faults[:i] + faults[i + 1:]
+            _, f = run_trial(failure.seed, spec, faults=trial, ticks=failure.ticks)
+            if f is not None and f.invariant == failure.invariant:
+                faults, failure, changed = trial, f, True
+            else:
+                i += 1
+    return failure
+
+
+def _run_seeds(seeds: Sequence[int], spec: StressSpec) -> Tuple[int, List[Failure]]:
+    ticks = 0
+    failures: List[Failure] = []
+    for seed in seeds:
+        n, f = run_trial(seed, spec)
+        ticks += n
+        if f is not None:
+            failures.append(shrink(spec, f))
+    return ticks, failures
+
+
+@dataclass(frozen=True)
+class StressReport:
+    trials: int
+    ticks: int
+    workers: int
+    wall_s: float
+    failed_trials: int
+    # smallest reproducer per (invariant, minimal fault set), with its trial count
+    failures: List[Tuple[Failure, int]]
+
+    @property
+    def ok(self) -> bool:
+        return self.failed_trials == 0
+
+    @property
+    def ticks_per_s(self) -> float:
+        return self.ticks / self.wall_s if self.wall_s > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "trials": self.trials,
+            "ticks": self.ticks,
+            "workers": self.workers,
+            "wall_s": round(self.wall_s, 3),
+            "failed_trials": self.failed_trials,
+            "failures": [
+                {**asdict(f), "frame": _json_frame(f.frame), "count": count} for f, count in self.failures
+            ],
+        }
+
+
+def _json_frame(frame: Dict[str, Any]) -> Dict[str, Any]:
+    # non-finite floats and odd types as repr: the report stays strict JSON
+    out = {}
+    for k, v in frame.items():
+        if isinstance(v, (bool, int, str)) or v is None or (isinstance(v, float) and math.isfinite(v)):
+            out[k] = v
+        else:
+            out[k] = repr(v)
+    return out
+
+
+def run_stress(
+    spec: StressSpec,
+    trials: int,
+    *,
+    seed: int = 0,
+    workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+) -> StressReport:
+    """Trials use seeds seed .. seed + trials - 1; the report does not depend on workers or chunking."""
+    seeds = list(range(int(seed), int(seed) + int(trials)))
+    n_workers = max(1, min(int(workers or os.cpu_count() or 1), len(seeds) or 1))
+    size = max(1, int(chunk_size or len(seeds) // (n_workers * 4) or 1))
+    chunks = [seeds[i:i + size] for i in range(0, len(seeds), size)]
+
+    t0 = time.perf_counter()
+    ticks = 0
+    found: List[Failure] = []
+    if n_workers == 1:
+        for c in chunks:
+            n, fs = _run_seeds(c, spec)
+            ticks += n
+            found.extend(fs)
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            for fut in as_completed([pool.submit(_run_seeds, c, spec) for c in chunks]):
+                n, fs = fut.result()
+                ticks += n
+                found.extend(fs)
+    wall = time.perf_counter() - t0
+
+    groups: Dict[Tuple[str, Tuple[str, ...]], List[Failure]] = {}
+    for f in found:
+        groups.setdefault((f.invariant, f.faults), []).append(f)
+    failures = [
+        (min(fs, key=lambda f: (f.ticks, f.seed)), len(fs))
+        for _, fs in sorted(groups.items(), key=lambda kv: (INVARIANTS.index(kv[0][0]), kv[0][1]))
+    ]
+    return StressReport(len(seeds), ticks, n_workers, wall, len(found), failures)
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(prog="amnion-stress")
+    ap.add_argument("--trials", type=int, default=200)
+    ap.add_argument("--ticks", type=int, default=5000, help="Ticks per trial")
+    ap.add_argument("--seed", type=int, default=0, help="First trial seed")
+    ap.add_argument("--faults", default=",".join(sorted(FAULT_TYPES)),
+                    help=f"Comma-separated fault processes ({', '.join(sorted(FAULT_TYPES))})")
+    ap.add_argument("--rate", type=float, default=None, help="Override the per-tick rate of every fault that has one")
+    ap.add_argument("--workers", type=int, default=0, help="0 = os.cpu_count()")
+    ap.add_argument("--report", default="", help="Optional JSON report path")
+    ap.add_argument("--replay", type=int, default=None, metavar="SEED",
+                    help="Re-run one trial (with --faults / --ticks from a reported failure)")
+    args = ap.parse_args()
+
+    kinds = [k.strip() for k in args.faults.split(",") if k.strip()]
+    params = {k: {"rate": args.rate} for k in kinds if k != "drift"} if args.rate is not None else {}
+    try:
+        spec = StressSpec(faults=tuple(make_faults(kinds, **params)), ticks=args.ticks)
+    except (TypeError, ValueError) as e:
+        ap.error(str(e))
+
+    if args.replay is not None:
+        n, f = run_trial(args.replay, spec)
+        if f is None:
+            print(f"OK: seed={args.replay} ticks={n} no violation")
+            return 0
+        print(json.dumps({**asdict(f), "frame": _json_frame(f.frame)}, indent=2))
+        return 1
+
+    res = run_stress(spec, args.trials, seed=args.seed, workers=args.workers or None)
+    if args.report:
+        os.makedirs(os.path.dirname(args.report) or ".", exist_ok=True)
+        with open(args.report, "w", encoding="utf-8") as fh:
+            json.dump(res.to_dict(), fh, indent=2)
+    print(
+        f"{'OK' if res.ok else 'FAIL'}: trials={res.trials} ticks={res.ticks} failed={res.failed_trials} "
+        f"workers={res.workers} wall={res.wall_s:.1f}s ticks/s={res.ticks_per_s:.0f}"
+    )
+    for f, count in res.failures:
+        print(f"  {f.invariant:<15} x{count:<5} seed={f.seed} ticks={f.ticks} faults={','.join(f.faults)}  {f.detail}")
+        print(f"    reproduce: python -m controller.io.stress_runner --replay {f.seed} "
+              f"--faults {','.join(f.faults)} --ticks {f.ticks}" + (f" --rate {args.rate}" if args.rate else ""))
+    return 0 if res.ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,422 @@
+# controller/io/sweep.py
+# Parameter sweep over SafetyConfig / RuntimeConfig fields (simulation-only).
+# Each point is one SensorStub -> AmnionController run, reduced to a compact
+# summary row; points are sharded across a process pool, completed points are
+# journaled by config hash (interrupted sweeps resume) and the rows are
+# collected into one columnar table (.npz, optional .csv).
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import hashlib
+import itertools
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from controller.runtime import RuntimeConfig
+from controller.safety_gate import STATE_ORDER, SafetyConfig
+
+# bump when the simulation or the summary changes: old journal entries then miss
+SWEEP_FORMAT = 1
+
+DEFAULT_TICKS = 6000  # SensorStub Q decays through the default Q_crit (0.5) at tick 4000
+
+SECTIONS = {"safety": SafetyConfig, "runtime": RuntimeConfig}
+
+STATES: Tuple[str, ...] = tuple(sorted(STATE_ORDER, key=STATE_ORDER.__getitem__))
+# SafetyGate flags counted per point (ticks on which the trip fired)
+TRIP_FLAGS: Tuple[str, ...] = ("Q_crit", "phase_trip", "rate_trip", "rate_limit", "power_overflow")
+
+SUMMARY_FIELDS: Tuple[str, ...] = (
+    tuple(f"ticks_{s.split('_', 1)[0].lower()}" for s in STATES)
+    + ("violations",)
+    + tuple(f"trips_{f}" for f in TRIP_FLAGS)
+    + ("mean_u", "first_escalation")
+)
+
+
+def _numeric_fields(cls: type) -> List[str]:
+    return [f.name for f in dataclasses.fields(cls) if isinstance(f.default, float)]
+
+
+def resolve_field(name: str) -> Tuple[str, str]:
+    """
+    "safety.Q_crit" / "runtime.u_nominal", or a bare field name when it exists
+    in only one of SafetyConfig / RuntimeConfig. Only float fields can be swept.
+    """
+    if "." in name:
+        section, fname = name.split(".", 1)
+        if section not in SECTIONS or fname not in _numeric_fields(SECTIONS[section]):
+            raise ValueError(f"unknown sweep field {name!r}")
+        return section, fname
+    hits = [s for s, cls in SECTIONS.items() if name in _numeric_fields(cls)]
+    if not hits:
+        raise ValueError(f"unknown sweep field {name!r}")
+    if len(hits) > 1:
+        raise ValueError(f"ambiguous sweep field {name!r}: use one of {[f'{s}.{name}' for s in hits]}")
+    return hits[0], name
+
+
+@dataclass(frozen=True)
+class SweepPoint:
+    """One parameter set: field overrides for SafetyConfig / RuntimeConfig."""
+
+    point_id: int
+    params: Tuple[Tuple[str, float], ...]  # (qualified field, value) in axis order
+    ticks: int = DEFAULT_TICKS
+    base_freq: float = 76.4
+
+    def overrides(self) -> Dict[str, Dict[str, float]]:
+        out: Dict[str, Dict[str, float]] = {s: {} for s in SECTIONS}
+        for name, value in self.params:
+            section, fname = resolve_field(name)
+            out[section][fname] = float(value)
+        return out
+
+    def configs(self) -> Tuple[SafetyConfig, RuntimeConfig]:
+        ov = self.overrides()
+        return SafetyConfig(**ov["safety"]), RuntimeConfig(**ov["runtime"])
+
+    @property
+    def config_hash(self) -> str:
+        """sha256 of the fully resolved configs + run length: equal hashes simulate identically."""
+        safety, runtime = self.configs()
+        doc = {
+            "format": SWEEP_FORMAT,
+            "safety": dataclasses.asdict(safety),
+            "runtime": dataclasses.asdict(runtime),
+            "ticks": int(self.ticks),
+            "base_freq": float(self.base_freq),
+        }
+        return hashlib.sha256(json.dumps(doc, sort_keys=True).encode()).hexdigest()
+
+
+def _qualified(axes: Iterable[str]) -> List[str]:
+    names = [".".join(resolve_field(a)) for a in axes]
+    if len(set(names)) != len(names):
+        raise ValueError(f"duplicate sweep field in {list(axes)}")
+    return names
+
+
+def grid(
+    axes: Dict[str, Sequence[float]],
+    *,
+    ticks: int = DEFAULT_TICKS,
+    base_freq: float = 76.4,
+) -> List[SweepPoint]:
+    """Full factorial grid; the last axis varies fastest."""
+    names = _qualified(axes)
+    values = [[float(v) for v in axes[a]] for a in axes]
+    return [
+        SweepPoint(i, tuple(zip(names, combo)), int(ticks), float(base_freq))
+        for i, combo in enumerate(itertools.product(*values))
+    ]
+
+
+def latin_hypercube(
+    bounds: Dict[str, Tuple[float, float]],
+    n: int,
+    *,
+    seed: int = 764,
+    ticks: int = DEFAULT_TICKS,
+    base_freq: float = 76.4,
+) -> List[SweepPoint]:
+    """
+    n points; each axis [lo, hi] is cut into n equal strata and every stratum
+    is sampled exactly once (uniform within it). Axis k draws from
+    random.Random(f"{seed}/{k}"), so the design is reproducible.
+    """
+    names = _qualified(bounds)
+    n = int(n)
+    cols: List[List[float]] = []
+    for k, a in enumerate(bounds):
+        lo, hi = (float(x) for x in bounds[a])
+        rng = random.Random(f"{seed}/{k}")
+        strata = list(range(n))
+        rng.shuffle(strata)
+        cols.append([lo + (hi - lo) * (s + rng.random()) / n for s in strata])
+    return [
+        SweepPoint(i, tuple(zip(names, (c[i] for c in cols))), int(ticks), float(base_freq))
+        for i in range(n)
+    ]
+
+
+def run_point(point: SweepPoint) -> Dict[str, Any]:
+    """Simulate one point and reduce it to SUMMARY_FIELDS (no event output)."""
+    from controller.amnion_controller import AmnionController
+    from controller.clock import VirtualClock
+    from controller.io.sensor_stub import SensorStub
+    from controller.metrics import Metrics, MetricsConfig
+    from controller.runtime import Runtime
+    from controller.safety_gate import SafetyGate
+
+    safety, runtime = point.configs()
+    ctrl = AmnionController(
+        safety=SafetyGate(safety),
+        runtime=Runtime(runtime),
+        metrics=Metrics(cfg=MetricsConfig(enabled=False)),
+    )
+    ctx = ctrl.context
+    clock = VirtualClock()  # simulated time: no per-tick clock syscalls
+    sensor = SensorStub(base_freq=point.base_freq, clock=clock)
+
+    per_state = {s: 0 for s in STATES}
+    trips = {f: 0 for f in TRIP_FLAGS}
+    violations = 0
+    u_sum = 0.0
+    first = -1
+    for i in range(int(point.ticks)):
+        out = ctrl.step(sensor.read())
+        state = out["state"]
+        per_state[state] += 1
+        if first < 0 and state != "S0_NORMAL":
+            first = i
+        raw = ctx.safety
+        if not raw["ok"]:
+            violations += 1
+            for f in raw["flags"]:
+                if f in trips:
+                    trips[f] += 1
+        u_sum += out["u_control"]
+        clock.advance()
+
+    values = [per_state[s] for s in STATES] + [violations] + [trips[f] for f in TRIP_FLAGS]
+    values += [u_sum / point.ticks if point.ticks else 0.0, first]
+    return dict(zip(SUMMARY_FIELDS, values))
+
+
+def _run_chunk(points: Sequence[SweepPoint]) -> List[Tuple[str, Dict[str, Any]]]:
+    return [(p.config_hash, run_point(p)) for p in points]
+
+
+def load_journal(path: str) -> Dict[str, Dict[str, Any]]:
+    """Completed summaries by config hash; a torn last line (interrupted write) is ignored."""
+    done: Dict[str, Dict[str, Any]] = {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    rec = json.loads(line)
+                except ValueError:
+                    continue
+                if rec.get("format") == SWEEP_FORMAT and isinstance(rec.get("summary"), dict):
+                    done[rec["hash"]] = rec["summary"]
+    except FileNotFoundError:
+        pass
+    return done
+
+
+@dataclass
+class SweepTable:
+    """Columnar results: one array per column, one row per point (by point_id)."""
+
+    columns: Dict[str, Any]
+    params: Tuple[str, ...] = ()
+
+    def __len__(self) -> int:
+        return len(self.columns["point_id"])
+
+    def row(self, i: int) -> Dict[str, Any]:
+        return {k: v[i].item() for k, v in self.columns.items()}
+
+    def save(self, path: str) -> str:
+        import numpy as np
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "wb") as f:
+            np.savez(f, **self.columns)
+        return path
+
+    @classmethod
+    def load(cls, path: str) -> "SweepTable":
+        import numpy as np
+
+        with np.load(path) as z:
+            columns = {k: z[k] for k in z.files}
+        fixed = {"point_id", "config_hash", *SUMMARY_FIELDS}
+        return cls(columns, tuple(k for k in columns if k not in fixed))
+
+    def to_csv(self, path: str) -> str:
+        import csv
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            w = csv.writer(f)
+            w.writerow(list(self.columns))
+            for i in range(len(self)):
+                w.writerow(self.row(i).values())
+        return path
+
+
+@dataclass(frozen=True)
+class SweepResult:
+    table: SweepTable
+    computed: int  # points simulated in this call
+    cached: int  # points served from the journal (or duplicates of another point)
+    workers: int
+    wall_s: float
+    journal_path: Optional[str] = field(default=None)
+
+    @property
+    def points_per_s(self) -> float:
+        return self.computed / self.wall_s if self.wall_s > 0 else 0.0
+
+
+def _table(points: Sequence[SweepPoint], hashes: Sequence[str], done: Dict[str, Dict[str, Any]]) -> SweepTable:
+    import numpy as np
+
+    params = tuple(name for name, _ in points[0].params) if points else ()
+    columns: Dict[str, Any] = {
+        "point_id": np.array([p.point_id for p in points], dtype=np.int64),
+        "config_hash": np.array(list(hashes), dtype="U64"),
+    }
+    for k, name in enumerate(params):
+        columns[name] = np.array([p.params[k][1] for p in points], dtype=np.float64)
+    for name in SUMMARY_FIELDS:
+        dtype = np.float64 if name == "mean_u" else np.int64
+        columns[name] = np.array([done[h][name] for h in hashes], dtype=dtype)
+    return SweepTable(columns, params)
+
+
+def run_sweep(
+    points: Sequence[SweepPoint],
+    *,
+    workers: Optional[int] = None,
+    journal_path: Optional[str] = None,
+    chunk_size: Optional[int] = None,
+) -> SweepResult:
+    """
+    Runs every point not already in the journal (by config hash) and returns
+    the table for all points, ordered by point_id. Each finished chunk is
+    appended to the journal (JSONL) as it completes, so an interrupted sweep
+    restarted with the same journal only simulates what is missing.
+    Rows do not depend on worker count or chunking.
+    """
+    points = sorted(points, key=lambda p: p.point_id)
+    hashes = [p.config_hash for p in points]
+    done = load_journal(journal_path) if journal_path else {}
+
+    todo: List[SweepPoint] = []
+    seen = set(done)
+    for p, h in zip(points, hashes):
+        if h not in seen:
+            seen.add(h)
+            todo.append(p)
+
+    n_workers = max(1, min(int(workers or os.cpu_count() or 1), len(todo) or 1))
+    # several points per task amortize pickling / IPC; ~4 tasks per worker keeps the tail short
+    size = max(1, int(chunk_size or min(32, len(todo) // (n_workers * 4) or 1)))
+    chunks = [todo[i:i + size] for i in range(0, len(todo), size)]
+
+    journal = None
+    if journal_path:
+        os.makedirs(os.path.dirname(journal_path) or ".", exist_ok=True)
+        try:
+            with open(journal_path, "rb") as f:
+                f.seek(-1, os.SEEK_END)
+                torn = f.read(1) != b"\n"
+        except OSError:  # missing or empty
+            torn = False
+        journal = open(journal_path, "a", encoding="utf-8")
+        if torn:
+            journal.write("\n")  # terminate an interrupted last line before appending
+
+    def _record(rows: List[Tuple[str, Dict[str, Any]]]) -> None:
+        for h, summary in rows:
+            done[h] = summary
+            if journal is not None:
+                journal.write(json.dumps({"format": SWEEP_FORMAT, "hash": h, "summary": summary}) + "\n")
+        if journal is not None:
+            journal.flush()
+
+    t0 = time.perf_counter()
+    try:
+        if n_workers == 1:
+            for chunk in chunks:
+                _record(_run_chunk(chunk))
+        else:
+            with ProcessPoolExecutor(max_workers=n_workers) as pool:
+                futures = [pool.submit(_run_chunk, c) for c in chunks]
+                for fut in as_completed(futures):
+                    _record(fut.result())
+    finally:
+        if journal is not None:
+            journal.close()
+    wall = time.perf_counter() - t0
+
+    return SweepResult(
+        table=_table(points, hashes, done),
+        computed=len(todo),
+        cached=len(points) - len(todo),
+        workers=n_workers,
+        wall_s=wall,
+        journal_path=journal_path,
+    )
+
+
+def _parse_axis(text: str) -> Tuple[str, List[float]]:
+    # name=v1,v2,...  or  name=lo:hi[:n]  (n evenly spaced values, default 2)
+    name, _, spec = text.partition("=")
+    if not spec:
+        raise argparse.ArgumentTypeError(f"expected name=values, got {text!r}")
+    try:
+        if ":" in spec:
+            parts = [float(x) for x in spec.split(":")]
+            lo, hi = parts[0], parts[1]
+            n = int(parts[2]) if len(parts) > 2 else 2
+            values = [lo + (hi - lo) * k / (n - 1) for k in range(n)] if n > 1 else [lo]
+        else:
+            values = [float(x) for x in spec.split(",")]
+    except (ValueError, IndexError):
+        raise argparse.ArgumentTypeError(f"bad values in {text!r}") from None
+    return name.strip(), values
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(prog="amnion-sweep")
+    ap.add_argument("--grid", action="append", type=_parse_axis, default=[], metavar="FIELD=V1,V2|LO:HI:N",
+                    help="Grid axis (repeatable), e.g. Q_crit=0.4,0.5,0.6 or u_nominal=0.3:0.7:5")
+    ap.add_argument("--lhs", action="append", type=_parse_axis, default=[], metavar="FIELD=LO:HI",
+                    help="Latin-hypercube axis (repeatable); use with --points")
+    ap.add_argument("--points", type=int, default=100, help="Latin-hypercube sample count")
+    ap.add_argument("--seed", type=int, default=764)
+    ap.add_argument("--ticks", type=int, default=DEFAULT_TICKS)
+    ap.add_argument("--base-freq", type=float, default=76.4)
+    ap.add_argument("--workers", type=int, default=0, help="0 = os.cpu_count()")
+    ap.add_argument("--out", default="results/sweep/sweep.npz")
+    ap.add_argument("--csv", default="", help="Optional CSV copy of the table")
+    ap.add_argument("--journal", default="", help="Resume journal (default: <out>.journal.jsonl)")
+    args = ap.parse_args()
+
+    if bool(args.grid) == bool(args.lhs):
+        ap.error("give either --grid or --lhs axes")
+    try:
+        if args.grid:
+            points = grid(dict(args.grid), ticks=args.ticks, base_freq=args.base_freq)
+        else:
+            bounds = {name: (min(v), max(v)) for name, v in args.lhs}
+            points = latin_hypercube(bounds, args.points, seed=args.seed, ticks=args.ticks,
+                                     base_freq=args.base_freq)
+    except ValueError as e:
+        ap.error(str(e))
+
+    journal = args.journal or os.path.splitext(args.out)[0] + ".journal.jsonl"
+    res = run_sweep(points, workers=args.workers or None, journal_path=journal)
+    res.table.save(args.out)
+    if args.csv:
+        res.table.to_csv(args.csv)
+    print(
+        f"OK: points={len(res.table)} computed={res.computed} cached={res.cached} workers={res.workers} "
+        f"wall={res.wall_s:.2f}s points/s={res.points_per_s:.1f} -> {args.out}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
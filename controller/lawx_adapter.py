@@ -32,11 +32,12 @@ class LawXAdapter:
         self.enabled = bool(enabled)
         self._engine = None
         self._SensorFrame = None
+        self._loaded = False
 
-        if not self.enabled:
-            return
-
-        # Lazy import: if you didn't place lawx_full_stack.py into controller/, adapter degrades to no-op.
+    def _load(self) -> None:
+        # Lazy import on the first frame carrying LawX inputs (not at construction):
+        # if you didn't place lawx_full_stack.py into controller/, adapter degrades to no-op.
+        self._loaded = True
         try:
             from controller.lawx_full_stack import SingularConscienceEngine, SensorFrame  # type: ignore
             self._engine = SingularConscienceEngine()
@@ -74,7 +75,13 @@ class LawXAdapter:
         Run LawX engine on current frame.
         Must never throw; returns ALLOW if unavailable.
         """
-        if not self.enabled or self._engine is None:
+        if not self.enabled:
+            return LawXResult()
+        if not self._loaded:
+            if sensors.get("pattern") is None:
+                return LawXResult()  # no LawX inputs yet: do not pay for the import
+            self._load()
+        if self._engine is None:
             return LawXResult()
 
         frame = self._extract_frame(sensors)
@@ -1,15 +1,502 @@
 # controller/logger.py
+# Structured logging.
+#
+#   Logger     - one JSON line per event on stdout (or forwarded to a RunLogger)
+#   RunLogger  - per-run log directory implementing configs/04_logging.yaml:
+#                events / metrics / guards / errors JSONL channels, manifest.yaml,
+#                sha256sum.txt and signature.txt
+#
+# RunLogger producers only enqueue (no encoding, no I/O); a writer thread
+# batch-encodes each channel, appends it, feeds the bytes to a running sha256
+# per file and writes the manifest / checksums at close().
+
 from __future__ import annotations
 
+import hashlib
 import json
+import math
+import os
+import platform
+import queue
+import subprocess
+import threading
 import time
-from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Tuple, Union
+
+from controller.clock import Clock, time_source
+
+
+# ------------------------------------------------------------
+# Run logging (configs/04_logging.yaml)
+# ------------------------------------------------------------
+SEVERITIES: Tuple[str, ...] = ("DEBUG", "INFO", "WARN", "ERROR", "CRITICAL")
+CHANNELS: Tuple[str, ...] = ("events", "metrics", "guards", "errors")
+
+# logging.mode.level -> lowest event severity written (None: logging off)
+_LEVEL_MIN: Dict[str, Optional[str]] = {"off": None, "minimal": "WARN", "normal": "INFO", "verbose": "DEBUG"}
+
+_REQUIRED: Dict[str, Tuple[str, ...]] = {
+    "events": ("ts", "run_id", "event", "severity"),
+    "metrics": ("ts", "run_id", "metrics"),
+    "guards": ("ts", "run_id", "state"),
+    "errors": ("ts", "run_id", "error"),
+}
+
+
+@dataclass(frozen=True)
+class LoggingConfig:
+    level: str = "normal"
+    root_dir: str = "logs/"
+    timestamp: str = "utc_iso8601"  # or "unix" (float seconds)
+    float_precision: Optional[int] = 6
+    sort_keys: bool = True
+    ensure_ascii: bool = True
+    # channel -> file name (enabled channels only)
+    channels: Tuple[Tuple[str, str], ...] = tuple((c, f"{c}.jsonl") for c in CHANNELS)
+    # channel -> required record fields
+    required: Tuple[Tuple[str, Tuple[str, ...]], ...] = tuple(_REQUIRED.items())
+    default_severity: str = "INFO"
+    strip_fields: Tuple[str, ...] = ("ip", "mac", "user_name", "home_path")
+
+    integrity: bool = True
+    hash_files: Tuple[str, ...] = tuple(f"{c}.jsonl" for c in CHANNELS) + ("manifest.yaml",)
+    checksum_file: str = "sha256sum.txt"
+    manifest: bool = True
+    manifest_file: str = "manifest.yaml"
+    manifest_include: Tuple[str, ...] = (
+        "run_id", "start_ts", "end_ts", "config_files", "config_hashes", "git", "host", "notes",
+    )
+    signature: bool = True
+    signature_file: str = "signature.txt"
+    signature_notes: Tuple[str, ...] = ()
+
+    git_fields: Tuple[str, ...] = ("repo", "branch", "commit", "dirty")
+    host_fields: Tuple[str, ...] = ("os", "arch", "python", "node", "device")
+    include_config_hashes: bool = True
+
+    @classmethod
+    def from_config(cls, data: Dict[str, Any], **overrides: Any) -> "LoggingConfig":
+        """Build from a merged config (04_logging.yaml, `logging:` section)."""
+        lg = data.get("logging") or {}
+        mode = lg.get("mode") or {}
+        outputs = lg.get("outputs") or {}
+        fmt = lg.get("format") or {}
+        sev = lg.get("severity") or {}
+        integ = lg.get("integrity") or {}
+        hash_cfg = integ.get("hash") or {}
+        man = integ.get("manifest") or {}
+        sig = integ.get("signature") or {}
+        ident = lg.get("run_identity") or {}
+        git = ident.get("include_git") or {}
+        host = ident.get("include_host") or {}
+
+        channels: List[Tuple[str, str]] = []
+        required: List[Tuple[str, Tuple[str, ...]]] = []
+        for name, ch in (lg.get("channels") or {}).items():
+            ch = ch or {}
+            if ch.get("enabled", True):
+                channels.append((str(name), str(ch.get("file", f"{name}.jsonl"))))
+            req = (ch.get("schema") or {}).get("required")
+            required.append((str(name), tuple(req) if req else _REQUIRED.get(name, ("ts", "run_id"))))
+
+        d = cls()
+        fp = fmt.get("float_precision", d.float_precision)
+        kw: Dict[str, Any] = dict(
+            level=str(mode.get("level", d.level)),
+            root_dir=str(outputs.get("root_dir", d.root_dir)),
+            timestamp=str(fmt.get("timestamp", d.timestamp)),
+            float_precision=None if fp is None else int(fp),
+            sort_keys=bool(fmt.get("sort_keys", d.sort_keys)),
+            ensure_ascii=bool(fmt.get("ensure_ascii", d.ensure_ascii)),
+            channels=tuple(channels) if lg.get("channels") else d.channels,
+            required=tuple(required) if lg.get("channels") else d.required,
+            default_severity=str(sev.get("default", d.default_severity)),
+            strip_fields=tuple((lg.get("privacy") or {}).get("strip_fields", d.strip_fields)),
+            integrity=bool(integ.get("enabled", d.integrity)) and bool(hash_cfg.get("algo", "sha256") == "sha256"),
+            hash_files=tuple(hash_cfg.get("include_files", d.hash_files)),
+            checksum_file=str(hash_cfg.get("output", d.checksum_file)),
+            manifest=bool(man.get("enabled", d.manifest)),
+            manifest_file=str(man.get("file", d.manifest_file)),
+            manifest_include=tuple(man.get("include", d.manifest_include)),
+            signature=bool(sig.get("enabled", d.signature)),
+            signature_file=str(sig.get("file", d.signature_file)),
+            signature_notes=tuple(str(n) for n in sig.get("notes") or ()),
+            git_fields=tuple(git.get("fields", d.git_fields)) if git.get("enabled", True) else (),
+            host_fields=tuple(host.get("fields", d.host_fields)) if host.get("enabled", True) else (),
+            include_config_hashes=bool(ident.get("include_config_hashes", d.include_config_hashes)),
+        )
+        kw.update(overrides)
+        return cls(**kw)
+
+
+def run_id_now(ts: Optional[float] = None) -> str:
+    """UTC_ISO8601_SHORT run id, e.g. 2026-01-22T22-31-05Z."""
+    return time.strftime("%Y-%m-%dT%H-%M-%SZ", time.gmtime(time.time() if ts is None else ts))
 
 
+def utc_iso(ts: float) -> str:
+    whole = math.floor(ts)
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(whole)) + f".{int((ts - whole) * 1e6):06d}Z"
+
+
+def _git_info(root: Path, fields: Tuple[str, ...]) -> Dict[str, Any]:
+    cmds = {
+        "repo": ["git", "rev-parse", "--show-toplevel"],
+        "branch": ["git", "rev-parse", "--abbrev-ref", "HEAD"],
+        "commit": ["git", "rev-parse", "HEAD"],
+        "dirty": ["git", "status", "--porcelain", "--untracked-files=no"],
+    }
+    out: Dict[str, Any] = {}
+    for name in fields:
+        cmd = cmds.get(name)
+        if cmd is None:
+            continue
+        try:
+            res = subprocess.run(cmd, cwd=root, capture_output=True, text=True, timeout=5)
+        except Exception:
+            out[name] = None
+            continue
+        text = res.stdout.strip() if res.returncode == 0 else None
+        if name == "repo" and text:
+            text = os.path.basename(text)  # no absolute paths in published logs
+        out[name] = bool(text) if name == "dirty" and text is not None else text
+    return out
+
+
+def _host_info(fields: Tuple[str, ...]) -> Dict[str, Any]:
+    probes: Dict[str, Callable[[], Any]] = {
+        "os": platform.system,
+        "arch": platform.machine,
+        "python": platform.python_version,
+        "node": platform.node,
+        "device": lambda: os.environ.get("AMNION_DEVICE"),
+    }
+    return {name: probes[name]() for name in fields if name in probes}
+
+
+class _Channel:
+    __slots__ = ("name", "path", "f", "sha", "records", "bytes")
+
+    def __init__(self, name: str, path: Path):
+        self.name = name
+        self.path = path
+        self.f: BinaryIO = open(path, "wb")
+        self.sha = hashlib.sha256()
+        self.records = 0
+        self.bytes = 0
+
+    def append(self, data: bytes, n: int) -> None:
+        self.f.write(data)
+        self.f.flush()
+        self.sha.update(data)
+        self.records += n
+        self.bytes += len(data)
+
+
+class RunLogger:
+    """
+    One run directory (<root_dir>/run_<run_id>/) per instance.
+
+    event() / metrics() / guard() / error() / log() never block and never
+    touch the disk: they stamp the wall time and put (channel, ts, record) on
+    an unbounded queue. Records the level filters out are not queued; when more
+    than max_pending records are waiting (writer behind), new ones are dropped
+    and counted in stats()["dropped"].
+
+    The writer thread drains everything queued, normalizes each record
+    (timestamp format, float_precision, privacy strip_fields, non-finite floats
+    -> null), encodes each channel's batch as one JSONL block, appends and
+    flushes it, and feeds the same bytes to the file's running sha256. Records
+    missing the channel's required fields go to the errors channel instead.
+
+    close() drains the queue, then writes manifest.yaml, sha256sum.txt
+    (`sha256sum -c` format, from the running digests: no file is re-read) and
+    signature.txt. Also usable as an event sink for run_simulation(): write()
+    logs one metrics record per tick and a guards record on every state change.
+    """
+
+    def __init__(
+        self,
+        cfg: Optional[LoggingConfig] = None,
+        *,
+        root_dir: Optional[str] = None,
+        run_id: Optional[str] = None,
+        config: Any = None,
+        notes: Optional[List[str]] = None,
+        max_pending: int = 1 << 20,
+        clock: Union[Clock, Callable[[], float]] = time.time,
+    ):
+        self.cfg = cfg or LoggingConfig()
+        self.clock: Callable[[], float] = time_source(clock)
+        self.max_pending = int(max_pending)
+        self.notes = list(notes or [])
+        self.config = config  # LoadedConfig (files / file_hashes) for the manifest
+
+        min_sev = _LEVEL_MIN.get(self.cfg.level, "INFO")
+        self.enabled = min_sev is not None
+        self._sev_rank = {s: i for i, s in enumerate(SEVERITIES)}
+        self._min_rank = self._sev_rank.get(min_sev or "INFO", 1)
+        self._open = {name for name, _ in self.cfg.channels} if self.enabled else set()
+        self._required = dict(self.cfg.required)
+
+        self.start_ts = self.clock()
+        root = Path(root_dir if root_dir is not None else self.cfg.root_dir)
+        self.run_id, self.run_dir = self._make_run_dir(root, run_id or run_id_now(self.start_ts))
+        self.path = str(self.run_dir)
+        self._files = {name: _Channel(name, self.run_dir / fname) for name, fname in self.cfg.channels
+                       if name in self._open}
+
+        self._q: "queue.SimpleQueue[Optional[Tuple[str, float, Dict[str, Any]]]]" = queue.SimpleQueue()
+        self._lock = threading.Lock()  # producer-side counters
+        self._queued = 0  # producer side
+        self._written = 0  # writer side
+        self.dropped = 0
+        self.invalid = 0
+        self._last_state: Any = None
+        self._identity: Dict[str, Any] = {}
+        self._error: Optional[BaseException] = None
+        self._closed = False
+        self._writer = threading.Thread(target=self._run_writer, name="amnion-run-logger", daemon=True)
+        self._writer.start()
+
+    @classmethod
+    def from_config(cls, loaded: Any, **kw: Any) -> "RunLogger":
+        """From a LoadedConfig (controller.config_loader.load_config())."""
+        return cls(LoggingConfig.from_config(loaded.data), config=loaded, **kw)
+
+    @staticmethod
+    def _make_run_dir(root: Path, run_id: str) -> Tuple[str, Path]:
+        root.mkdir(parents=True, exist_ok=True)
+        base, n = run_id, 1
+        while True:
+            d = root / f"run_{run_id}"
+            try:
+                d.mkdir()
+                return run_id, d
+            except FileExistsError:
+                n += 1
+                run_id = f"{base}-{n}"
+
+    # --------------------------------------------------------
+    # Producers (any thread; never block)
+    # --------------------------------------------------------
+    def log(self, channel: str, record: Dict[str, Any], ts: Optional[float] = None) -> bool:
+        """
+        Queue a record for `channel`; returns False if filtered or dropped. The
+        record is encoded later on the writer thread: do not mutate it after.
+        ts: record time (default: clock()).
+        """
+        if channel not in self._open:
+            return False
+        with self._lock:
+            if self._queued - self._written >= self.max_pending:
+                self.dropped += 1
+                return False
+            self._queued += 1
+        self._q.put((channel, self.clock() if ts is None else ts, record))
+        return True
+
+    def event(self, event: str, severity: Optional[str] = None, ts: Optional[float] = None, **fields: Any) -> bool:
+        severity = severity or self.cfg.default_severity
+        if self._sev_rank.get(severity, 1) < self._min_rank:
+            return False
+        fields["event"] = event
+        fields["severity"] = severity
+        return self.log("events", fields, ts)
+
+    def metrics(self, metrics: Dict[str, Any], **fields: Any) -> bool:
+        fields["metrics"] = metrics
+        return self.log("metrics", fields)
+
+    def guard(self, state: Any, **fields: Any) -> bool:
+        fields["state"] = state
+        return self.log("guards", fields)
+
+    def error(self, error: str, **fields: Any) -> bool:
+        fields["error"] = error
+        return self.log("errors", fields)
+
+    # event sink protocol (controller/io/event_sink.py)
+    def write(
+        self,
+        tick: int,
+        ts: float,
+        dt_from_start_s: float,
+        sensors: Dict[str, Any],
+        output: Dict[str, Any],
+        actuator_last: Optional[Dict[str, Any]] = None,
+        config_version: Optional[int] = None,
+    ) -> None:
+        # records carry the runner's tick ts (same time base, no extra clock read)
+        metrics = dict(output["derived_metrics"])
+        metrics["u_control"] = output["u_control"]
+        metrics["P_budget"] = output["P_budget"]
+        self.log("metrics", {"tick": tick, "config_version": config_version, "metrics": metrics}, ts)
+        state = output["state"]
+        if state != self._last_state:
+            self.log("guards", {"tick": tick, "config_version": config_version,
+                                "actions": {"mode": output["mode"], "allow_control": output["allow_control"]},
+                                "limits": {"P_budget": output["P_budget"]}, "state": state}, ts)
+            self._last_state = state
+
+    # --------------------------------------------------------
+    # Writer thread
+    # --------------------------------------------------------
+    def _normalize(self, x: Any) -> Any:
+        t = type(x)
+        if t is float:
+            if x != x or x in (math.inf, -math.inf):
+                return None
+            nd = self.cfg.float_precision
+            return x if nd is None else round(x, nd)
+        if t is dict or isinstance(x, dict):
+            strip = self.cfg.strip_fields
+            return {str(k): self._normalize(v) for k, v in x.items() if k not in strip}
+        if t is list or t is tuple:
+            return [self._normalize(v) for v in x]
+        if x is None or t is str or t is int or t is bool:
+            return x
+        if isinstance(x, float):  # numpy floats
+            return self._normalize(float(x))
+        if isinstance(x, int):
+            return int(x)
+        return str(x)
+
+    def _fmt_ts(self, ts: float) -> Any:
+        return utc_iso(ts) if self.cfg.timestamp == "utc_iso8601" else ts
+
+    def _encode_batch(self, batch: List[Tuple[str, float, Dict[str, Any]]]) -> Dict[str, List[str]]:
+        enc = json.JSONEncoder(
+            sort_keys=self.cfg.sort_keys, ensure_ascii=self.cfg.ensure_ascii, separators=(",", ":"),
+        ).encode
+        lines: Dict[str, List[str]] = {}
+        for channel, ts, record in batch:
+            rec = self._normalize(record)
+            rec.setdefault("ts", self._fmt_ts(ts))
+            rec.setdefault("run_id", self.run_id)
+            missing = [k for k in self._required.get(channel, ()) if k not in rec]
+            if missing:
+                self.invalid += 1
+                if "errors" not in self._files:
+                    continue
+                rec = {"ts": rec["ts"], "run_id": self.run_id, "error": "schema", "module": "logger",
+                       "ctx": {"channel": channel, "missing": missing}}
+                channel = "errors"
+            lines.setdefault(channel, []).append(enc(rec))
+        return lines
+
+    def _run_writer(self) -> None:
+        try:
+            self._identity = {
+                "git": _git_info(Path(__file__).resolve().parent, self.cfg.git_fields),
+                "host": _host_info(self.cfg.host_fields),
+            }
+        except Exception:
+            self._identity = {"git": {}, "host": {}}
+        q = self._q
+        done = False
+        while not done:
+            batch = []
+            item = q.get()
+            while True:
+                if item is None:
+                    done = True
+                    break
+                batch.append(item)
+                try:
+                    item = q.get_nowait()
+                except queue.Empty:
+                    break
+            if not batch:
+                continue
+            try:
+                if self._error is None:
+                    for channel, lines in self._encode_batch(batch).items():
+                        lines.append("")
+                        self._files[channel].append("\n".join(lines).encode("utf-8"), len(lines) - 1)
+            except BaseException as e:  # surfaced by close()
+                self._error = e
+            finally:
+                self._written += len(batch)
+
+    # --------------------------------------------------------
+    # Shutdown
+    # --------------------------------------------------------
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "queued": self._queued,
+            "written": self._written,
+            "dropped": self.dropped,
+            "invalid": self.invalid,
+            "channels": {name: {"records": ch.records, "bytes": ch.bytes} for name, ch in self._files.items()},
+        }
+
+    def _manifest(self, end_ts: float) -> Dict[str, Any]:
+        cfg = self.config
+        files = list(getattr(cfg, "files", None) or [])
+        hashes = dict(getattr(cfg, "file_hashes", None) or {}) if self.cfg.include_config_hashes else {}
+        values: Dict[str, Any] = {
+            "run_id": self.run_id,
+            "start_ts": utc_iso(self.start_ts),
+            "end_ts": utc_iso(end_ts),
+            "config_files": files,
+            "config_hashes": hashes,
+            "git": self._identity.get("git", {}),
+            "host": self._identity.get("host", {}),
+            "notes": self.notes,
+        }
+        out = {k: values[k] for k in self.cfg.manifest_include if k in values}
+        out["channels"] = self.stats()["channels"]
+        out["dropped"] = self.dropped
+        return out
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._q.put(None)
+        self._writer.join()
+        digests: Dict[str, str] = {}
+        for ch in self._files.values():
+            ch.f.close()
+            digests[ch.path.name] = ch.sha.hexdigest()
+        if self._error is not None:
+            raise RuntimeError("run log writer failed") from self._error
+
+        if self.cfg.manifest:
+            import yaml
+
+            text = yaml.safe_dump(self._manifest(self.clock()), sort_keys=False, allow_unicode=False)
+            data = text.encode("utf-8")
+            (self.run_dir / self.cfg.manifest_file).write_bytes(data)
+            digests[self.cfg.manifest_file] = hashlib.sha256(data).hexdigest()
+        if self.cfg.integrity:
+            lines = [f"{digests[name]}  {name}\n" for name in self.cfg.hash_files if name in digests]
+            (self.run_dir / self.cfg.checksum_file).write_text("".join(lines), encoding="utf-8")
+        if self.cfg.signature:
+            body = "".join(f"# {n}\n" for n in self.cfg.signature_notes)
+            (self.run_dir / self.cfg.signature_file).write_text(
+                f"# unsigned: detached signature of {self.cfg.checksum_file}\n{body}", encoding="utf-8")
+
+    def __enter__(self) -> "RunLogger":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+# ------------------------------------------------------------
+# Console logger
+# ------------------------------------------------------------
 @dataclass
 class Logger:
     name: str = "amnion"
+    # When set, events go to this run's events channel instead of stdout
+    run: Optional[RunLogger] = field(default=None, repr=False)
+    # Timestamp source for stdout events (a Clock or a seconds callable; default time.time)
+    clock: Union[Clock, Callable[[], float], None] = field(default=None, repr=False)
 
     def _emit(
         self,
@@ -18,8 +505,16 @@ class Logger:
         data: Optional[Dict[str, Any]] = None,
         ts: float = 0.0,
     ) -> None:
+        if self.run is not None:
+            run_ts = ts if ts != 0.0 else None
+            if data is None:
+                self.run.event(event, level, run_ts, module=self.name)
+            else:
+                self.run.event(event, level, run_ts, module=self.name, ctx=data)
+            return
+
         if ts == 0.0:
-            ts = time.time()
+            ts = time_source(self.clock)()
 
         payload: Dict[str, Any] = {
             "ts": ts,
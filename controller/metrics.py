@@ -2,7 +2,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Optional, Tuple
+
+from controller.metrics_history import HistoryRing, HistoryView
+from controller.rolling_stats import RollingStats
 
 
 def _to_float(x: Any) -> Optional[float]:
@@ -14,10 +17,52 @@ def _to_float(x: Any) -> Optional[float]:
         return None
 
 
+_NAN = float("nan")
+
+
+def _num(x: Any) -> float:
+    # float column encoding: None / unparseable -> NaN (decoded back to None)
+    v = _to_float(x)
+    return _NAN if v is None else v
+
+
+# Canonical metrics aggregated over rolling windows (configs/03_metrics.yaml)
+ROLLING_METRICS: Tuple[str, ...] = (
+    "power_mismatch",
+    "power_mismatch_abs",
+    "phase_mismatch",
+    "coherence_drop",
+)
+
+
 @dataclass
 class MetricsConfig:
+    """
+    rolling_windows_s: window lengths in seconds; empty (or no positive window) disables rolling stats.
+    time_source: "ticks" (tick / tick_hz, deterministic) or "ts" (sensor timestamp).
+    """
+
     enabled: bool = True
     max_history: int = 512
+    rolling_windows_s: Tuple[float, ...] = ()
+    tick_hz: float = 50.0
+    coherence_min: float = 0.73
+    time_source: str = "ticks"
+
+    @classmethod
+    def from_config(cls, data: Dict[str, Any], **overrides: Any) -> "MetricsConfig":
+        """Build from a merged config (03_metrics.yaml + 00_system.yaml limits)."""
+        metrics = data.get("metrics") or {}
+        windows = ((metrics.get("aggregations") or {}).get("rolling_windows") or {}).get("options_seconds") or ()
+        drop = ((metrics.get("canonical_metrics") or {}).get("coherence_drop") or {}).get("parameters") or {}
+        limits = data.get("limits") or {}
+        kw: Dict[str, Any] = {
+            "rolling_windows_s": tuple(float(w) for w in windows),
+            "coherence_min": float(drop.get("c_min", cls.coherence_min)),
+            "tick_hz": float(limits.get("update_rate_hz", cls.tick_hz)),
+        }
+        kw.update(overrides)
+        return cls(**kw)
 
 
 @dataclass
@@ -28,6 +73,14 @@ class Metrics:
     Compatibility:
       - update(sensors, safety_state, output)
       - on_tick(sensors, safety_state, output)  # alias
+      - history / get_history(n) / last still yield summary dicts
+
+    History is a preallocated columnar ring (controller/metrics_history.py):
+    O(1) appends, BYTES_PER_TICK bytes per retained tick, zero-copy column views.
+
+    With cfg.rolling_windows_s set, ROLLING_METRICS are also aggregated over
+    every window in O(1) amortized per tick (controller/rolling_stats.py) and
+    reported under snapshot()["rolling"].
     """
 
     cfg: MetricsConfig = field(default_factory=MetricsConfig)
@@ -35,8 +88,27 @@ class Metrics:
 
     ticks: int = 0
     violations: int = 0
-    last: Dict[str, Any] = field(default_factory=dict)
-    history: List[Dict[str, Any]] = field(default_factory=list)
+    # Optional controller.stage_timing.StageTimer (set by AmnionController.instrument())
+    stages: Any = field(default=None, repr=False)
+    _ring: HistoryRing = field(init=False, repr=False)
+    _rolling: Optional[RollingStats] = field(init=False, repr=False, default=None)
+
+    def __post_init__(self) -> None:
+        # Accept plain dicts (e.g. Metrics(cfg={})) as well as MetricsConfig
+        if isinstance(self.cfg, dict):
+            self.cfg = MetricsConfig(**self.cfg)
+        self._ring = HistoryRing(self.cfg.max_history)
+        rolling = RollingStats(ROLLING_METRICS, self.cfg.rolling_windows_s)
+        if rolling.windows_s:
+            self._rolling = rolling
+
+    @property
+    def last(self) -> Dict[str, Any]:
+        return self._ring.last()
+
+    @property
+    def history(self) -> HistoryView:
+        return self._ring.view()
 
     def update(
         self,
@@ -71,31 +143,39 @@ class Metrics:
         power_in = sensors.get("power_in", sensors.get("P_in"))
         power_draw = sensors.get("power_draw", sensors.get("P_draw"))
 
-        summary = {
-            "tick": self.ticks,
-            "ok": bool(ok),
-            "violations_total": self.violations,
-            "state": safety_state.get("state"),
-            "allow_control": safety_state.get("allow_control"),
-            "coherence": _to_float(coherence) if coherence is not None else coherence,
-            "phase": _to_float(phase) if phase is not None else phase,
-            "power_in": _to_float(power_in) if power_in is not None else power_in,
-            "power_draw": _to_float(power_draw) if power_draw is not None else power_draw,
-            "mismatch_power": safety_state.get("mismatch_power"),
-            "mismatch_phase": safety_state.get("mismatch_phase"),
-            "flags": list(safety_state.get("flags", [])) if safety_state.get("flags") is not None else [],
-            "u_cmd": output.get("u_cmd"),
-            "G": output.get("G"),
-            "K": output.get("K"),
-            "D": output.get("D"),
-            "P_budget": output.get("P_budget"),
-        }
-
-        self.last = summary
-        self.history.append(summary)
-
-        if len(self.history) > self.cfg.max_history:
-            self.history = self.history[-self.cfg.max_history :]
+        state = safety_state.get("state")
+        try:
+            hash(state)
+        except TypeError:
+            state = str(state)
+        allow = safety_state.get("allow_control")
+        flags = safety_state.get("flags")
+
+        self._ring.append(
+            (
+                self.ticks,
+                bool(ok),
+                self.violations,
+                -1 if allow is None else (1 if allow else 0),
+                _num(coherence),
+                _num(phase),
+                _num(power_in),
+                _num(power_draw),
+                _num(safety_state.get("mismatch_power")),
+                _num(safety_state.get("mismatch_phase")),
+                _num(output.get("u_cmd")),
+                _num(output.get("G")),
+                _num(output.get("K")),
+                _num(output.get("D")),
+                _num(output.get("P_budget")),
+            ),
+            state,
+            flags if flags is not None else (),
+            output.get("config_version") or 0,
+        )
+
+        if self._rolling is not None:
+            self._push_rolling(sensors, safety_state, coherence, power_in, power_draw)
 
         if self.log:
             try:
@@ -103,6 +183,39 @@ class Metrics:
             except Exception:
                 pass
 
+    def _push_rolling(
+        self,
+        sensors: Dict[str, Any],
+        safety_state: Dict[str, Any],
+        coherence: Any,
+        power_in: Any,
+        power_draw: Any,
+    ) -> None:
+        cfg = self.cfg
+        if cfg.time_source == "ts":
+            t = _num(sensors.get("ts"))
+            if t != t:
+                return
+        else:
+            t = self.ticks / cfg.tick_hz
+
+        p_in = _num(power_in)
+        p_draw = _num(power_draw)
+        pm = p_draw - p_in
+        if pm != pm:
+            pm = _num(safety_state.get("mismatch_power"))
+        c = _num(coherence if coherence is not None else sensors.get("Q"))
+        drop = cfg.coherence_min - c
+        self._rolling.push(
+            t,
+            (
+                pm,
+                abs(pm),
+                abs(_num(safety_state.get("mismatch_phase"))),
+                drop if drop > 0.0 or drop != drop else 0.0,
+            ),
+        )
+
     # Alias for older controller code (so nothing breaks)
     def on_tick(
         self,
@@ -113,17 +226,18 @@ class Metrics:
         self.update(sensors, safety_state, output)
 
     def snapshot(self) -> Dict[str, Any]:
-        return {
+        snap = {
             "enabled": self.cfg.enabled,
             "ticks": self.ticks,
             "violations": self.violations,
             "last": self.last,
         }
-
-    def get_history(self, n: Optional[int] = None) -> List[Dict[str, Any]]:
-        if n is None:
-            return list(self.history)
-        n = max(0, int(n))
-        if n == 0:
-            return []
-        return self.history[-n:]
+        if self._rolling is not None:
+            snap["rolling"] = self._rolling.snapshot()
+        if self.stages is not None:
+            snap["stages"] = self.stages.snapshot()
+        return snap
+
+    def get_history(self, n: Optional[int] = None) -> HistoryView:
+        """Newest n summaries (all if None), oldest first; zero-copy view."""
+        return self._ring.view(n)
@@ -0,0 +1,238 @@
+# controller/metrics_history.py
+# Fixed-memory columnar history for Metrics (preallocated NumPy ring buffer).
+# NumPy is imported when the first ring is allocated, not at module import.
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, Hashable, Iterator, List, Optional, Sequence, Tuple, Union
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+# Numeric summary fields, stored as float64 (None -> NaN -> None)
+FLOAT_FIELDS: Tuple[str, ...] = (
+    "coherence",
+    "phase",
+    "power_in",
+    "power_draw",
+    "mismatch_power",
+    "mismatch_phase",
+    "u_cmd",
+    "G",
+    "K",
+    "D",
+    "P_budget",
+)
+
+# Row layout (HISTORY_DTYPE). state / flags are codes into interned value
+# tables; allow_control is -1 (None) / 0 / 1; config_version is the controller
+# config version the tick ran with.
+HISTORY_FIELDS: Tuple[Tuple[str, str], ...] = (
+    ("tick", "<i8"),
+    ("ok", "?"),
+    ("violations_total", "<i8"),
+    ("state", "<u4"),
+    ("allow_control", "i1"),
+    *((name, "<f8") for name in FLOAT_FIELDS),
+    ("flags", "<u4"),
+    ("config_version", "<u4"),
+)
+
+_HISTORY_DTYPE: Optional[np.dtype] = None
+
+
+def history_dtype() -> np.dtype:
+    global _HISTORY_DTYPE
+    if _HISTORY_DTYPE is None:
+        import numpy as np
+
+        _HISTORY_DTYPE = np.dtype(list(HISTORY_FIELDS))
+    return _HISTORY_DTYPE
+
+
+def __getattr__(name: str) -> Any:
+    # HISTORY_DTYPE / BYTES_PER_TICK (memory per retained tick, excluding the
+    # shared state / flag-set tables) without importing NumPy at module import
+    if name == "HISTORY_DTYPE":
+        return history_dtype()
+    if name == "BYTES_PER_TICK":
+        return history_dtype().itemsize
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class _Interner:
+    """Value <-> uint32 code table (append-only, shared by all rows)."""
+
+    def __init__(self) -> None:
+        self.codes: Dict[Hashable, int] = {}
+        self.values: List[Any] = []
+
+    def code(self, value: Hashable) -> int:
+        c = self.codes.get(value)
+        if c is None:
+            c = len(self.values)
+            self.codes[value] = c
+            self.values.append(value)
+        return c
+
+
+class HistoryRing:
+    """
+    Preallocated ring of HISTORY_DTYPE rows.
+
+    append() writes one row in place: O(1), no allocation for numeric fields
+    (flag sets are interned as tuples). Reads return HistoryView objects over
+    at most two zero-copy segments of the ring. The buffer is allocated on the
+    first append or read.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = max(1, int(capacity))
+        self._buf: Optional[np.ndarray] = None
+        self._head = 0  # next write index
+        self._count = 0
+        self._states = _Interner()
+        self._flags = _Interner()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _alloc(self) -> np.ndarray:
+        import numpy as np
+
+        self._buf = np.zeros(self.capacity, dtype=history_dtype())
+        return self._buf
+
+    def append(self, row: Tuple[Any, ...], state: Any, flags: Sequence[str], config_version: int = 0) -> None:
+        """row: (tick, ok, violations_total, allow_control, *FLOAT_FIELDS)."""
+        tick, ok, violations_total, allow_control = row[:4]
+        buf = self._buf
+        if buf is None:
+            buf = self._alloc()
+        buf[self._head] = (
+            tick,
+            ok,
+            violations_total,
+            self._states.code(state),
+            allow_control,
+            *row[4:],
+            self._flags.code(tuple(flags)),
+            config_version,
+        )
+        self._head += 1
+        if self._head == self.capacity:
+            self._head = 0
+        if self._count < self.capacity:
+            self._count += 1
+
+    def clear(self) -> None:
+        self._head = 0
+        self._count = 0
+
+    def view(self, n: Optional[int] = None) -> "HistoryView":
+        """Newest n rows (all retained rows if n is None), oldest first."""
+        n = self._count if n is None else max(0, min(int(n), self._count))
+        buf = self._buf
+        if buf is None:
+            buf = self._alloc()
+        start = self._head - n
+        if start >= 0:
+            segs: Tuple[np.ndarray, ...] = (buf[start : self._head],)
+        else:
+            segs = (buf[start + self.capacity :], buf[: self._head])
+        return HistoryView(segs, self._states.values, self._flags.values)
+
+    def last(self) -> Dict[str, Any]:
+        if self._count == 0:
+            return {}
+        return _decode(self._buf[self._head - 1], self._states.values, self._flags.values)
+
+
+def _opt(x: float) -> Optional[float]:
+    return None if x != x else x
+
+
+def _decode(rec: Any, states: List[Any], flagsets: List[Tuple[str, ...]]) -> Dict[str, Any]:
+    ac = int(rec["allow_control"])
+    out: Dict[str, Any] = {
+        "tick": int(rec["tick"]),
+        "ok": bool(rec["ok"]),
+        "violations_total": int(rec["violations_total"]),
+        "state": states[int(rec["state"])],
+        "allow_control": None if ac < 0 else bool(ac),
+    }
+    for name in FLOAT_FIELDS[:6]:
+        out[name] = _opt(float(rec[name]))
+    out["flags"] = list(flagsets[int(rec["flags"])])
+    for name in FLOAT_FIELDS[6:]:
+        out[name] = _opt(float(rec[name]))
+    out["config_version"] = int(rec["config_version"])
+    return out
+
+
+class HistoryView(Sequence):
+    """
+    Read-only window over the ring (zero-copy).
+
+    Compatibility: behaves like the old List[Dict] history (len, indexing,
+    iteration yield summary dicts). Columnar access: column(name) / segments().
+    Views alias the ring: rows are overwritten once the ring wraps past them.
+    """
+
+    def __init__(self, segments: Tuple[np.ndarray, ...], states: List[Any], flagsets: List[Tuple[str, ...]]):
+        self._segs = segments
+        self._states = states
+        self._flagsets = flagsets
+        self._len = sum(len(s) for s in segments)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def _rec(self, i: int) -> Any:
+        if i < 0:
+            i += self._len
+        if not 0 <= i < self._len:
+            raise IndexError("history index out of range")
+        for seg in self._segs:
+            if i < len(seg):
+                return seg[i]
+            i -= len(seg)
+        raise IndexError("history index out of range")
+
+    def __getitem__(self, i: Union[int, slice]) -> Any:
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self._len))]
+        return _decode(self._rec(i), self._states, self._flagsets)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for seg in self._segs:
+            for rec in seg:
+                yield _decode(rec, self._states, self._flagsets)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (list, HistoryView)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def segments(self) -> Tuple[np.ndarray, ...]:
+        """One or two zero-copy structured views, oldest first."""
+        return self._segs
+
+    def column(self, name: str) -> np.ndarray:
+        """Field as an array; zero-copy unless the window wraps the ring end."""
+        if len(self._segs) == 1:
+            return self._segs[0][name]
+        import numpy as np
+
+        return np.concatenate([s[name] for s in self._segs])
+
+    @property
+    def state_table(self) -> List[Any]:
+        """Decode table for column('state')."""
+        return self._states
+
+    @property
+    def flag_table(self) -> List[Tuple[str, ...]]:
+        """Decode table for column('flags')."""
+        return self._flagsets
@@ -2,10 +2,15 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 import math
 
-import numpy as np
+if TYPE_CHECKING:
+    import numpy as np
+
+# NumPy is imported by the functions that need it, not at module import: the
+# controller imports this module on every start, and frames without phase data
+# never touch an array (see _no_phase_frame).
 
 
 @dataclass(frozen=True)
@@ -23,24 +28,32 @@ class ResonanceFrame:
 
 
 def _safe_array(x: Any) -> np.ndarray:
+    import numpy as np
+
     if x is None:
         return np.zeros((0,), dtype=float)
     arr = np.asarray(x, dtype=float).reshape(-1)
     return arr
 
 
-def _kuramoto_r_order(phases: np.ndarray) -> float:
-    if phases.size == 0:
-        return 0.0
-    z = np.mean(np.exp(1j * phases))
-    return float(np.clip(np.abs(z), 0.0, 1.0))
+def _wrap(x: Any) -> Any:
+    # angle wrap to [-pi, pi)
+    return (x + math.pi) % (2.0 * math.pi) - math.pi
 
 
-def _phase_mean(phases: np.ndarray) -> float:
-    if phases.size == 0:
-        return 0.0
-    z = np.mean(np.exp(1j * phases))
-    return float(np.angle(z))
+def _clip(x: float, lo: float, hi: float) -> float:
+    # scalar np.clip without the ufunc overhead (NaN passes through)
+    return float(min(max(x, lo), hi))
+
+
+def _observables(z: complex, noise: float) -> Tuple[float, float, float]:
+    # (r_order, phase_mean, coherence_score) from the mean phasor + noise proxy
+    import numpy as np
+
+    r = _clip(np.abs(z), 0.0, 1.0)
+    mu = math.atan2(z.imag, z.real)
+    coherence_score = _clip(0.7 * r + 0.3 * (1.0 - noise / math.pi), 0.0, 1.0)
+    return r, mu, coherence_score
 
 
 def from_sensors(sensors: Dict[str, Any], *, phases_key: str = "phase_samples") -> ResonanceFrame:
@@ -50,6 +63,10 @@ def from_sensors(sensors: Dict[str, Any], *, phases_key: str = "phase_samples")
       - OR sensors["signal"] = array-like raw waveform (will be embedded deterministically)
     """
     sensors = sensors or {}
+    if sensors.get(phases_key) is None and sensors.get("signal") is None:
+        return _no_phase_frame()
+
+    import numpy as np
 
     phases = _safe_array(sensors.get(phases_key))
     if phases.size == 0:
@@ -60,19 +77,22 @@ def from_sensors(sensors: Dict[str, Any], *, phases_key: str = "phase_samples")
             # deterministic sign-phase embedding (cheap)
             phases = np.where(sig0 >= 0.0, 0.0, math.pi).astype(float)
 
-    r = _kuramoto_r_order(phases)
-    mu = _phase_mean(phases)
-
-    # deterministic noise proxy: dispersion around mean phase
+    # single complex pass: unit phasors feed r_order, phase_mean and the noise proxy
     if phases.size == 0:
+        z = 0j
         phase_noise = 1.0
     else:
-        # circular distance
-        d = np.angle(np.exp(1j * (phases - mu)))
-        phase_noise = float(np.clip(np.std(d), 0.0, math.pi))
+        e = np.exp(1j * phases)
+        z = np.mean(e)
+        # deterministic noise proxy: dispersion of the circular distance to the mean
+        # phase; rotating the phasors by -mu avoids a second exp() pass
+        rot = np.exp(-1j * np.angle(z))
+        e *= rot
+        d = np.angle(e)
+        phase_noise = _clip(np.std(d), 0.0, math.pi)
 
     # coherence_score: map r_order and noise into 0..1 deterministically
-    coherence_score = float(np.clip(0.7 * r + 0.3 * (1.0 - phase_noise / math.pi), 0.0, 1.0))
+    r, mu, coherence_score = _observables(z, phase_noise)
 
     # q_factor proxy: keep it explicit (docs map this)
     q_factor = float(coherence_score)
@@ -85,4 +105,158 @@ def from_sensors(sensors: Dict[str, Any], *, phases_key: str = "phase_samples")
         phase_noise=phase_noise,
         q_factor=q_factor,
     )
-  
+
+
+_NO_PHASE_FRAME: Optional[ResonanceFrame] = None
+
+
+def _no_phase_frame() -> ResonanceFrame:
+    """
+    from_sensors() of a frame without phase_samples / signal: constant, so it is
+    computed once and shared (its empty state_vector is read-only).
+    """
+    global _NO_PHASE_FRAME
+    if _NO_PHASE_FRAME is None:
+        frame = from_sensors({"signal": ()})
+        frame.state_vector.flags.writeable = False
+        _NO_PHASE_FRAME = frame
+    return _NO_PHASE_FRAME
+
+
+class ResonanceStream:
+    """
+    Streaming from_sensors() over a sliding window of the newest `window` phase samples.
+
+    push(samples) costs O(len(samples)): running sums of the unit phasors give
+    r_order / phase_mean, running sum and sum-of-squares of the phase offset from
+    a reference angle give phase_noise (std is shift-invariant). The reference is
+    re-based to the current mean phase when it drifts more than `rebase_rad`, and
+    all sums are recomputed from the window after every `window` evictions to bound
+    floating-point drift (both amortized O(1) per sample for a slowly moving mean).
+
+    frame() matches from_sensors({"phase_samples": <window>}) to rounding while the
+    window lies within pi - rebase_rad of its mean phase; for widely spread phases
+    the noise proxy is measured from the reference instead of the exact mean.
+    Non-finite samples are dropped (they would poison the running sums).
+    """
+
+    def __init__(self, window: int, *, rebase_rad: float = math.pi / 4):
+        self.window = int(window)
+        if self.window <= 0:
+            raise ValueError("window must be positive")
+        import numpy as np
+
+        self.rebase_rad = float(rebase_rad)
+        w = self.window
+        # phases are written twice (p and p + window) so the window is always one contiguous view
+        self._theta = np.zeros(2 * w, dtype=float)
+        # per-sample terms of the running sums: rows cos, sin, x (offset from _ref), x^2
+        self._terms = np.zeros((4, w), dtype=float)
+        self._sums = np.zeros(4, dtype=float)
+        self.reset()
+
+    def reset(self) -> None:
+        self._head = 0  # next write position
+        self._n = 0
+        self._ref = 0.0
+        self._evicted = 0
+        self._sums[:] = 0.0
+
+    def __len__(self) -> int:
+        return self._n
+
+    def _ranges(self, start: int, m: int) -> Tuple[Tuple[int, int, int], ...]:
+        # ring positions start..start+m-1 as at most two (ring_lo, ring_hi, offset) slices
+        w = self.window
+        start %= w
+        first = min(m, w - start)
+        if first == m:
+            return ((start, start + m, 0),)
+        return ((start, w, 0), (0, m - first, first))
+
+    def push(self, samples: Any) -> None:
+        import numpy as np
+
+        arr = _safe_array(samples)
+        if arr.size and not np.isfinite(arr).all():
+            arr = arr[np.isfinite(arr)]
+        m = arr.size
+        if m == 0:
+            return
+        w = self.window
+        if m >= w:
+            arr = arr[-w:]
+            m = w
+            self.reset()
+
+        terms = self._terms
+        n_evict = max(0, self._n + m - w)
+        if n_evict:
+            for lo, hi, _ in self._ranges(self._head + m - n_evict, n_evict):
+                self._sums -= terms[:, lo:hi].sum(axis=1)
+
+        new = np.empty((4, m), dtype=float)
+        np.cos(arr, out=new[0])
+        np.sin(arr, out=new[1])
+        np.subtract(arr, self._ref, out=new[2])
+        new[2] = _wrap(new[2])
+        np.multiply(new[2], new[2], out=new[3])
+        self._sums += new.sum(axis=1)
+        for lo, hi, off in self._ranges(self._head, m):
+            terms[:, lo:hi] = new[:, off : off + hi - lo]
+            self._theta[lo:hi] = arr[off : off + hi - lo]
+            self._theta[lo + w : hi + w] = arr[off : off + hi - lo]
+
+        self._n = min(w, self._n + m)
+        self._head = (self._head + m) % w
+        self._evicted += n_evict
+
+        sc, ss = self._sums[0], self._sums[1]
+        mu = math.atan2(ss, sc)
+        if self._evicted >= w or abs(_wrap(mu - self._ref)) > self.rebase_rad:
+            self._renormalize(mu)
+
+    def _renormalize(self, ref: float) -> None:
+        # re-base the noise reference and recompute every sum from the window
+        self._ref = ref
+        terms = self._terms
+        self._sums[:] = 0.0
+        for lo, hi, _ in self._ranges(self._head - self._n, self._n):
+            x = _wrap(self._theta[lo:hi] - ref)
+            terms[2, lo:hi] = x
+            terms[3, lo:hi] = x * x
+            self._sums += terms[:, lo:hi].sum(axis=1)  # pairwise summation
+        self._evicted = 0
+
+    def samples(self) -> np.ndarray:
+        """Window contents, oldest first (zero-copy view; overwritten by later pushes)."""
+        start = (self._head - self._n) % self.window
+        return self._theta[start : start + self._n]
+
+    def frame(self) -> ResonanceFrame:
+        n = self._n
+        if n == 0:
+            z = 0j
+            phase_noise = 1.0
+        else:
+            sc, ss, sx, sxx = self._sums.tolist()
+            z = complex(sc / n, ss / n)
+            mean_x = sx / n
+            var = max(0.0, sxx / n - mean_x * mean_x)
+            phase_noise = _clip(math.sqrt(var), 0.0, math.pi)
+        r, mu, coherence_score = _observables(z, phase_noise)
+        view = self.samples()
+        view.flags.writeable = False
+        return ResonanceFrame(
+            state_vector=view,
+            phase_mean=mu,
+            r_order=r,
+            coherence_score=coherence_score,
+            phase_noise=phase_noise,
+            q_factor=float(coherence_score),
+        )
+
+    def update(self, sensors: Optional[Dict[str, Any]], *, phases_key: str = "phase_samples") -> ResonanceFrame:
+        """Push the new samples in sensors[phases_key] and return the current frame."""
+        self.push((sensors or {}).get(phases_key))
+        return self.frame()
@@ -0,0 +1,151 @@
+# controller/rolling_stats.py
+# Streaming rolling-window statistics for the windows in configs/03_metrics.yaml.
+# O(1) amortized per sample per window: running (shifted) sums for mean/variance,
+# monotonic deques for min/max. Never recomputes from raw history except for the
+# periodic re-normalization, which is amortized over the window length.
+
+from __future__ import annotations
+
+import math
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
+
+
+# Minimum evictions between re-normalizations (also scaled by window size)
+RENORM_MIN = 1024
+
+
+class _Window:
+    __slots__ = ("span", "start", "n", "k", "s1", "s2", "minq", "maxq", "evicted")
+
+    def __init__(self, span: float, start: int):
+        self.span = float(span)
+        self.start = start  # absolute index of the oldest sample in the window
+        self.n = 0
+        self.k = 0.0  # shift (reference value) for the running sums
+        self.s1 = 0.0  # sum(x - k)
+        self.s2 = 0.0  # sum((x - k)^2)
+        self.minq: Deque[int] = deque()
+        self.maxq: Deque[int] = deque()
+        self.evicted = 0
+
+
+class _Series:
+    """One metric: shared sample storage + one _Window per configured span."""
+
+    __slots__ = ("t", "x", "base", "windows")
+
+    def __init__(self, spans: Sequence[float]):
+        self.t: List[float] = []
+        self.x: List[float] = []
+        self.base = 0  # absolute index of t[0] / x[0]
+        self.windows = [_Window(s, 0) for s in spans]
+
+    def push(self, t: float, x: float) -> None:
+        ts, xs = self.t, self.x
+        base = self.base
+        idx = base + len(xs)
+        ts.append(t)
+        xs.append(x)
+
+        for w in self.windows:
+            if w.n == 0:
+                w.k = x
+            d = x - w.k
+            w.s1 += d
+            w.s2 += d * d
+            w.n += 1
+
+            q = w.minq
+            while q and xs[q[-1] - base] >= x:
+                q.pop()
+            q.append(idx)
+            q = w.maxq
+            while q and xs[q[-1] - base] <= x:
+                q.pop()
+            q.append(idx)
+
+            # evict samples that fell out of (t - span, t]
+            lim = t - w.span
+            start = w.start
+            while ts[start - base] <= lim:
+                d = xs[start - base] - w.k
+                w.s1 -= d
+                w.s2 -= d * d
+                w.n -= 1
+                start += 1
+                w.evicted += 1
+            if start != w.start:
+                w.start = start
+                while w.minq[0] < start:
+                    w.minq.popleft()
+                while w.maxq[0] < start:
+                    w.maxq.popleft()
+                if w.evicted >= RENORM_MIN and w.evicted >= w.n:
+                    self._renormalize(w)
+
+        # drop samples no window can see any more (amortized)
+        oldest = min(w.start for w in self.windows) - base
+        if oldest > RENORM_MIN and oldest * 2 > len(xs):
+            del ts[:oldest]
+            del xs[:oldest]
+            self.base = base + oldest
+
+    def _renormalize(self, w: _Window) -> None:
+        lo = w.start - self.base
+        vals = self.x[lo:]
+        k = math.fsum(vals) / len(vals)
+        w.k = k
+        w.s1 = math.fsum(v - k for v in vals)
+        w.s2 = math.fsum((v - k) * (v - k) for v in vals)
+        w.evicted = 0
+
+    def stats(self, w: _Window) -> Dict[str, Any]:
+        n = w.n
+        if n == 0:
+            return {"n": 0, "mean": None, "var": None, "rms": None, "min": None, "max": None}
+        mean_d = w.s1 / n
+        var = max(0.0, w.s2 / n - mean_d * mean_d)
+        mean = w.k + mean_d
+        return {
+            "n": n,
+            "mean": mean,
+            "var": var,
+            "rms": math.sqrt(mean * mean + var),
+            "min": self.x[w.minq[0] - self.base],
+            "max": self.x[w.maxq[0] - self.base],
+        }
+
+
+class RollingStats:
+    """
+    Rolling mean / variance / rms / min / max for several metrics over several
+    time windows at once.
+
+    push(t, values) takes one sample per metric (in `names` order) at time t
+    (seconds, non-decreasing). None / NaN samples are rejected per
+    `nan_policy: reject_sample` in configs/03_metrics.yaml.
+    """
+
+    def __init__(self, names: Sequence[str], windows_s: Sequence[float]):
+        self.names: Tuple[str, ...] = tuple(names)
+        self.windows_s: Tuple[float, ...] = tuple(float(w) for w in windows_s if float(w) > 0)
+        self._series = [_Series(self.windows_s) for _ in self.names]
+
+    def push(self, t: float, values: Sequence[Optional[float]]) -> None:
+        if not self.windows_s:
+            return
+        for series, x in zip(self._series, values):
+            if x is None or x != x:
+                continue
+            series.push(t, x)
+
+    def snapshot(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        out: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for name, series in zip(self.names, self._series):
+            out[name] = {_label(w.span): series.stats(w) for w in series.windows}
+        return out
+
+
+def _label(span: float) -> str:
+    return f"{span:g}s"
@@ -12,7 +12,7 @@ def clamp(x: float, lo: float, hi: float) -> float:
     return max(lo, min(hi, x))
 
 
-@dataclass
+@dataclass(frozen=True)
 class RuntimeConfig:
     # Control output bounds
     u_min: float = 0.0
@@ -28,6 +28,18 @@ class RuntimeConfig:
     # Safety fallback
     fail_safe_u: float = 0.0
 
+    @classmethod
+    def from_config(cls, data: Dict[str, Any], **overrides: Any) -> "RuntimeConfig":
+        """Build from field overrides under controller.runtime; raises ConfigError on bad values."""
+        from controller.config_loader import ConfigError, dataclass_overrides
+
+        kw = dataclass_overrides(cls, (data.get("controller") or {}).get("runtime"), "controller.runtime")
+        kw.update(overrides)
+        cfg = cls(**kw)
+        if not cfg.u_min <= cfg.u_nominal <= cfg.u_max or not cfg.u_min <= cfg.fail_safe_u <= cfg.u_max:
+            raise ConfigError("controller.runtime: need u_min <= u_nominal, fail_safe_u <= u_max")
+        return cfg
+
 
 @dataclass
 class Runtime:
@@ -5,8 +5,18 @@
 
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Tuple
+
+if TYPE_CHECKING:
+    from controller.clock import Clock
+    from controller.guard_engine import GuardEngine
+
+# Canonical escalation order (module-level: not rebuilt per tick)
+STATE_ORDER: Dict[str, int] = {"S0_NORMAL": 0, "S1_THROTTLE": 1, "S2_BARRIER": 2, "S3_SAFE_HALT": 3}
 
 
 def _to_float(x: Any) -> Optional[float]:
@@ -34,7 +44,7 @@ def _to_bool(x: Any) -> Optional[bool]:
     return bool(x)
 
 
-@dataclass
+@dataclass(frozen=True)
 class SafetyConfig:
     # Canonical power limits (concept-level)
     P_max: float = 1.0
@@ -61,13 +71,86 @@ class SafetyConfig:
     lawx_isolate_to: str = "S2_BARRIER"    # ISOLATE -> BARRIER
     lawx_degrade_to: str = "S3_SAFE_HALT"  # DEGRADE -> SAFE_HALT (жёстко и правильно)
 
+    # Sensor frame age limit (ms) for frames carrying "sensor_age_ms" (background
+    # acquisition / held frames); older frames are invalid. None disables.
+    # configs/02_safety.yaml: safety.sensor_rules.timeout_ms
+    sensor_timeout_ms: Optional[float] = None
+
     # Monotonic behavior: once escalated, do not de-escalate automatically within same tick
     monotonic: bool = True
 
+    @classmethod
+    def from_config(cls, data: Dict[str, Any], **overrides: Any) -> "SafetyConfig":
+        """
+        Build from a merged config: safety.sensor_rules.timeout_ms plus field
+        overrides under controller.safety_gate. Raises ConfigError on bad values.
+        """
+        from controller.config_loader import ConfigError, dataclass_overrides
+
+        kw: Dict[str, Any] = {}
+        rules = (data.get("safety") or {}).get("sensor_rules") or {}
+        if "timeout_ms" in rules:
+            kw["sensor_timeout_ms"] = rules["timeout_ms"]
+        kw.update((data.get("controller") or {}).get("safety_gate") or {})
+        kw = dataclass_overrides(cls, kw, "controller.safety_gate")
+        kw.update(overrides)
+        cfg = cls(**kw)
+        if cfg.rate_limit > cfg.rate_trip:
+            raise ConfigError("controller.safety_gate: rate_limit must not exceed rate_trip")
+        for name in ("lawx_throttle_to", "lawx_isolate_to", "lawx_degrade_to"):
+            if getattr(cfg, name) not in STATE_ORDER:
+                raise ConfigError(f"controller.safety_gate.{name}: unknown state {getattr(cfg, name)!r}")
+        return cfg
+
+
+# Patch templates (read-only; copy with dict() before mutating)
+PATCH_NONE: Mapping[str, Any] = MappingProxyType({"mode": "NONE"})
+PATCH_SAFE_HALT: Mapping[str, Any] = MappingProxyType({
+    "mode": "SAFE_HALT",
+    "D": "HIGH",
+    "P_budget": 0.0,
+    "freeze_fast_adaptation": True,
+})
+
+_LIMIT_FIELDS = (
+    "P_max", "P_budget_min", "P_budget_soft", "Q_crit", "phase_trip",
+    "rate_trip", "rate_limit", "f_ref_nominal", "f_tol", "integrity_min",
+)
+
+
+@lru_cache(maxsize=32)
+def _templates(cfg: SafetyConfig) -> Tuple[Mapping[str, Mapping[str, Any]], Mapping[str, Any]]:
+    """(patch by state, limits) for one SafetyConfig; equal configs share them."""
+    patches = {
+        "S0_NORMAL": PATCH_NONE,
+        "S1_THROTTLE": MappingProxyType({
+            "mode": "THROTTLE",
+            "G_scale": 0.5,
+            "K_scale": 0.5,
+            "D_boost": 2.0,
+            "P_budget": cfg.P_budget_soft,
+        }),
+        "S2_BARRIER": MappingProxyType({
+            "mode": "BARRIER",
+            "D": "HIGH",
+            "P_budget": cfg.P_budget_min,
+            "freeze_fast_adaptation": True,
+        }),
+        "S3_SAFE_HALT": PATCH_SAFE_HALT,
+    }
+    limits = MappingProxyType({name: getattr(cfg, name) for name in _LIMIT_FIELDS})
+    return MappingProxyType(patches), limits
+
 
 @dataclass
 class SafetyGate:
     cfg: SafetyConfig = field(default_factory=SafetyConfig)
+    # Optional compiled configs/02_safety.yaml rules (controller.guard_engine); stateful across ticks
+    guards: Optional["GuardEngine"] = None
+    # Time base for guard dwell (safe_hold_seconds etc.); None = the frame's "ts"
+    clock: Optional["Clock"] = None
+    # _templates(cfg), re-fetched only when cfg is swapped (hot reload)
+    _tpl: Any = field(default=None, init=False, repr=False, compare=False)
 
     def sanitize_inputs(self, sensors: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -115,8 +198,8 @@ class SafetyGate:
             "allow_control": bool,
             "state": "S0_NORMAL"|"S1_THROTTLE"|"S2_BARRIER"|"S3_SAFE_HALT",
             "flags": [...],
-            "limits": {...},
-            "patch": {...},
+            "limits": {...},   # read-only (shared per SafetyConfig)
+            "patch": {...},    # read-only template; dict(patch) to modify
             "mismatch_power": float|None,
             "mismatch_phase": float|None,
           }
@@ -159,10 +242,20 @@ class SafetyGate:
             sensors_invalid = True
             flags.append("sensor_invalid:flag")
 
+        # Stale frame: older than the configured sensor timeout
+        if self.cfg.sensor_timeout_ms is not None:
+            sensor_age_ms = _to_float(sensors.get("sensor_age_ms"))
+            if sensor_age_ms is not None and sensor_age_ms > self.cfg.sensor_timeout_ms:
+                sensors_invalid = True
+                flags.append("sensor_invalid:stale")
+
         # Missing Q is invalid (deterministic conservative stance)
         if Q is None:
             sensors_invalid = True
             flags.append("sensor_invalid:missing_Q")
+        elif not math.isfinite(Q):
+            sensors_invalid = True
+            flags.append("sensor_invalid:nonfinite_Q")
 
         # Power partial is uncertainty (not invalid)
         if (P_in is None) != (P_draw is None):
@@ -186,8 +279,7 @@ class SafetyGate:
 
         def _escalate(new_state: str) -> None:
             nonlocal state
-            order = {"S0_NORMAL": 0, "S1_THROTTLE": 1, "S2_BARRIER": 2, "S3_SAFE_HALT": 3}
-            if order.get(new_state, 0) > order.get(state, 0):
+            if STATE_ORDER.get(new_state, 0) > STATE_ORDER.get(state, 0):
                 state = new_state
 
         # 0) Emergency stop -> SAFE_HALT
@@ -275,48 +367,24 @@ class SafetyGate:
                     flags.append("abraxas:state_integrity_low")
                     _escalate("S2_BARRIER")
 
+        # 8) Compiled config guards (optional)
+        if self.guards is not None:
+            now = self.clock.time() if self.clock is not None else _to_float(sensors.get("ts")) or 0.0
+            g = self.guards.step(self.guards.observe(sensors), now=now)
+            if g > 0:
+                flags.append(f"guard:{self.guards.name}")
+                _escalate(self.guards.canonical)
+
         # Determine allow_control
         if state in ("S2_BARRIER", "S3_SAFE_HALT"):
             allow_control = False
 
-        # --- Patch construction (what Runtime will apply) ---
-        patch: Dict[str, Any] = {"mode": "NONE"}
-
-        if state == "S3_SAFE_HALT":
-            patch = {
-                "mode": "SAFE_HALT",
-                "D": "HIGH",
-                "P_budget": 0.0,
-                "freeze_fast_adaptation": True,
-            }
-        elif state == "S2_BARRIER":
-            patch = {
-                "mode": "BARRIER",
-                "D": "HIGH",
-                "P_budget": self.cfg.P_budget_min,
-                "freeze_fast_adaptation": True,
-            }
-        elif state == "S1_THROTTLE":
-            patch = {
-                "mode": "THROTTLE",
-                "G_scale": 0.5,
-                "K_scale": 0.5,
-                "D_boost": 2.0,
-                "P_budget": self.cfg.P_budget_soft,
-            }
-
-        limits = {
-            "P_max": self.cfg.P_max,
-            "P_budget_min": self.cfg.P_budget_min,
-            "P_budget_soft": self.cfg.P_budget_soft,
-            "Q_crit": self.cfg.Q_crit,
-            "phase_trip": self.cfg.phase_trip,
-            "rate_trip": self.cfg.rate_trip,
-            "rate_limit": self.cfg.rate_limit,
-            "f_ref_nominal": self.cfg.f_ref_nominal,
-            "f_tol": self.cfg.f_tol,
-            "integrity_min": self.cfg.integrity_min,
-        }
+        # --- Patch (what Runtime will apply) / limits: shared read-only templates ---
+        tpl = self._tpl
+        if tpl is None or tpl[0] is not self.cfg:
+            tpl = self._tpl = (self.cfg, *_templates(self.cfg))
+        _, patches, limits = tpl
+        patch = patches.get(state, PATCH_NONE)
 
         ok = allow_control and state == "S0_NORMAL"
 
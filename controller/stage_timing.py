@@ -0,0 +1,166 @@
+# controller/stage_timing.py
+# Hot-path instrumentation for AmnionController.step(): per-stage wall time in
+# fixed-memory log-bucketed histograms plus swallowed-exception counts.
+
+from __future__ import annotations
+
+import json
+import math
+import sys
+from typing import Any, Dict, List, Optional, Sequence, TextIO, Tuple
+
+
+# step() stages, in pipeline order
+STAGES: Tuple[str, ...] = (
+    "sanitize",
+    "resonance",
+    "lawx",
+    "abraxas",
+    "typed_views",
+    "safety",
+    "runtime",
+    "metrics",
+)
+STAGE_INDEX = {name: i for i, name in enumerate(STAGES)}
+
+# Log-linear buckets (HDR-style): values < 2*SUB ns are exact, above that every
+# power of two is split into SUB buckets (relative bucket width <= 1/SUB).
+SUB_BITS = 3
+SUB = 1 << SUB_BITS
+MAX_NS = (1 << 40) - 1  # ~18 min; larger samples are clamped
+N_BUCKETS = (MAX_NS.bit_length() - SUB_BITS - 1) * SUB + 2 * SUB
+
+
+def bucket_index(ns: int) -> int:
+    if ns < 2 * SUB:
+        return ns if ns > 0 else 0
+    if ns > MAX_NS:
+        ns = MAX_NS
+    shift = ns.bit_length() - SUB_BITS - 1
+    return shift * SUB + (ns >> shift)
+
+
+def bucket_bounds(idx: int) -> Tuple[int, int]:
+    """[lo, hi) in ns covered by bucket idx."""
+    if idx < 2 * SUB:
+        return idx, idx + 1
+    shift = idx // SUB - 1
+    lo = (idx - shift * SUB) << shift
+    return lo, lo + (1 << shift)
+
+
+class StageTimer:
+    """
+    Per-stage latency histograms (N_BUCKETS counters per stage, allocated once)
+    and counters of exceptions swallowed by the stage's try/except.
+
+    record(stamps) takes the perf_counter_ns() stamps taken around the stages
+    (len(STAGES) + 1 values) once per tick and only queues them; every
+    FLUSH_TICKS ticks (and on any read) the queue is binned in one vectorized
+    pass, so the per-tick cost is a list append and memory stays bounded.
+    """
+
+    FLUSH_TICKS = 1024
+
+    def __init__(self, stages: Sequence[str] = STAGES):
+        self.stages: Tuple[str, ...] = tuple(stages)
+        import numpy as np
+
+        n = len(self.stages)
+        self.hist = np.zeros((n, N_BUCKETS), dtype=np.int64)
+        self.errors: List[int] = [0] * n
+        self.total_ns = np.zeros(n, dtype=np.int64)
+        self.max_ns = np.zeros(n, dtype=np.int64)
+        self.ticks = 0
+        self._pending: List[Sequence[int]] = []
+
+    def reset(self) -> None:
+        self._pending.clear()
+        self.hist[:] = 0
+        self.errors = [0] * len(self.stages)
+        self.total_ns[:] = 0
+        self.max_ns[:] = 0
+        self.ticks = 0
+
+    def record(self, stamps: Sequence[int]) -> None:
+        pending = self._pending
+        pending.append(stamps)
+        if len(pending) >= self.FLUSH_TICKS:
+            self.flush()
+
+    def flush(self) -> None:
+        """Bin the queued ticks into the histograms."""
+        pending = self._pending
+        if not pending:
+            return
+        import numpy as np
+
+        ns = np.diff(np.asarray(pending, dtype=np.int64), axis=1)
+        pending.clear()
+        np.clip(ns, 0, MAX_NS, out=ns)
+        self.ticks += ns.shape[0]
+        self.total_ns += ns.sum(axis=0)
+        np.maximum(self.max_ns, ns.max(axis=0), out=self.max_ns)
+
+        # bucket_index(), vectorized; frexp exponent == bit_length for ns < 2**53
+        bits = np.frexp(ns.astype(np.float64))[1].astype(np.int64)
+        shift = np.maximum(bits - SUB_BITS - 1, 0)
+        idx = np.where(ns < 2 * SUB, ns, shift * SUB + (ns >> shift))
+        n_stages = ns.shape[1]
+        flat = (idx + np.arange(n_stages, dtype=np.int64) * N_BUCKETS).ravel()
+        self.hist += np.bincount(flat, minlength=n_stages * N_BUCKETS).reshape(n_stages, N_BUCKETS)
+
+    def error(self, stage: int) -> None:
+        self.errors[stage] += 1
+
+    def percentile_ns(self, stage: int, q: float) -> Optional[float]:
+        """Approximate q-th percentile (0..100): midpoint of the bucket holding it."""
+        import numpy as np
+
+        self.flush()
+        cum = np.cumsum(self.hist[stage])
+        count = int(cum[-1])
+        if count == 0:
+            return None
+        rank = max(1.0, math.ceil(count * q / 100.0))
+        lo, hi = bucket_bounds(int(np.searchsorted(cum, rank)))
+        return (lo + hi - 1) / 2.0
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        self.flush()
+        out: Dict[str, Dict[str, Any]] = {}
+        for i, name in enumerate(self.stages):
+            count = int(self.hist[i].sum())
+            row: Dict[str, Any] = {"count": count, "errors": self.errors[i]}
+            if count:
+                row["mean_us"] = int(self.total_ns[i]) / count / 1e3
+                for label, q in (("p50_us", 50.0), ("p99_us", 99.0), ("p999_us", 99.9)):
+                    row[label] = self.percentile_ns(i, q) / 1e3
+                row["max_us"] = int(self.max_ns[i]) / 1e3
+            out[name] = row
+        return out
+
+    def format(self) -> str:
+        snap = self.snapshot()
+        grand = int(self.total_ns.sum()) or 1
+        lines = [f"{'stage':<12} {'count':>9} {'errors':>7} {'mean us':>9} {'p50 us':>9} {'p99 us':>9} {'p999 us':>9} {'share':>6}"]
+        for i, name in enumerate(self.stages):
+            r = snap[name]
+            if not r["count"]:
+                lines.append(f"{name:<12} {0:>9} {r['errors']:>7}")
+                continue
+            lines.append(
+                f"{name:<12} {r['count']:>9} {r['errors']:>7} {r['mean_us']:>9.2f} {r['p50_us']:>9.2f} "
+                f"{r['p99_us']:>9.2f} {r['p999_us']:>9.2f} {int(self.total_ns[i]) / grand * 100:>5.1f}%"
+            )
+        return "\n".join(lines)
+
+    def dump(self, fp: Optional[TextIO] = None, *, fmt: str = "text") -> None:
+        """Write the stage report to fp (default stdout): fmt "text" table or "json"."""
+        fp = fp or sys.stdout
+        if fmt == "json":
+            stages = self.snapshot()
+            json.dump({"ticks": self.ticks, "stages": stages}, fp, indent=2)
+            fp.write("\n")
+        else:
+            fp.write(self.format() + "\n")
@@ -0,0 +1,124 @@
+# controller/tick_context.py
+# Per-tick pipeline state for AmnionController.step().
+# One TickContext per controller, overwritten in place every tick; dict-based
+# consumers (Metrics, custom hooks) read it through the lazy TickView mapping.
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import Any, Dict, Iterator, Mapping, Optional
+
+
+class TickContext:
+    """
+    Typed per-tick state; every stage writes its result into a slot.
+
+    sensors:      the dict returned by SafetyGate.sanitize_inputs() (owned by the
+                  tick), enriched in place by the resonance / LawX / ABRAXAS stages
+    resonance:    ResonanceFrame (or None if the stage failed)
+    lawx:         LawXResult (or None)
+    abraxas:      AbraxasDiag (or None)
+    sensor_frame: SensorFrame typed view
+    derived:      DerivedMetrics
+    safety:       raw SafetyGate.evaluate() dict
+    safety_state: SafetyState
+    output:       ControlOutput
+    config_version: AmnionController.config_version the tick ran with
+
+    The object is reused across ticks: hold on to a value, not to the context.
+    """
+
+    __slots__ = (
+        "sensors",
+        "resonance",
+        "lawx",
+        "abraxas",
+        "sensor_frame",
+        "derived",
+        "safety",
+        "safety_state",
+        "output",
+        "config_version",
+        "view",
+    )
+
+    def __init__(self) -> None:
+        self.view = TickView(self)
+        self.clear()
+
+    def clear(self) -> None:
+        self.sensors: Dict[str, Any] = {}
+        self.resonance: Any = None
+        self.lawx: Any = None
+        self.abraxas: Any = None
+        self.sensor_frame: Any = None
+        self.derived: Any = None
+        self.safety: Optional[Dict[str, Any]] = None
+        self.safety_state: Any = None
+        self.output: Any = None
+        self.config_version = 0
+
+    def copy(self) -> "TickContext":
+        """Shallow copy (slot values shared) that later ticks do not overwrite."""
+        other = TickContext()
+        for name in self.__slots__:
+            if name != "view":
+                setattr(other, name, getattr(self, name))
+        return other
+
+
+class TickView(Mapping):
+    """
+    Read-only mapping equivalent to the legacy metrics payload
+        {**sensors, "sensor_frame": asdict(sensor_frame), "derived_metrics": asdict(derived)}
+    built lazily: nothing is copied unless a virtual key is read. Always reflects
+    the context's current tick; use dict(view) to keep a snapshot.
+    """
+
+    __slots__ = ("_ctx",)
+
+    _VIRTUAL = ("sensor_frame", "derived_metrics")
+
+    def __init__(self, ctx: TickContext):
+        self._ctx = ctx
+
+    def _virtual(self, key: str) -> Any:
+        ctx = self._ctx
+        obj = ctx.sensor_frame if key == "sensor_frame" else ctx.derived
+        return None if obj is None else asdict(obj)
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._VIRTUAL:
+            return self._virtual(key)
+        return self._ctx.sensors[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self._VIRTUAL:
+            return self._virtual(key)
+        return self._ctx.sensors.get(key, default)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._VIRTUAL or key in self._ctx.sensors
+
+    def __iter__(self) -> Iterator[str]:
+        sensors = self._ctx.sensors
+        for k in sensors:
+            yield k
+        for k in self._VIRTUAL:
+            if k not in sensors:
+                yield k
+
+    def __bool__(self) -> bool:
+        return True  # the virtual keys are always present
+
+    def __len__(self) -> int:
+        sensors = self._ctx.sensors
+        return len(sensors) + sum(1 for k in self._VIRTUAL if k not in sensors)
+
+    def __repr__(self) -> str:
+        return f"TickView({dict(self)!r})"
+
+    def detach(self) -> "TickView":
+        """View of a copy of the current tick (stays valid after the next step())."""
+        return self._ctx.copy().view
+
@@ -0,0 +1,14 @@
+import os
+import shutil
+import tempfile
+
+from controller.config_loader import CACHE_ENV
+
+# Tests never read or write the developer's config cache (~/.cache/amnion-oracle):
+# load_config() / validate caches go to a per-session temp dir (subprocesses inherit it).
+_CACHE_DIR = tempfile.mkdtemp(prefix="amnion_test_cache_")
+os.environ[CACHE_ENV] = _CACHE_DIR
+
+
+def pytest_unconfigure(config):
+    shutil.rmtree(_CACHE_DIR, ignore_errors=True)
@@ -0,0 +1,68 @@
+import unittest
+
+import numpy as np
+
+from controller.amnion_controller import AmnionController
+from controller.batch import BatchInputError, SensorColumns
+from controller.io.sensor_stub import SensorStub
+from controller.safety_gate import SafetyConfig, SafetyGate
+
+
+def _random_columns(n: int, seed: int) -> dict:
+    rng = np.random.default_rng(seed)
+
+    def holes(x, p=0.1):
+        x = np.asarray(x, dtype=float)
+        x[rng.random(n) < p] = np.nan
+        return x
+
+    return {
+        "P_in": holes(rng.uniform(0.0, 1.5, n)),
+        "power_draw": holes(rng.uniform(0.0, 1.5, n)),
+        "Q": holes(rng.uniform(-0.2, 1.2, n), 0.2),
+        "q_factor": holes(rng.uniform(0.0, 1.0, n), 0.5),
+        "phase_error": holes(rng.normal(0.0, 0.5, n), 0.3),
+        "phase_noise": holes(rng.uniform(0.0, 0.3, n), 0.5),
+        "rate_change": holes(rng.normal(0.0, 0.8, n)),
+        "f_ref": holes(rng.normal(76.4, 0.4, n)),
+        "loop_closure": holes(rng.integers(0, 2, n), 0.1),
+        "state_integrity": holes(rng.uniform(0.6, 1.0, n)),
+        "sensor_valid": rng.random(n) > 0.05,
+        "emergency_stop": rng.random(n) < 0.02,
+        "sensor_age_ms": holes(rng.uniform(0.0, 800.0, n), 0.3),
+    }
+
+
+def _controller(**safety) -> AmnionController:
+    return AmnionController(safety=SafetyGate(SafetyConfig(**safety)))
+
+
+class TestStepBatch(unittest.TestCase):
+    def _assert_matches_step(self, columns: dict, **safety) -> None:
+        cols = SensorColumns.from_mapping(columns)
+        res = _controller(**safety).step_batch(cols, chunk_size=97)
+        ref = _controller(**safety)
+        for i, frame in enumerate(cols.iter_frames()):
+            # repr() distinguishes -0.0 / 0.0 and None / NaN: bit-identical check
+            self.assertEqual(repr(res.row(i)), repr(ref.step(frame)), msg=f"frame {i}: {frame}")
+
+    def test_random_frames_match_step(self):
+        self._assert_matches_step(_random_columns(3000, seed=7))
+
+    def test_sensor_timeout_matches_step(self):
+        self._assert_matches_step(_random_columns(1000, seed=8), sensor_timeout_ms=500.0)
+
+    def test_sensor_stub_frames_match_step(self):
+        stub = SensorStub()
+        frames = [stub.read() for _ in range(500)]
+        keys = [k for k in frames[0] if k != "ts"]
+        columns = {k: np.array([f[k] for f in frames]) for k in keys}
+        self._assert_matches_step(columns)
+
+    def test_rejects_vector_keys(self):
+        with self.assertRaises(BatchInputError):
+            SensorColumns.from_mapping({"phase_samples": np.zeros(4)})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+import unittest
+
+from controller.benchmark import compare, machine_mismatch, representative_frames, run_suite
+
+
+class TestBenchmarkSuite(unittest.TestCase):
+    def test_suite_reports_every_stage(self):
+        report = run_suite(300, repeat=1, phase_windows=(0, 64))
+        names = set(report["results"])
+        for name in ("step", "sanitize_inputs", "from_sensors[0]", "from_sensors[64]", "LawXAdapter.process",
+                     "AbraxasModule.evaluate", "SafetyGate.evaluate", "Runtime.compute", "Metrics.update"):
+            self.assertIn(name, names)
+        r = report["results"]["step"]
+        self.assertEqual(r["n"], 300)
+        self.assertLessEqual(r["p50_us"], r["p99_us"])
+        self.assertLessEqual(r["p99_us"], r["p999_us"])
+        self.assertGreater(r["ticks_per_s"], 0)
+
+    def test_sample_inputs_are_mixed_in(self):
+        frames = representative_frames(200)
+        self.assertIn("coherence", frames[99])
+        self.assertIn("Q", frames[0])
+
+    def test_compare_gates(self):
+        base = {"results": {"step": {"p50_us": 10.0, "p99_us": 20.0}, "gone": {"p50_us": 1.0}}}
+        cur = {"results": {"step": {"p50_us": 12.0, "p99_us": 30.0}, "new": {"p50_us": 5.0}}}
+        regs = compare(cur, base, threshold=0.25)
+        self.assertEqual([(r.case, r.metric) for r in regs], [("step", "p99")])
+        self.assertEqual(compare(cur, base, threshold=0.6), [])
+        self.assertEqual(len(compare(cur, base, threshold=0.1, gates=("p50",))), 1)
+        self.assertEqual(compare(cur, base, threshold=0.1, min_delta_us=20.0), [])
+
+    def test_machine_mismatch(self):
+        meta = {"python": "3.11.7", "numpy": "2.4.6", "platform": "Linux-x", "cpu_count": 8, "ticks": 100}
+        self.assertEqual(machine_mismatch({"meta": meta}, {"meta": {**meta, "ticks": 5}}), [])
+        self.assertEqual(machine_mismatch({"meta": meta}, {"meta": {**meta, "cpu_count": 1}}), ["cpu_count: 1 -> 8"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+
+from controller.clock import Clock, RealClock, VirtualClock
+from controller.config_loader import load_config
+from controller.guard_engine import GuardEngine, compile_guards
+from controller.io.fleet_runner import make_fleet, run_fleet
+from controller.io.realtime_runner import MISS_SENSOR_TIMEOUT, RealtimeConfig, RealtimeRunner
+from controller.io.sensor_stub import SensorStub
+from controller.io.simulation_runner import run_simulation
+from controller.safety_gate import SafetyGate
+
+
+class _FailingSensor:
+    """Sync sensor that raises from read `fail_at` on."""
+
+    def __init__(self, clock, fail_at):
+        self.stub = SensorStub(clock=clock)
+        self.fail_at = fail_at
+        self.reads = 0
+
+    def read(self):
+        self.reads += 1
+        if self.reads > self.fail_at:
+            raise OSError("bus error")
+        return self.stub.read()
+
+
+class TestClock(unittest.TestCase):
+    def test_virtual_clock(self):
+        c = VirtualClock(dt=0.02, start=10.0)
+        self.assertEqual((c.time(), c.monotonic_ns()), (10.0, 0))
+        c.advance(3)
+        c.sleep(0.5)
+        c.sleep(-1.0)
+        self.assertEqual(c.monotonic_ns(), 560_000_000)
+        self.assertEqual(c.times(3).tolist(), [10.56, 10.58, 10.6])
+        self.assertEqual(VirtualClock.from_config(load_config().data).dt, 0.02)
+        with self.assertRaises(ValueError):
+            VirtualClock(dt=0.0)
+
+    def test_incomplete_clock_fails_at_construction(self):
+        class NoSleep(Clock):
+            def time(self):
+                return 0.0
+
+            def monotonic_ns(self):
+                return 0
+
+        with self.assertRaises(TypeError):
+            NoSleep()
+        with self.assertRaises(TypeError):
+            Clock()
+
+    def test_real_clock_is_monotonic(self):
+        c = RealClock()
+        stamps = [c.time() for _ in range(1000)]
+        self.assertEqual(stamps, sorted(stamps))
+
+    def test_sensor_stub_batch_ts_per_tick(self):
+        c = VirtualClock(dt=0.5)
+        stub = SensorStub(clock=c)
+        self.assertEqual(stub.read_batch(0, 3)["ts"].tolist(), [0.0, 0.5, 1.0])
+        c.advance()
+        self.assertEqual(stub.read()["ts"], 0.5)
+
+    def test_simulation_log_is_reproducible(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = [os.path.join(tmp, f"{i}.jsonl") for i in range(2)]
+            for p in paths:
+                run_simulation(ticks=200, out_path=p, sleep_s=1.0, clock=VirtualClock(dt=0.02))
+            with open(paths[0], "rb") as a, open(paths[1], "rb") as b:
+                data = a.read()
+                self.assertEqual(data, b.read())
+            events = [json.loads(line) for line in data.decode("utf-8").splitlines()]
+            # sleep_s moves simulated time only: 0.02 s tick + 1 s sleep
+            self.assertEqual([e["dt_from_start_s"] for e in events[:3]], [0.0, 1.02, 2.04])
+            self.assertEqual(events[2]["sensors"]["ts"], 2.04)
+
+    def test_fleet_virtual_capsules_match_single_process(self):
+        specs = make_fleet(2, 30, fleet_seed=3, dt=0.01)
+        with tempfile.TemporaryDirectory() as tmp:
+            res = run_fleet(specs, os.path.join(tmp, "fleet"), workers=1)
+            for spec, cap in zip(specs, res.capsules):
+                ref = os.path.join(tmp, f"ref_{spec.capsule_id}.jsonl")
+                run_simulation(ticks=spec.ticks, out_path=ref, base_freq=spec.base_freq,
+                               controller=spec.build_controller(), clock=VirtualClock(0.01))
+                with open(cap.path, "rb") as a, open(ref, "rb") as b:
+                    self.assertEqual(a.read(), b.read())
+
+    def test_guard_dwell_runs_in_simulated_time(self):
+        clock = VirtualClock(dt=0.02)
+        gate = SafetyGate(guards=GuardEngine(compile_guards(load_config().data)), clock=clock)
+        frame = {"P_in": 0.5, "P_draw": 0.5, "Q": 0.5}
+        gate.evaluate({**frame, "sensor_valid": False})
+        self.assertEqual(gate.guards.name, "SAFE_HOLD")
+        ticks = 0
+        while gate.guards.name == "SAFE_HOLD":
+            clock.advance()
+            ticks += 1
+            gate.evaluate(frame)  # no "ts": the gate's clock is the time base
+        self.assertEqual((gate.guards.name, ticks), ("SHUTDOWN", 1500))  # safe_hold_seconds >= 30 at 50 Hz
+
+    def test_realtime_sensor_timeout_in_simulated_time(self):
+        clock = VirtualClock(dt=0.02)
+        misses = []
+        runner = RealtimeRunner(sensor=_FailingSensor(clock, fail_at=10),
+                                cfg=RealtimeConfig(rate_hz=50, sensor_timeout_ms=500), clock=clock,
+                                on_miss=lambda tick, kind, v: misses.append((tick, kind, v)))
+        seen = []
+        step = runner.ctrl.step
+        runner.ctrl.step = lambda s: (seen.append(dict(s)), step(s))[1]
+        rep = asyncio.run(runner.run(100))
+
+        self.assertEqual((rep.ticks, rep.deadline_misses, rep.skipped), (100, 0, 0))
+        self.assertAlmostEqual(rep.wall_s, 1.98)  # simulated seconds
+        # last good frame at tick 9; held 25 ticks, then > 500 ms old
+        timeouts = [(t, v) for t, kind, v in misses if kind == MISS_SENSOR_TIMEOUT]
+        self.assertEqual(timeouts[0], (35, 520.0))
+        self.assertEqual(rep.sensor_timeouts, 65)
+        self.assertEqual([s["ts"] for s in (seen[0], seen[35])], [0.02, 0.72])
+        self.assertIs(seen[35]["sensor_valid"], False)
+
+
+if __name__ == "__main__":
+    unittest.main()
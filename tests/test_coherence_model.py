@@ -0,0 +1,46 @@
+import unittest
+
+import numpy as np
+
+from controller.coherence_model import KuramotoBatch, KuramotoModel
+
+
+class TestKuramotoBatch(unittest.TestCase):
+    def test_rows_match_repeated_step(self):
+        rng = np.random.default_rng(7)
+        phases = rng.uniform(0.0, 2.0 * np.pi, (6, 33))
+        k = rng.uniform(0.0, 1.0, 6)
+        zeta = rng.uniform(0.0, 0.1, 6)
+
+        batch = KuramotoBatch(phases, k_gain=k, zeta_damp=zeta)
+        traj = batch.integrate(50)
+        self.assertEqual(traj.r.shape, (50, 6))
+
+        for i in range(6):
+            model = KuramotoModel(k_gain=float(k[i]), zeta_damp=float(zeta[i]))
+            p = phases[i]
+            for j in range(50):
+                p = model.step(p)
+                z = np.mean(np.exp(1j * p))
+                self.assertEqual(traj.r[j, i], np.abs(z))
+                self.assertEqual(traj.psi[j, i], np.angle(z))
+            np.testing.assert_array_equal(batch.phases[i], p)
+
+    def test_step_in_place_with_scalar_gains(self):
+        phases = np.linspace(0.0, 3.0, 12).reshape(3, 4)
+        batch = KuramotoModel().batch(phases)
+        buf = batch.phases
+        batch.step()
+        self.assertIs(batch.phases, buf)
+        np.testing.assert_array_equal(buf[1], KuramotoModel().step(phases[1]))
+        np.testing.assert_array_equal(phases[0], np.linspace(0.0, 3.0, 12)[:4])  # input untouched
+
+    def test_rejects_1d_and_handles_empty(self):
+        with self.assertRaises(ValueError):
+            KuramotoBatch(np.zeros(4))
+        traj = KuramotoBatch(np.zeros((2, 0))).integrate(3)
+        self.assertEqual(traj.r.shape, (3, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
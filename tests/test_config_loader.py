@@ -0,0 +1,68 @@
+import hashlib
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from controller import config_loader
+from controller.config_loader import DEFAULT_CONFIG_DIR, DEFAULT_CONFIG_FILES, load_config
+
+
+class TestConfigCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp, True)
+        self.cfg_dir = self.tmp / "configs"
+        self.cache = self.tmp / "cache"
+        self.cfg_dir.mkdir()
+        for name in DEFAULT_CONFIG_FILES:
+            shutil.copy(DEFAULT_CONFIG_DIR / name, self.cfg_dir / name)
+
+    def load(self, **kw):
+        return load_config(config_dir=self.cfg_dir, cache_dir=self.cache, **kw)
+
+    def test_warm_load_matches_parse_and_reports_hashes(self):
+        cold = self.load()
+        warm = self.load()
+        self.assertFalse(cold.from_cache)
+        self.assertTrue(warm.from_cache)
+        self.assertEqual(warm.data, load_config(config_dir=self.cfg_dir, use_cache=False).data)
+        self.assertEqual(warm.files, list(DEFAULT_CONFIG_FILES))
+        for name in DEFAULT_CONFIG_FILES:
+            digest = hashlib.sha256((self.cfg_dir / name).read_bytes()).hexdigest()
+            self.assertEqual(warm.file_hashes[name], digest)
+        self.assertEqual(len(list(self.cache.glob("*.pickle"))), 1)
+
+        warm.data["limits"]["update_rate_hz"] = -1  # callers get their own copy
+        self.assertEqual(self.load().data["limits"]["update_rate_hz"], 50)
+
+    def test_edit_and_reorder_invalidate(self):
+        self.load()
+        path = self.cfg_dir / "00_system.yaml"
+        path.write_text(path.read_text(encoding="utf-8").replace("update_rate_hz: 50", "update_rate_hz: 200"),
+                        encoding="utf-8")
+        edited = self.load()
+        self.assertFalse(edited.from_cache)
+        self.assertEqual(edited.data["limits"]["update_rate_hz"], 200)
+        self.assertTrue(self.load().from_cache)
+
+        reordered = self.load(files=list(reversed(DEFAULT_CONFIG_FILES)))
+        self.assertFalse(reordered.from_cache)
+
+    def test_corrupt_entry_is_rebuilt_and_cache_can_be_disabled(self):
+        self.load()
+        (entry,) = self.cache.glob("*.pickle")
+        entry.write_bytes(b"\x80garbage")
+        self.assertFalse(self.load().from_cache)
+        self.assertTrue(self.load().from_cache)
+
+        with mock.patch.dict(os.environ, {config_loader.CACHE_ENV: "0"}):
+            self.assertIsNone(config_loader.default_cache_dir())
+            self.assertFalse(load_config(config_dir=self.cfg_dir).from_cache)
+        self.assertFalse(self.load(use_cache=False).from_cache)
+
+
+if __name__ == "__main__":
+    unittest.main()
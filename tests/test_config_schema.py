@@ -0,0 +1,98 @@
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from controller import config_schema
+from controller.config_loader import DEFAULT_CONFIG_DIR, ConfigError, load_config
+from controller.config_schema import SCHEMA_MAP, validate_configs
+
+
+class TestConfigSchema(unittest.TestCase):
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp, True)
+        self.cache = self.tmp / "cache"
+        self.configs = self.tmp / "configs"
+        shutil.copytree(DEFAULT_CONFIG_DIR, self.configs)
+        saved = dict(config_schema._VALIDATORS)
+        self.addCleanup(config_schema._VALIDATORS.update, saved)
+        config_schema._VALIDATORS.clear()
+
+    def test_validators_compiled_once_per_schema(self):
+        first = validate_configs(self.configs, use_cache=False, jobs=1)
+        compiled = dict(config_schema._VALIDATORS)
+        self.assertEqual(len(compiled), len(set(SCHEMA_MAP.values())))
+        second = validate_configs(self.configs, use_cache=False, jobs=1)
+        self.assertEqual(first, second)
+        self.assertEqual(config_schema._VALIDATORS.keys(), compiled.keys())
+        for key, v in compiled.items():
+            self.assertIs(config_schema._VALIDATORS[key], v)
+        self.assertEqual([r.config for r in first.results], list(SCHEMA_MAP))
+
+    def test_dialect_from_schema_keyword(self):
+        from jsonschema import Draft7Validator, Draft202012Validator
+
+        d7 = json.dumps({"$schema": "http://json-schema.org/draft-07/schema#", "type": "object"}).encode()
+        d2020 = json.dumps({"type": "object"}).encode()  # no $schema: 2020-12
+        self.assertIsInstance(config_schema.compiled_validator(d7), Draft7Validator)
+        self.assertIsInstance(config_schema.compiled_validator(d2020), Draft202012Validator)
+        with self.assertRaises(ConfigError):
+            config_schema.compiled_validator(json.dumps({"type": 5}).encode())
+
+    def test_unchanged_files_are_not_revalidated(self):
+        cold = validate_configs(self.configs, cache_dir=self.cache)
+        self.assertEqual(cold.cached, 0)
+        self.assertFalse(cold.ok)
+
+        with mock.patch.object(config_schema, "compiled_validator") as spy:
+            warm = validate_configs(self.configs, cache_dir=self.cache)
+        spy.assert_not_called()
+        self.assertEqual(warm.cached, len(SCHEMA_MAP))
+        self.assertEqual(warm.errors, cold.errors)
+
+        path = self.configs / "03_metrics.yaml"
+        path.write_text(path.read_text(encoding="utf-8") + "\nextra_key: 1\n", encoding="utf-8")
+        edited = validate_configs(self.configs, cache_dir=self.cache)
+        self.assertEqual([r.config for r in edited.results if not r.cached], ["03_metrics.yaml"])
+        self.assertTrue(any("'extra_key'" in e for e in edited.errors))
+
+    def test_threads_match_serial(self):
+        serial = validate_configs(self.configs, use_cache=False, jobs=1)
+        config_schema._VALIDATORS.clear()
+        threaded = validate_configs(self.configs, use_cache=False, jobs=4)
+        self.assertEqual(serial, threaded)
+
+    def test_missing_files_and_parse_errors(self):
+        (self.configs / "05_profile.yaml").unlink()
+        (self.configs / "04_logging.yaml").write_text("- not a mapping\n", encoding="utf-8")
+        schemas = self.tmp / "schemas"
+        shutil.copytree(config_schema.SCHEMAS_DIR, schemas)
+        (schemas / "safety.schema.json").unlink()
+        report = validate_configs(self.configs, schemas_dir=schemas, use_cache=False)
+        self.assertEqual(report.missing, ("05_profile.yaml",))
+        by_name = {r.config: r.errors for r in report.results}
+        self.assertEqual(by_name["02_safety.yaml"], ("02_safety.yaml: missing schema: safety.schema.json",))
+        self.assertIn("YAML root must be a mapping", by_name["04_logging.yaml"][0])
+
+    def test_load_config_modes(self):
+        reported = load_config(self.configs, cache_dir=self.cache)
+        expected = validate_configs(self.configs, use_cache=False).errors
+        self.assertEqual(list(reported.schema_errors), expected)
+
+        warm = load_config(self.configs, cache_dir=self.cache)  # config + result caches hit
+        self.assertTrue(warm.from_cache)
+        self.assertEqual(warm.schema_errors, reported.schema_errors)
+
+        self.assertEqual(load_config(self.configs, cache_dir=self.cache, validate="off").schema_errors, ())
+        with self.assertRaises(ConfigError) as ctx:
+            load_config(self.configs, cache_dir=self.cache, validate="strict")
+        self.assertIn("00_system.yaml", str(ctx.exception))
+        with self.assertRaises(ConfigError):
+            load_config(self.configs, use_cache=False, validate="sometimes")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from controller.amnion_controller import AmnionController
+from controller.config_loader import DEFAULT_CONFIG_DIR, DEFAULT_CONFIG_FILES, ConfigError
+from controller.config_watcher import ConfigWatcher
+from controller.io.event_sink import JsonlSink
+from controller.io.sensor_stub import SensorStub
+from controller.io.simulation_runner import run_simulation
+from controller.logger import Logger, RunLogger
+from controller.safety_gate import SafetyConfig
+
+_FRAME = dict(SensorStub().read(), Q=0.52)
+
+
+class TestConfigWatcher(unittest.TestCase):
+    def setUp(self):
+        tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, tmp, True)
+        self.cfg_dir = tmp / "configs"
+        self.cfg_dir.mkdir()
+        for name in DEFAULT_CONFIG_FILES:
+            shutil.copy(DEFAULT_CONFIG_DIR / name, self.cfg_dir / name)
+        self.safety = self.cfg_dir / "02_safety.yaml"
+        self.base = self.safety.read_text(encoding="utf-8")
+        self.cache = tmp / "cache"
+
+    def write(self, block: str) -> None:
+        text = self.base + "\ncontroller:\n" + block
+        self.safety.write_text(text, encoding="utf-8")
+        st = self.safety.stat()
+        os.utime(self.safety, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))  # coarse-mtime filesystems
+
+    def test_edit_swaps_between_ticks_and_stamps_version(self):
+        ctrl = AmnionController()
+        watcher = ConfigWatcher(ctrl, self.cfg_dir, cache_dir=self.cache)
+        first = watcher.load_initial()
+        self.assertEqual(first.version, 1)
+        self.assertEqual(first.safety.sensor_timeout_ms, 500)
+
+        out = ctrl.step(_FRAME)
+        self.assertEqual(out["state"], "S0_NORMAL")
+        self.assertEqual(ctrl.context.config_version, 1)
+
+        self.assertIsNone(watcher.poll())  # nothing moved
+        self.write("  safety_gate:\n    Q_crit: 0.55\n  runtime:\n    u_max: 0.8\n")
+        bundle = watcher.poll()
+        self.assertEqual(bundle.version, 2)
+        self.assertEqual(watcher.events[-1].changed, ("02_safety.yaml",))
+        # staged, not applied: the running tick's config is untouched until the next step()
+        self.assertEqual(ctrl.safety.cfg.Q_crit, SafetyConfig().Q_crit)
+        self.assertEqual(ctrl.config_version, 1)
+
+        out = ctrl.step(_FRAME)
+        self.assertEqual(ctrl.config_version, 2)
+        self.assertIs(ctrl.safety.cfg, bundle.safety)
+        self.assertIs(ctrl.runtime.cfg, bundle.runtime)
+        self.assertEqual(out["state"], "S2_BARRIER")  # Q 0.52 <= new Q_crit
+        self.assertNotIn("config_version", out)
+        self.assertEqual(ctrl.context.config_version, 2)
+        versions = [row["config_version"] for row in ctrl.metrics.get_history()]
+        self.assertEqual(versions, [1, 2])
+        self.assertEqual(ctrl.metrics.ticks, 2)  # metrics state carried across the swap
+
+    def test_invalid_edit_keeps_running_config(self):
+        ctrl = AmnionController()
+        watcher = ConfigWatcher(ctrl, self.cfg_dir, cache_dir=self.cache)
+        watcher.load_initial()
+        ctrl.step(_FRAME)
+        applied = ctrl.safety.cfg
+
+        for block in ("  safety_gate:\n    Q_crti: 0.55\n",
+                      "  safety_gate:\n    rate_limit: 2.0\n",
+                      "  runtime:\n    u_max: .nan\n"):
+            self.write(block)
+            self.assertIsNone(watcher.poll())
+            self.assertIsNotNone(watcher.events[-1].error)
+            self.assertEqual(watcher.events[-1].changed, ("02_safety.yaml",))
+            self.assertEqual(watcher.events[-1].version, 1)
+            ctrl.step(_FRAME)
+            self.assertIs(ctrl.safety.cfg, applied)
+            self.assertEqual(ctrl.config_version, 1)
+
+        self.safety.write_text(self.base + "\ncontroller: [\n", encoding="utf-8")
+        os.utime(self.safety, ns=(0, 1))
+        self.assertIsNone(watcher.poll())
+        self.assertIn("YAML", watcher.events[-1].error)
+
+    def test_reloads_and_version_stamps_reach_the_run_log(self):
+        ctrl = AmnionController()
+        run = RunLogger(root_dir=str(self.cache.parent / "runs"))
+        watcher = ConfigWatcher(ctrl, self.cfg_dir, cache_dir=self.cache, logger=Logger("watcher", run=run))
+        watcher.load_initial()
+        self.write("  safety_gate:\n    Q_crti: 0.55\n")
+        watcher.poll()
+        run_simulation(ticks=3, controller=ctrl, sink=JsonlSink(str(self.cache.parent / "v1.jsonl")))
+        self.write("  safety_gate:\n    Q_crit: 0.55\n")
+        watcher.poll()
+        run_simulation(ticks=3, controller=ctrl, sink=run)  # closes the run
+
+        def lines(path):
+            return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+        events = lines(run.run_dir / "events.jsonl")
+        self.assertEqual([(e["event"], e["severity"]) for e in events],
+                         [("config_reload", "INFO"), ("config_reload_rejected", "ERROR"), ("config_reload", "INFO")])
+        self.assertEqual(events[1]["ctx"]["changed"], ["02_safety.yaml"])
+        self.assertIn("Q_crti", events[1]["ctx"]["error"])
+        self.assertEqual(events[2]["ctx"]["version"], 2)
+        self.assertEqual([e["config_version"] for e in lines(self.cache.parent / "v1.jsonl")], [1, 1, 1])
+        self.assertEqual([m["config_version"] for m in lines(run.run_dir / "metrics.jsonl")], [2, 2, 2])
+        self.assertEqual(lines(run.run_dir / "guards.jsonl")[0]["config_version"], 2)
+
+    def test_touch_without_edit_does_not_reload(self):
+        ctrl = AmnionController()
+        watcher = ConfigWatcher(ctrl, self.cfg_dir, cache_dir=self.cache)
+        watcher.load_initial()
+        st = self.safety.stat()
+        os.utime(self.safety, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000))
+        self.assertIsNone(watcher.poll())
+        self.assertEqual(len(watcher.events), 1)
+        self.assertEqual(watcher.version, 1)
+
+    def test_from_config_validation(self):
+        with self.assertRaises(ConfigError):
+            SafetyConfig.from_config({"controller": {"safety_gate": {"lawx_isolate_to": "S9"}}})
+        with self.assertRaises(ConfigError):
+            SafetyConfig.from_config({"controller": {"safety_gate": {"monotonic": 1}}})
+        cfg = SafetyConfig.from_config({"safety": {"sensor_rules": {"timeout_ms": 250}}}, Q_crit=0.4)
+        self.assertEqual((cfg.sensor_timeout_ms, cfg.Q_crit), (250.0, 0.4))
+
+
+if __name__ == "__main__":
+    unittest.main()
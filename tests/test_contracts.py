@@ -0,0 +1,87 @@
+import dataclasses
+import math
+import pickle
+import unittest
+
+import numpy as np
+
+from controller.amnion_controller import AmnionController
+from controller.contracts import (
+    CONTROL_OUTPUT_DTYPE,
+    SENSOR_FRAME_DTYPE,
+    ContractArray,
+    ControlOutput,
+    DerivedMetrics,
+    FrozenSensorFrame,
+    SafetyState,
+    SensorFrame,
+    dtype_of,
+    freeze,
+    from_records,
+    to_records,
+)
+from controller.io.sensor_stub import SensorStub
+
+
+class TestContracts(unittest.TestCase):
+    def test_slotted_and_frozen_variants(self):
+        sf = SensorFrame(P_in=1.0)
+        self.assertFalse(hasattr(sf, "__dict__"))
+        with self.assertRaises(AttributeError):
+            sf.extra = 1.0
+        fz = freeze(sf)
+        self.assertIsInstance(fz, FrozenSensorFrame)
+        self.assertEqual(dataclasses.asdict(fz), dataclasses.asdict(sf))
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            fz.P_in = 2.0
+        self.assertIs(freeze(fz), fz)
+        self.assertEqual(pickle.loads(pickle.dumps(fz)), fz)
+        self.assertEqual(dtype_of(FrozenSensorFrame), SENSOR_FRAME_DTYPE)
+
+    def test_record_round_trip_from_step(self):
+        stub, ctrl = SensorStub(), AmnionController()
+        frames = {cls: [] for cls in (SensorFrame, DerivedMetrics, SafetyState, ControlOutput)}
+        for i in range(200):
+            s = stub.read()
+            if i % 7 == 0:
+                s.pop("P_in")  # mismatch_power -> None
+            ctrl.step(s)
+            ctx = ctrl.context
+            for cls, obj in zip(frames, (ctx.sensor_frame, ctx.derived, ctx.safety_state, ctx.output)):
+                frames[cls].append(obj)
+        for cls, items in frames.items():
+            rec = to_records(items)
+            self.assertEqual(rec.dtype.descr, dtype_of(cls).descr)
+            self.assertEqual(from_records(rec, cls).to_list(), items)
+            self.assertEqual([from_records(rec, cls)[i] for i in range(len(items))], items)
+        rec = to_records(frames[DerivedMetrics])
+        self.assertTrue(math.isnan(rec.mismatch_power[0]))
+        self.assertIsNone(from_records(rec, DerivedMetrics)[0].mismatch_power)
+
+    def test_slices_and_columns_are_views(self):
+        items = [SensorFrame(P_in=float(i), Q=None if i % 2 else 0.5) for i in range(10)]
+        arr = ContractArray.from_items(items)
+        part = arr[2:8:2]
+        self.assertIsInstance(part, ContractArray)
+        self.assertTrue(np.shares_memory(part.records, arr.records))
+        self.assertEqual(list(part), items[2:8:2])
+        col = arr.column("P_in")
+        self.assertTrue(np.shares_memory(col, arr.records))
+        col[0] = 42.0
+        self.assertEqual(arr[0].P_in, 42.0)
+        self.assertIs(to_records(arr), arr.records)
+
+    def test_codes_and_errors(self):
+        rec = to_records([ControlOutput(mode="LOCK"), ControlOutput()])
+        self.assertEqual(rec.dtype.itemsize, CONTROL_OUTPUT_DTYPE.itemsize)
+        self.assertEqual(rec.mode.tolist(), [3, 0])
+        with self.assertRaises(ValueError):
+            to_records([SafetyState(state="S9_UNKNOWN")])
+        with self.assertRaises(TypeError):
+            dtype_of(dict)
+        with self.assertRaises(TypeError):
+            from_records(rec, SensorFrame)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+import json
+import math
+import os
+import tempfile
+import unittest
+
+from controller.amnion_controller import AmnionController
+from controller.io.event_sink import (
+    DEFAULT_SENSOR_FIELDS,
+    BinarySink,
+    INT_ABSENT,
+    EventSchema,
+    JsonlSink,
+    binary_to_jsonl,
+    read_records,
+)
+from controller.io.fault_injection import FaultySensor, Garbage
+from controller.io.sensor_stub import SensorStub
+from controller.io.simulation_runner import run_simulation
+
+
+class TestEventSink(unittest.TestCase):
+    def test_binary_roundtrip_is_byte_identical_to_jsonl(self):
+        stub, ctrl = SensorStub(), AmnionController()
+        events = []
+        for i in range(250):
+            sensors = stub.read()
+            if i % 50 == 7:
+                sensors.pop("P_in")  # absent key survives the round trip
+            out = ctrl.step(sensors)
+            version = None if i < 20 else 1 + i // 100  # config_version survives too; omitted when None
+            events.append((i, 1000.0 + i * 0.01, i * 0.01, sensors, out, dict(out), version))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            ref, binp, conv = (os.path.join(tmp, n) for n in ("ref.jsonl", "ev.bin", "conv.jsonl"))
+            with JsonlSink(ref) as js, BinarySink(binp, chunk_records=16) as bs:
+                for ev in events:
+                    js.write(*ev)
+                    bs.write(*ev)
+
+            self.assertEqual(binary_to_jsonl(binp, conv), len(events))
+            with open(ref, "rb") as a, open(conv, "rb") as b:
+                self.assertEqual(a.read(), b.read())
+            rec = read_records(binp)
+            self.assertEqual(rec["tick"].tolist(), list(range(250)))
+            self.assertEqual(rec["config_version"][[0, 20, 249]].tolist(), [INT_ABSENT, 1, 3])
+            self.assertLess(os.path.getsize(binp) * 4, os.path.getsize(ref))
+
+    def test_plane_codec_matches_uncompressed(self):
+        stub, ctrl = SensorStub(), AmnionController()
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = os.path.join(tmp, "z.bin"), os.path.join(tmp, "raw.bin")
+            with BinarySink(paths[0], chunk_records=1024) as z, BinarySink(paths[1], compress_level=0) as raw:
+                for i in range(3000):
+                    s = stub.read()
+                    out = ctrl.step(s)
+                    z.write(i, 1000.0 + i * 0.02, i * 0.02, s, out)
+                    raw.write(i, 1000.0 + i * 0.02, i * 0.02, s, out)
+            self.assertEqual(read_records(paths[0]).tobytes(), read_records(paths[1]).tobytes())
+            self.assertLess(os.path.getsize(paths[0]) * 2, os.path.getsize(paths[1]))
+
+    def test_int_kind_roundtrip_and_float_widening(self):
+        schema = EventSchema(DEFAULT_SENSOR_FIELDS + (("seq", "i"),))
+        out = AmnionController().step({})
+        with tempfile.TemporaryDirectory() as tmp:
+            binp, conv = os.path.join(tmp, "ev.bin"), os.path.join(tmp, "conv.jsonl")
+            with BinarySink(binp, schema) as bs:
+                bs.write(0, 0.0, 0.0, {"f_ref": 76, "seq": 7}, out)
+                bs.write(1, 0.0, 0.0, {"f_ref": 76.5, "seq": -(1 << 40)}, out)
+                bs.write(2, 0.0, 0.0, {"f_ref": 76.5}, out)
+            binary_to_jsonl(binp, conv)
+            with open(conv, "r", encoding="utf-8") as f:
+                sensors = [json.loads(line)["sensors"] for line in f]
+        self.assertEqual([repr(s.get("seq")) for s in sensors], ["7", repr(-(1 << 40)), "None"])
+        self.assertEqual(repr(sensors[0]["f_ref"]), "76.0")  # "f" fields are f8: ints come back as floats
+        with self.assertRaises(ValueError):
+            EventSchema((("seq", "u"),))
+
+    def test_unconvertible_values_are_stored_as_absent(self):
+        out = AmnionController().step({})
+        with tempfile.TemporaryDirectory() as tmp:
+            binp = os.path.join(tmp, "ev.bin")
+            with BinarySink(binp) as bs:
+                bs.write(0, 0.0, 0.0, {"Q": None, "P_in": "", "P_draw": "1e999", "loop_closure": "garbage"}, out)
+            rec = read_records(binp)[0]
+            self.assertTrue(math.isnan(rec["s.Q"]) and math.isnan(rec["s.P_in"]))
+            self.assertEqual((rec["s.P_draw"], rec["s.loop_closure"]), (math.inf, -1))
+
+            sensor = FaultySensor(SensorStub(), [Garbage(rate=0.2)], 3)
+            path = run_simulation(ticks=300, out_path=binp, fmt="binary", sensor=sensor)
+            self.assertEqual(len(read_records(path)), 300)
+
+    def test_close_after_writer_failure_releases_file(self):
+        class _BrokenFile:
+            def __init__(self, f):
+                self.f = f
+
+            def write(self, data):
+                raise OSError("disk full")
+
+            def close(self):
+                self.f.close()
+
+        out = AmnionController().step({})
+        with tempfile.TemporaryDirectory() as tmp:
+            sink = BinarySink(os.path.join(tmp, "ev.bin"), chunk_records=1)
+            raw = sink._f
+            sink._f = _BrokenFile(raw)
+            with self.assertRaises(RuntimeError):
+                for i in range(100):
+                    sink.write(i, 0.0, 0.0, {}, out)
+            with self.assertRaises(RuntimeError):
+                sink.close()
+            self.assertFalse(sink._writer.is_alive())
+            self.assertTrue(raw.closed)
+
+    def test_rejects_unknown_sensor_keys(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            sink = BinarySink(os.path.join(tmp, "ev.bin"))
+            out = AmnionController().step({})
+            with self.assertRaises(ValueError):
+                sink.write(0, 0.0, 0.0, {"Q": 0.9, "bogus": 1.0}, out)
+            sink.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+import math
+import unittest
+
+from controller.config_loader import ConfigError, load_config
+from controller.guard_engine import VARIABLES, GuardEngine, compile_guards
+from controller.safety_gate import SafetyConfig, SafetyGate
+
+NAN = math.nan
+
+
+def _x(pm=0.0, ph=0.0, coh=0.9, missing=0.0, invalid=0.0, temp=20.0, estop=0.0):
+    return (pm, ph, coh, missing, invalid, temp, estop)
+
+
+class TestGuardEngine(unittest.TestCase):
+    def setUp(self):
+        self.program = compile_guards(load_config().data)
+
+    def test_compiles_repo_config(self):
+        p = self.program
+        self.assertEqual(p.states, ("OK", "WARN", "DEGRADED", "SAFE_HOLD", "SHUTDOWN"))
+        ok_to_warn = p.rules[p.ordinal("OK")][0]
+        self.assertEqual(ok_to_warn.to_state, p.ordinal("WARN"))
+        # coherence < (C_min + warn) -> 0.73 + 0.03
+        cond = ok_to_warn.conds[2]
+        self.assertEqual(VARIABLES[cond.var_index], "coherence")
+        self.assertAlmostEqual(cond.threshold, 0.76)
+        self.assertEqual(p.patches[p.ordinal("DEGRADED")]["barrier.p_budget_w"], 50.0)
+        with self.assertRaises(TypeError):
+            p.patches[0]["mode"] = "X"  # immutable template
+
+    def test_warn_then_chain_to_degraded(self):
+        e = GuardEngine(self.program)
+        self.assertEqual(e.name, "OK")
+        e.step(_x(pm=12.0))
+        self.assertEqual(e.name, "WARN")
+        e.reset()
+        e.step(_x(pm=-30.0))  # trip tier chains OK -> WARN -> DEGRADED in one tick
+        self.assertEqual(e.name, "DEGRADED")
+        e.step(_x())  # no de-escalation rules in config
+        self.assertEqual(e.name, "DEGRADED")
+
+    def test_missing_values_never_match_thresholds(self):
+        e = GuardEngine(self.program)
+        e.step(_x(pm=NAN, ph=NAN, coh=NAN, temp=NAN))
+        self.assertEqual(e.name, "OK")
+
+    def test_safe_hold_dwell_then_shutdown(self):
+        e = GuardEngine(self.program)
+        e.step(_x(missing=1.0), now=100.0)
+        self.assertEqual(e.name, "SAFE_HOLD")
+        e.step(_x(coh=0.5), now=120.0)
+        self.assertEqual(e.name, "SAFE_HOLD")
+        e.step(_x(coh=0.5), now=130.0)
+        self.assertEqual(e.name, "SHUTDOWN")
+
+    def test_emergency_stop(self):
+        e = GuardEngine(self.program)
+        e.step(_x(estop=1.0))
+        self.assertEqual(e.name, "SHUTDOWN")
+        self.assertEqual(e.canonical, "S3_SAFE_HALT")
+
+    def test_unknown_names_rejected(self):
+        bad = {"safety": {"states": {"OK": {}, "WARN": {}},
+                          "transitions": [{"from": "OK", "to": "WARN", "when_any": ["bogus >= 1"]}]}}
+        with self.assertRaises(ConfigError):
+            compile_guards(bad)
+
+    def test_safety_gate_escalates_on_guard(self):
+        gate = SafetyGate(guards=GuardEngine(self.program))
+        res = gate.evaluate({"Q": 0.9, "P_in": 0.5, "P_draw": 0.5, "phase_error": 0.4})
+        self.assertIn("guard:WARN", res["flags"])
+        self.assertEqual(res["state"], "S1_THROTTLE")  # below phase_trip, above warn_abs_rad
+
+    def test_safety_gate_shares_readonly_templates(self):
+        gate = SafetyGate()
+        a = gate.evaluate({"Q": 0.9, "P_in": 0.5, "P_draw": 0.5})
+        b = gate.evaluate({"Q": 0.8, "P_in": 0.5, "P_draw": 0.5})
+        self.assertIs(a["patch"], b["patch"])
+        self.assertIs(a["limits"], b["limits"])
+        with self.assertRaises(TypeError):
+            a["patch"]["mode"] = "X"
+        halt = gate.evaluate({"Q": 0.1, "P_in": 0.5, "P_draw": 0.5})["patch"]
+        self.assertEqual(dict(halt)["mode"], "BARRIER")  # Q < Q_crit
+        self.assertEqual(SafetyGate(SafetyConfig(P_budget_min=0.1)).evaluate({"Q": 0.1})["patch"]["P_budget"], 0.1)
+
+
+if __name__ == "__main__":
+    unittest.main()
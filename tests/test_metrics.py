@@ -0,0 +1,52 @@
+import unittest
+
+import numpy as np
+
+from controller.amnion_controller import AmnionController
+from controller.io.sensor_stub import SensorStub
+from controller.metrics import Metrics, MetricsConfig
+
+
+class TestMetricsHistory(unittest.TestCase):
+    def test_controller_feeds_metrics(self):
+        ctrl = AmnionController()
+        stub = SensorStub()
+        for _ in range(5):
+            ctrl.step(stub.read())
+        self.assertEqual(ctrl.metrics.ticks, 5)
+        last = ctrl.metrics.last
+        self.assertEqual(last["tick"], 5)
+        self.assertIsInstance(last["flags"], list)
+        self.assertEqual(ctrl.metrics.snapshot()["last"], last)
+
+    def test_ring_keeps_newest_rows_and_dict_shape(self):
+        m = Metrics(cfg=MetricsConfig(max_history=4))
+        for i in range(10):
+            m.update(
+                {"coherence": 0.5 + i / 100, "P_in": None},
+                {"state": "S1_THROTTLE" if i % 2 else "S0_NORMAL", "allow_control": True,
+                 "flags": ["rate_limit"] if i % 2 else [], "mismatch_phase": 0.1},
+                {"P_budget": 0.8},
+            )
+        hist = m.get_history()
+        self.assertEqual([h["tick"] for h in hist], [7, 8, 9, 10])
+        self.assertEqual([h["tick"] for h in m.get_history(2)], [9, 10])
+        self.assertEqual(len(m.get_history(0)), 0)
+        row = hist[-1]
+        self.assertEqual(row["state"], "S1_THROTTLE")
+        self.assertEqual(row["flags"], ["rate_limit"])
+        self.assertIsNone(row["power_in"])
+        self.assertIsNone(row["u_cmd"])
+        self.assertEqual(row["P_budget"], 0.8)
+        np.testing.assert_allclose(hist.column("coherence"), [0.56, 0.57, 0.58, 0.59])
+
+    def test_contiguous_column_is_zero_copy(self):
+        m = Metrics(cfg=MetricsConfig(max_history=8))
+        for _ in range(5):
+            m.update({}, {"ok": True}, {})
+        col = m.get_history(3).column("tick")
+        self.assertTrue(np.shares_memory(col, m.history.segments()[0]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import hashlib
+import importlib.util
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+from unittest import mock
+
+_TOOL = Path(__file__).resolve().parents[1] / "tools" / "pack_release.py"
+_spec = importlib.util.spec_from_file_location("pack_release", _TOOL)
+pack_release = sys.modules["pack_release"] = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(pack_release)
+
+
+class TestPackRelease(unittest.TestCase):
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp, True)
+        self.src = self.tmp / "src"
+        (self.src / "pkg" / "__pycache__").mkdir(parents=True)
+        (self.src / "pkg" / "a.py").write_text("print('a')\n" * 50, encoding="utf-8")
+        (self.src / "pkg" / "empty.txt").write_bytes(b"")
+        (self.src / "pkg" / "__pycache__" / "a.cpython-311.pyc").write_bytes(b"junk")
+        (self.src / "run.bin").write_bytes(os.urandom(3000) + bytes(200_000))  # mmap path (patched MMAP_MIN)
+        (self.src / "README.md").write_text("readme\n", encoding="utf-8")
+
+    def pack(self, name, **kw):
+        out = self.tmp / name
+        items = pack_release.iter_files(self.src, ["pkg", "run.bin", "README.md", "missing"])
+        with mock.patch.object(pack_release, "MMAP_MIN", 4096):
+            counts = pack_release.pack(items, out, "2026-01-01T00:00:00Z", "abc123", **kw)
+        return out, counts
+
+    def test_deterministic_single_read_archive(self):
+        a, counts = self.pack("a.zip", jobs=4)
+        self.assertEqual(counts, {"files": 4, "packed": 4, "reused": 0})
+        os.utime(self.src / "README.md", ns=(1, 1))  # mtimes do not leak into the archive
+        b, _ = self.pack("b.zip", jobs=1)
+        self.assertEqual(a.read_bytes(), b.read_bytes())
+
+        with zipfile.ZipFile(a) as zf:
+            self.assertIsNone(zf.testzip())
+            names = zf.namelist()
+            self.assertEqual(names, ["RELEASE_META.txt", "MANIFEST_SHA256.txt",
+                                     "README.md", "pkg/a.py", "pkg/empty.txt", "run.bin"])
+            for info in zf.infolist():
+                self.assertEqual(info.date_time, pack_release.ZIP_DATE_TIME)
+                self.assertEqual(info.external_attr >> 16, pack_release.ZIP_FILE_MODE)
+            for name in names[2:]:
+                self.assertEqual(zf.read(name), (self.src / name).read_bytes())
+            manifest = zf.read("MANIFEST_SHA256.txt").decode().splitlines()
+        self.assertEqual(manifest[:3], ["AMNION Release Manifest v1", "timestamp_utc: 2026-01-01T00:00:00Z",
+                                        "git_sha: abc123"])
+        for line in manifest[5:]:
+            digest, name = line.split("  ")
+            self.assertEqual(digest, pack_release.sha256_file(self.src / name))
+
+    def test_incremental_reuses_unchanged_files(self):
+        full, _ = self.pack("rel.zip")
+        reference = full.read_bytes()
+
+        with mock.patch.object(pack_release, "pack_file", wraps=pack_release.pack_file) as spy:
+            _, counts = self.pack("rel.zip", incremental=True)
+        self.assertEqual(spy.call_count, 0)
+        self.assertEqual(counts["reused"], 4)
+        self.assertEqual(full.read_bytes(), reference)
+
+        (self.src / "pkg" / "a.py").write_text("print('b')\n", encoding="utf-8")
+        _, counts = self.pack("rel.zip", incremental=True)
+        self.assertEqual((counts["packed"], counts["reused"]), (1, 3))
+        fresh, _ = self.pack("fresh.zip")
+        self.assertEqual(full.read_bytes(), fresh.read_bytes())
+        with zipfile.ZipFile(full) as zf:
+            self.assertEqual(zf.read("pkg/a.py"), b"print('b')\n")
+            self.assertIn(hashlib.sha256(b"print('b')\n").hexdigest(), zf.read("MANIFEST_SHA256.txt").decode())
+
+
+if __name__ == "__main__":
+    unittest.main()
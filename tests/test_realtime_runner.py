@@ -0,0 +1,119 @@
+import asyncio
+import os
+import tempfile
+import time
+import unittest
+
+from controller.clock import VirtualClock
+from controller.config_loader import load_config
+from controller.io.actuator_stub import ActuatorStub
+from controller.io.event_sink import open_sink, read_records
+from controller.io.realtime_runner import (
+    MISS_SENSOR_TIMEOUT,
+    RealtimeConfig,
+    RealtimeRunner,
+    run_realtime,
+)
+from controller.io.sensor_stub import SensorStub
+
+
+class _StallingSensor:
+    """Async sensor that hangs from read `stall_at` on."""
+
+    def __init__(self, stall_at, clock=None):
+        self.stub = SensorStub(clock=clock)
+        self.stall_at = stall_at
+        self.reads = 0
+
+    async def read(self):
+        self.reads += 1
+        if self.reads > self.stall_at:
+            await asyncio.sleep(3600)
+        return self.stub.read()
+
+
+class _Recorder(ActuatorStub):
+    def __init__(self):
+        super().__init__()
+        self.outputs = []
+
+    def apply(self, control_frame):
+        super().apply(control_frame)
+        self.outputs.append(dict(control_frame))
+
+
+class _SlowController:
+    def __init__(self, seconds):
+        self.seconds = seconds
+
+    def step(self, sensors):
+        time.sleep(self.seconds)
+        return {}
+
+
+class TestRealtimeRunner(unittest.TestCase):
+    def test_config_from_safety_yaml(self):
+        cfg = RealtimeConfig.from_config(load_config().data)
+        self.assertEqual(cfg.sensor_timeout_ms, 500.0)
+        self.assertEqual(cfg.rate_hz, 50.0)
+        self.assertEqual(RealtimeConfig(rate_hz=1000).period_ns, 1_000_000)
+
+    def test_ticks_follow_absolute_grid(self):
+        rep = run_realtime(300, cfg=RealtimeConfig(rate_hz=500))
+        self.assertEqual(rep.ticks, 300)
+        self.assertEqual(rep.sensor_deadline_misses + rep.sensor_timeouts, 0)
+        # no drift: wall time is the number of grid slots used (plus the last tick)
+        self.assertAlmostEqual(rep.wall_s, (rep.ticks + rep.skipped) / 500.0, delta=0.02)
+        self.assertEqual(rep.stages["step"]["count"], 300)
+
+    def test_stalled_sensor_is_held_then_times_out(self):
+        sensor, act = _StallingSensor(stall_at=3), _Recorder()
+        misses = []
+        cfg = RealtimeConfig(rate_hz=200, sensor_timeout_ms=30)
+        runner = RealtimeRunner(sensor=sensor, actuator=act, cfg=cfg,
+                                on_miss=lambda tick, kind, v: misses.append((tick, kind)))
+        seen = []
+        step = runner.ctrl.step
+        runner.ctrl.step = lambda s: (seen.append(dict(s)), step(s))[1]
+        rep = asyncio.run(runner.run(20))
+
+        self.assertEqual(rep.ticks, 20)
+        self.assertEqual(sensor.reads, 4)  # the stalled read stays in flight
+        self.assertGreaterEqual(rep.sensor_deadline_misses, 1)
+        self.assertGreaterEqual(rep.sensor_timeouts, 1)
+        self.assertNotIn("sensor_age_ms", seen[2])
+        self.assertIn("sensor_age_ms", seen[3])  # held frame
+        self.assertEqual(seen[3]["P_in"], seen[2]["P_in"])
+        self.assertIs(seen[-1]["sensor_valid"], False)
+        self.assertNotIn("P_in", seen[-1])
+        self.assertEqual(act.outputs[-1]["state"], "S2_BARRIER")
+        self.assertIn((19, MISS_SENSOR_TIMEOUT), misses)
+
+    def test_sensor_misses_are_logged_by_binary_sink(self):
+        clock = VirtualClock(0.02)
+        cfg = RealtimeConfig(rate_hz=50, sensor_timeout_ms=100)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "ev.bin")
+            rep = asyncio.run(RealtimeRunner(sensor=_StallingSensor(3, clock), cfg=cfg, clock=clock,
+                                             sink=open_sink(path, "binary")).run(12))
+            rec = read_records(path)
+        self.assertGreaterEqual(rep.sensor_deadline_misses, 1)
+        self.assertGreaterEqual(rep.sensor_timeouts, 1)
+        self.assertEqual(rec["tick"].tolist(), list(range(12)))
+        age = rec["s.sensor_age_ms"]
+        self.assertTrue((age[:3] != age[:3]).all())  # fresh frames: absent (NaN)
+        self.assertEqual(age[3], 30.0)  # held frame: one period + the spent read budget
+        self.assertEqual(rec["s.sensor_valid"][-1], 0)  # timed out
+        self.assertEqual(rec["s.sensor_seq"][-1], -(1 << 63))  # not an acquisition frame: absent
+
+    def test_overruns_are_counted_and_slots_skipped(self):
+        rep = run_realtime(5, cfg=RealtimeConfig(rate_hz=200), controller=_SlowController(0.012))
+        self.assertEqual(rep.ticks, 5)
+        self.assertEqual(rep.overruns, 5)
+        self.assertEqual(rep.deadline_misses, 5)
+        self.assertGreaterEqual(rep.skipped, 5)
+        self.assertFalse(rep.ok)
+
+
+if __name__ == "__main__":
+    unittest.main()
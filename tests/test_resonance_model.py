@@ -0,0 +1,68 @@
+import math
+import unittest
+
+import numpy as np
+
+from controller.resonance_model import ResonanceStream, from_sensors
+
+
+def _reference(phases):
+    # original three-pass formulation
+    z = np.mean(np.exp(1j * phases))
+    mu = float(np.angle(z))
+    d = np.angle(np.exp(1j * (phases - mu)))
+    return float(np.abs(z)), mu, float(np.std(d))
+
+
+class TestFromSensors(unittest.TestCase):
+    def test_single_pass_matches_reference(self):
+        rng = np.random.default_rng(8)
+        for spread in (0.01, 0.5, 3.0):
+            phases = math.pi + rng.normal(0.0, spread, 500)  # straddles the +-pi cut
+            rf = from_sensors({"phase_samples": phases})
+            r, mu, noise = _reference(phases)
+            self.assertEqual(rf.r_order, r)
+            self.assertEqual(rf.phase_mean, mu)
+            self.assertAlmostEqual(rf.phase_noise, noise, places=12)
+
+    def test_empty_is_constant(self):
+        rf = from_sensors({})
+        self.assertEqual((rf.r_order, rf.phase_mean, rf.phase_noise), (0.0, 0.0, 1.0))
+        self.assertAlmostEqual(rf.coherence_score, 0.3 * (1.0 - 1.0 / math.pi))
+
+
+class TestResonanceStream(unittest.TestCase):
+    def test_sliding_window_matches_from_sensors(self):
+        rng = np.random.default_rng(9)
+        stream = ResonanceStream(window=300)
+        # slowly drifting phase that wraps through +-pi several times
+        t = np.arange(20000)
+        phases = (0.002 * t + rng.normal(0.0, 0.2, t.size) + math.pi) % (2 * math.pi) - math.pi
+        phases[::997] = np.nan
+        kept = []
+        pos = 0
+        while pos < phases.size:
+            n = int(rng.integers(1, 50))
+            chunk = phases[pos : pos + n]
+            pos += n
+            got = stream.update({"phase_samples": chunk})
+            kept.extend(chunk[np.isfinite(chunk)])
+            window = np.asarray(kept[-300:])
+            np.testing.assert_array_equal(got.state_vector, window)
+            ref = from_sensors({"phase_samples": window})
+            self.assertAlmostEqual(got.r_order, ref.r_order, places=9)
+            self.assertAlmostEqual(math.remainder(got.phase_mean - ref.phase_mean, 2 * math.pi), 0.0, places=9)
+            self.assertAlmostEqual(got.phase_noise, ref.phase_noise, places=9)
+            self.assertAlmostEqual(got.coherence_score, ref.coherence_score, places=9)
+
+    def test_oversized_push_and_empty(self):
+        stream = ResonanceStream(window=4)
+        self.assertEqual(stream.frame().phase_noise, 1.0)
+        stream.push(np.arange(10.0))
+        np.testing.assert_array_equal(stream.samples(), [6.0, 7.0, 8.0, 9.0])
+        with self.assertRaises(ValueError):
+            ResonanceStream(window=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+import math
+import random
+import unittest
+
+from controller import rolling_stats
+from controller.config_loader import load_config
+from controller.metrics import ROLLING_METRICS, Metrics, MetricsConfig
+from controller.rolling_stats import RollingStats
+
+
+def _brute(samples, t, span):
+    xs = [x for (ts, x) in samples if t - span < ts <= t]
+    if not xs:
+        return None
+    mean = math.fsum(xs) / len(xs)
+    var = math.fsum((x - mean) ** 2 for x in xs) / len(xs)
+    return {"n": len(xs), "mean": mean, "var": var, "min": min(xs), "max": max(xs),
+            "rms": math.sqrt(math.fsum(x * x for x in xs) / len(xs))}
+
+
+class TestRollingStats(unittest.TestCase):
+    def test_matches_brute_force_with_gaps_and_nan(self):
+        old = rolling_stats.RENORM_MIN
+        rolling_stats.RENORM_MIN = 8  # exercise re-normalization and compaction
+        try:
+            rng = random.Random(6)
+            rs = RollingStats(("x",), (0.1, 0.5, 2.0))
+            samples = []
+            t = 0.0
+            for i in range(3000):
+                t += rng.choice((0.02, 0.02, 0.02, 0.3))
+                x = 1e6 + rng.gauss(0.0, 1.0) if i < 1500 else rng.uniform(-5, 5)
+                if rng.random() < 0.05:
+                    rs.push(t, (float("nan"),))
+                    continue
+                rs.push(t, (x,))
+                samples.append((t, x))
+                if i % 97 == 0 or i == 2999:
+                    snap = rs.snapshot()["x"]
+                    for span, label in ((0.1, "0.1s"), (0.5, "0.5s"), (2.0, "2s")):
+                        ref = _brute(samples, t, span)
+                        got = snap[label]
+                        self.assertEqual(got["n"], ref["n"])
+                        self.assertEqual(got["min"], ref["min"])
+                        self.assertEqual(got["max"], ref["max"])
+                        self.assertAlmostEqual(got["mean"], ref["mean"], delta=1e-9 * max(1.0, abs(ref["mean"])))
+                        self.assertAlmostEqual(got["var"], ref["var"], delta=1e-6)
+                        self.assertAlmostEqual(got["rms"], ref["rms"], delta=1e-9 * max(1.0, ref["rms"]))
+            self.assertLess(len(rs._series[0].x), 4 * 2.0 / 0.02 + 2 * rolling_stats.RENORM_MIN)
+        finally:
+            rolling_stats.RENORM_MIN = old
+
+    def test_metrics_snapshot_exposes_windows(self):
+        cfg = MetricsConfig.from_config(load_config().data)
+        self.assertEqual(cfg.rolling_windows_s, (1.0, 3.0, 5.0, 10.0, 30.0, 60.0))
+        self.assertEqual(cfg.tick_hz, 50.0)
+        self.assertEqual(cfg.coherence_min, 0.73)
+
+        m = Metrics(cfg=cfg)
+        for i in range(100):
+            m.update({"P_in": 1.0, "P_draw": 1.0 + (i % 2), "coherence": 0.70},
+                     {"mismatch_phase": -0.2}, {})
+        roll = m.snapshot()["rolling"]
+        self.assertEqual(set(roll), set(ROLLING_METRICS))
+        one = roll["power_mismatch"]["1s"]
+        self.assertEqual(one["n"], 50)
+        self.assertAlmostEqual(one["mean"], 0.5)
+        self.assertAlmostEqual(one["var"], 0.25)
+        self.assertEqual((one["min"], one["max"]), (0.0, 1.0))
+        self.assertEqual(roll["power_mismatch"]["60s"]["n"], 100)
+        self.assertAlmostEqual(roll["phase_mismatch"]["10s"]["mean"], 0.2)
+        self.assertAlmostEqual(roll["coherence_drop"]["10s"]["max"], 0.03)
+
+    def test_disabled_by_default(self):
+        m = Metrics()
+        m.update({}, {}, {})
+        self.assertNotIn("rolling", m.snapshot())
+
+    def test_no_positive_window_disables(self):
+        m = Metrics(cfg={"rolling_windows_s": (0.0, -5.0)})
+        m.update({}, {}, {})
+        self.assertNotIn("rolling", m.snapshot())
+        rs = RollingStats(("x",), (0.0,))
+        rs.push(0.0, (1.0,))
+        self.assertEqual(rs.snapshot(), {"x": {}})
+
+
+if __name__ == "__main__":
+    unittest.main()
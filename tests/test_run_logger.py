@@ -0,0 +1,142 @@
+import hashlib
+import json
+import shutil
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+import yaml
+
+from controller.config_loader import load_config
+from controller.io.simulation_runner import run_simulation
+from controller.logger import Logger, LoggingConfig, RunLogger
+
+
+class TestRunLogger(unittest.TestCase):
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.root, True)
+        self.loaded = load_config(use_cache=False)
+
+    def lines(self, lg, channel):
+        text = (lg.run_dir / f"{channel}.jsonl").read_text(encoding="utf-8")
+        return [json.loads(line) for line in text.splitlines()]
+
+    def test_config_from_04_logging(self):
+        cfg = LoggingConfig.from_config(self.loaded.data)
+        self.assertEqual(cfg.float_precision, 6)
+        self.assertTrue(cfg.sort_keys)
+        self.assertEqual(dict(cfg.channels)["guards"], "guards.jsonl")
+        self.assertEqual(dict(cfg.required)["events"], ("ts", "run_id", "event", "severity"))
+        self.assertIn("home_path", cfg.strip_fields)
+        self.assertEqual(cfg.hash_files[-1], "manifest.yaml")
+
+    def test_run_directory_channels_and_integrity(self):
+        lg = RunLogger.from_config(self.loaded, root_dir=str(self.root), run_id="2026-01-22T22-31-05Z",
+                                   notes=["unit test"])
+        self.assertEqual(lg.run_dir.name, "run_2026-01-22T22-31-05Z")
+        lg.event("boot", module="test", ctx={"gain": 1.23456789, "home_path": "/home/x", "nan": float("nan")})
+        lg.event("noise", "DEBUG")  # below level "normal": not queued
+        lg.log("guards", {"reason": "missing state"})  # schema violation -> errors channel
+        Logger("ctl", run=lg).warn("forwarded", {"k": 1})
+        path = run_simulation(ticks=50, sink=lg)  # closes the logger
+        self.assertEqual(path, str(lg.run_dir))
+
+        events = self.lines(lg, "events")
+        self.assertEqual([e["event"] for e in events], ["boot", "forwarded"])
+        boot = events[0]
+        self.assertEqual(boot["ctx"], {"gain": 1.234568, "nan": None})
+        self.assertEqual(boot["run_id"], "2026-01-22T22-31-05Z")
+        self.assertTrue(boot["ts"].endswith("Z"))
+        raw = (lg.run_dir / "events.jsonl").read_text(encoding="utf-8").splitlines()[0]
+        self.assertEqual(raw, json.dumps(boot, sort_keys=True, separators=(",", ":")))
+        self.assertEqual(events[1]["severity"], "WARN")
+
+        self.assertEqual(len(self.lines(lg, "metrics")), 50)
+        guards = self.lines(lg, "guards")
+        self.assertEqual(guards[0]["state"], "S0_NORMAL")
+        errors = self.lines(lg, "errors")
+        self.assertEqual(errors[0]["ctx"], {"channel": "guards", "missing": ["state"]})
+        self.assertEqual(lg.stats()["invalid"], 1)
+
+        manifest = yaml.safe_load((lg.run_dir / "manifest.yaml").read_text(encoding="utf-8"))
+        self.assertEqual(manifest["run_id"], lg.run_id)
+        self.assertEqual(manifest["config_hashes"], self.loaded.file_hashes)
+        self.assertEqual(manifest["notes"], ["unit test"])
+        self.assertEqual(manifest["channels"]["metrics"]["records"], 50)
+        self.assertIn("python", manifest["host"])
+
+        sums = (lg.run_dir / "sha256sum.txt").read_text(encoding="utf-8").splitlines()
+        self.assertEqual([line.split("  ")[1] for line in sums],
+                         ["events.jsonl", "metrics.jsonl", "guards.jsonl", "errors.jsonl", "manifest.yaml"])
+        for line in sums:
+            digest, name = line.split("  ")
+            self.assertEqual(hashlib.sha256((lg.run_dir / name).read_bytes()).hexdigest(), digest)
+        self.assertTrue((lg.run_dir / "signature.txt").exists())
+
+    def test_same_second_runs_get_distinct_dirs_and_level_off(self):
+        a = RunLogger(root_dir=str(self.root), run_id="r")
+        b = RunLogger(LoggingConfig(level="off"), root_dir=str(self.root), run_id="r")
+        self.assertNotEqual(a.run_dir, b.run_dir)
+        self.assertFalse(b.event("x", "CRITICAL"))
+        a.close()
+        b.close()
+        self.assertEqual(list(b.run_dir.glob("*.jsonl")), [])
+
+    def test_producer_never_waits_for_writer(self):
+        gate = threading.Event()
+
+        class _SlowFile:  # writer stuck on disk until the gate opens
+            def __init__(self, f):
+                self.f = f
+
+            def write(self, data):
+                gate.wait(5)
+                return self.f.write(data)
+
+            def __getattr__(self, name):
+                return getattr(self.f, name)
+
+        lg = RunLogger(root_dir=str(self.root), max_pending=100)
+        ch = lg._files["metrics"]
+        ch.f = _SlowFile(ch.f)
+        accepted = sum(lg.metrics({"i": i}) for i in range(1000))  # returns while the writer is blocked
+        self.assertLessEqual(accepted, 101)
+        self.assertGreaterEqual(lg.stats()["dropped"], 899)
+        gate.set()
+        lg.close()
+        self.assertEqual(len(self.lines(lg, "metrics")), accepted)
+
+    def test_concurrent_producers_account_for_every_record(self):
+        gate = threading.Event()
+        lg = RunLogger(root_dir=str(self.root), max_pending=500)
+        ch = lg._files["metrics"]
+        write = ch.f.write
+        ch.f.write = lambda data: (gate.wait(5), write(data))[1]
+        accepted = []
+
+        def produce():
+            accepted.append(sum(lg.metrics({"i": i}) for i in range(2000)))
+
+        threads = [threading.Thread(target=produce) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        gate.set()
+        lg.close()
+        stats = lg.stats()
+        self.assertEqual(stats["queued"], sum(accepted))
+        self.assertEqual(stats["queued"] + stats["dropped"], 8000)
+        self.assertEqual(len(self.lines(lg, "metrics")), sum(accepted))
+
+    def test_forwarded_event_keeps_its_ts(self):
+        lg = RunLogger(root_dir=str(self.root))
+        Logger("ctl", run=lg)._emit("INFO", "stamped", ts=1769121065.5)
+        lg.close()
+        self.assertEqual(self.lines(lg, "events")[0]["ts"], "2026-01-22T22:31:05.500000Z")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+
+import numpy as np
+
+from controller.amnion_controller import AmnionController
+from controller.io.sensor_stub import BATCH_FIELDS, SensorStub
+
+
+class _Clock:
+    def __init__(self):
+        self.t = 100.0
+
+    def __call__(self):
+        self.t += 0.5
+        return self.t
+
+
+class TestSensorStubBatch(unittest.TestCase):
+    def _assert_rows(self, cols, frames):
+        for key, _ in BATCH_FIELDS[1:]:
+            # repr(): bit-identical floats, Python bools
+            self.assertEqual(repr(cols[key].tolist()), repr([f[key] for f in frames]), key)
+
+    def test_matches_read(self):
+        stub = SensorStub(base_freq=75.9)
+        frames = [stub.read() for _ in range(12000)]  # Q reaches 0 at tick 9000
+        self._assert_rows(SensorStub(base_freq=75.9).read_batch(0, 12000), frames)
+        self.assertEqual(list(SensorStub().read_batch(0, 3)), [k for k, _ in BATCH_FIELDS])
+
+        other = SensorStub(base_freq=75.9)
+        tail = other.read_batch(4321, 100)
+        self.assertEqual(other.tick, 0)  # read position untouched
+        self._assert_rows(tail, frames[4321:4421])
+
+    def test_injected_clock(self):
+        stub = SensorStub(clock=_Clock())
+        self.assertEqual([stub.read()["ts"] for _ in range(2)], [101.0, 101.5])
+        self.assertEqual(stub.read_batch(0, 4)["ts"].tolist(), [102.0] * 4)
+
+    def test_caller_buffers(self):
+        stub = SensorStub()
+        buf = stub.alloc_batch(256)
+        ref = SensorStub()
+        frames = [ref.read() for _ in range(600)]
+        for start in range(0, 600, 256):
+            n = min(256, 600 - start)
+            cols = stub.read_batch(start, n, out=buf)
+            self.assertTrue(all(np.shares_memory(cols[k], buf[k]) for k, _ in BATCH_FIELDS))
+            self._assert_rows(cols, frames[start:start + n])
+        with self.assertRaises(ValueError):
+            stub.read_batch(0, 257, out=buf)
+
+    def test_feeds_step_batch(self):
+        res = AmnionController().step_batch(SensorStub().read_batch(0, 5000))
+        ref, stub = AmnionController(), SensorStub()
+        for i in range(0, 5000, 7):
+            while stub.tick < i:
+                ref.step(stub.read())
+            self.assertEqual(repr(res.row(i)), repr(ref.step(stub.read())), i)
+
+
+if __name__ == "__main__":
+    unittest.main()
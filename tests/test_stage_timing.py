@@ -0,0 +1,73 @@
+import io
+import json
+import unittest
+
+from controller.amnion_controller import AmnionController
+from controller.io.sensor_stub import SensorStub
+from controller.stage_timing import N_BUCKETS, STAGES, StageTimer, bucket_bounds, bucket_index
+
+
+class TestHistogram(unittest.TestCase):
+    def test_bucket_bounds_cover_values(self):
+        for ns in list(range(0, 300)) + [1000, 12345, 10**6, 10**9, 2**40 - 1]:
+            idx = bucket_index(ns)
+            lo, hi = bucket_bounds(idx)
+            self.assertTrue(lo <= ns < hi, ns)
+            self.assertLess(idx, N_BUCKETS)
+            if ns >= 16:
+                self.assertLessEqual((hi - lo) / lo, 1 / 8)
+
+    def test_vectorized_flush_matches_scalar_binning(self):
+        t = StageTimer(("a", "b"))
+        samples = [(5, 1000), (17, 250_000), (3, 7_000_000)]
+        for a, b in samples:
+            t.record((0, a, a + b))
+        t.flush()
+        for stage, vals in enumerate(zip(*samples)):
+            for v in vals:
+                self.assertGreaterEqual(t.hist[stage][bucket_index(v)], 1)
+        self.assertEqual(t.hist.sum(), 6)
+        self.assertEqual(int(t.max_ns[1]), 7_000_000)
+        p50 = t.percentile_ns(1, 50)
+        lo, hi = bucket_bounds(bucket_index(250_000))
+        self.assertTrue(lo <= p50 < hi)
+
+
+class TestControllerInstrumentation(unittest.TestCase):
+    def test_disabled_by_default(self):
+        ctrl = AmnionController()
+        ctrl.step(SensorStub().read())
+        self.assertIsNone(ctrl.stage_timer)
+        self.assertNotIn("stages", ctrl.metrics.snapshot())
+
+    def test_records_every_stage_and_swallowed_errors(self):
+        ctrl = AmnionController()
+        timer = ctrl.instrument()
+
+        def boom(_):
+            raise RuntimeError("lawx down")
+
+        ctrl.lawx.process = boom
+        stub = SensorStub()
+        for _ in range(50):
+            ctrl.step(stub.read())
+
+        snap = ctrl.metrics.snapshot()["stages"]
+        self.assertEqual(list(snap), list(STAGES))
+        for name in STAGES:
+            self.assertEqual(snap[name]["count"], 50)
+            self.assertLessEqual(snap[name]["p50_us"], snap[name]["max_us"] * 1.13)
+        self.assertEqual(snap["lawx"]["errors"], 50)
+        self.assertEqual(snap["resonance"]["errors"], 0)
+
+        buf = io.StringIO()
+        timer.dump(buf, fmt="json")
+        self.assertEqual(json.loads(buf.getvalue())["ticks"], 50)
+        self.assertIn("metrics", timer.format())
+
+        ctrl.instrument(False)
+        self.assertNotIn("stages", ctrl.metrics.snapshot())
+
+
+if __name__ == "__main__":
+    unittest.main()
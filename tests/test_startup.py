@@ -0,0 +1,86 @@
+import os
+import subprocess
+import sys
+import unittest
+from typing import Dict, List
+
+_PKG = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Import-time budgets (ms, sum of -X importtime self times above a bare
+# interpreter, best of RUNS). Wall-clock budgets are machine-dependent, so they
+# are only enforced with AMNION_STARTUP_BUDGET=1 (e.g. on a pinned perf runner);
+# AMNION_STARTUP_BUDGET_SCALE stretches them on slow machines. The heavy-import
+# checks always run.
+IMPORT_BUDGET_MS = 80.0  # import controller.amnion_controller
+CLI_BUDGET_MS = 120.0  # python -m controller --help
+RUNS = 3
+
+# Deferred until the stage that needs them first runs
+HEAVY = ("numpy", "yaml", "controller.lawx_full_stack")
+
+
+def _importtime(*args: str) -> Dict[str, int]:
+    """{module: self import time in us} for one interpreter run."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (_PKG, env.get("PYTHONPATH")) if p)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=_PKG, env=env, capture_output=True, text=True, timeout=120,
+    )
+    if proc.returncode != 0:
+        raise AssertionError(proc.stderr[-2000:])
+    out: Dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|", 2)
+        out[name.strip()] = int(self_us)
+    return out
+
+
+def _cost_ms(args: List[str], baseline: Dict[str, int], runs: int = RUNS):
+    """(best total ms over `runs`, modules of the last run) above the bare interpreter."""
+    best, mods = float("inf"), {}
+    for _ in range(runs):
+        mods = _importtime(*args)
+        best = min(best, sum(us for name, us in mods.items() if name not in baseline) / 1e3)
+    return best, mods
+
+
+class TestStartup(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.baseline = _importtime("-c", "pass")
+        cls.scale = float(os.environ.get("AMNION_STARTUP_BUDGET_SCALE", "1"))
+        cls.enforce_ms = os.environ.get("AMNION_STARTUP_BUDGET", "") not in ("", "0")
+
+    def check(self, args: List[str], budget_ms: float) -> None:
+        cost, mods = _cost_ms(args, self.baseline, RUNS if self.enforce_ms else 1)
+        for name in HEAVY:
+            self.assertNotIn(name, mods, f"{' '.join(args)} imports {name} at startup")
+        if self.enforce_ms:
+            self.assertLessEqual(cost, budget_ms * self.scale, f"{' '.join(args)}: {cost:.1f} ms of imports")
+
+    def test_controller_import_budget(self):
+        self.check(["-c", "import controller.amnion_controller"], IMPORT_BUDGET_MS)
+
+    def test_cli_startup_budget(self):
+        self.check(["-m", "controller", "--help"], CLI_BUDGET_MS)
+
+    def test_heavy_imports_deferred_to_first_use(self):
+        code = (
+            "import sys\n"
+            "from controller.amnion_controller import AmnionController\n"
+            "c = AmnionController()\n"
+            "print('numpy' in sys.modules, end=' ')\n"
+            "c.step({'Q': 0.9})\n"  # metrics history ring: first NumPy user
+            "print('numpy' in sys.modules, 'controller.lawx_full_stack' in sys.modules)\n"
+        )
+        env = dict(os.environ, PYTHONPATH=_PKG)
+        out = subprocess.run([sys.executable, "-c", code], cwd=_PKG, env=env,
+                             capture_output=True, text=True, timeout=120, check=True).stdout
+        self.assertEqual(out.split(), ["False", "True", "False"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+import math
+import unittest
+from unittest import mock
+
+from controller.io.fault_injection import Dropout, Fault, FaultySensor, Garbage, make_faults
+from controller.io.sensor_stub import SensorStub
+from controller.io.stress_runner import StressSpec, check_tick, run_stress, run_trial
+from controller.runtime import Runtime, RuntimeConfig
+from controller.safety_gate import SafetyConfig, SafetyGate
+
+_OUT = {"state": "S0_NORMAL", "allow_control": True, "u_control": 0.4, "P_budget": 0.8}
+_FRAME = {"Q": 0.9, "sensor_valid": True}
+
+
+def _strip_ts(frames):
+    return [{k: v for k, v in f.items() if k != "ts"} for f in frames]
+
+
+class TestFaultInjection(unittest.TestCase):
+    def test_seeded_and_independent_processes(self):
+        def frames(faults, seed):
+            s = FaultySensor(SensorStub(), faults, seed)
+            return _strip_ts(s.read() for _ in range(300))
+
+        g = Garbage(rate=0.2)
+        a = frames([g], 5)
+        self.assertEqual(repr(a), repr(frames([g], 5)))
+        self.assertNotEqual(repr(a), repr(frames([g], 6)))
+        with_dropout = frames([g, Dropout(rate=0.5, keys=("loop_closure",))], 5)
+        self.assertTrue(any("loop_closure" not in f for f in with_dropout))
+        for x, y in zip(a, with_dropout):  # adding a process leaves the others' draws alone
+            x.pop("loop_closure")
+            y.pop("loop_closure", None)
+        self.assertEqual(repr(a), repr(with_dropout))
+        with self.assertRaises(ValueError):
+            FaultySensor(SensorStub(), [g, Garbage()], 1)
+
+    def test_fault_without_apply_fails_at_construction(self):
+        class Incomplete(Fault):
+            kind = "incomplete"
+
+        with self.assertRaises(TypeError):
+            Incomplete()
+        with self.assertRaises(TypeError):
+            Fault()
+
+
+class TestStressRunner(unittest.TestCase):
+    def test_check_tick(self):
+        s, r = SafetyConfig(), RuntimeConfig()
+        ok = {"flags": []}
+        self.assertIsNone(check_tick(_FRAME, _OUT, ok, s, r))
+        cases = [
+            ({"state": "S9"}, ok, _FRAME, "undefined_state"),
+            ({}, {"flags": ["Q_crit"]}, _FRAME, "escalation"),
+            ({"state": "S2_BARRIER", "P_budget": 0.0}, ok, _FRAME, "allow_control"),
+            ({"state": "S2_BARRIER", "allow_control": False, "P_budget": 0.0}, ok, _FRAME, "u_zero"),
+            ({"u_control": math.nan}, ok, _FRAME, "u_bounds"),
+            ({"P_budget": 1.5}, ok, _FRAME, "budget"),
+            ({"state": "S3_SAFE_HALT", "allow_control": False, "u_control": 0.0}, ok, _FRAME, "budget"),
+            ({}, ok, {"Q": "nan", "sensor_valid": True}, "invalid_sensor"),
+            ({}, ok, {"sensor_valid": True}, "invalid_sensor"),
+        ]
+        for patch, safety, frame, invariant in cases:
+            self.assertEqual(check_tick(frame, {**_OUT, **patch}, safety, s, r)[0], invariant, (patch, frame))
+
+    def test_default_faults_hold_invariants(self):
+        spec = StressSpec(ticks=1500)  # every fault process, garbage included
+        self.assertIn("garbage", [f.kind for f in spec.faults])
+        res = run_stress(spec, 4, seed=11, workers=1)
+        self.assertTrue(res.ok, res.failures)
+        self.assertEqual(res.ticks, 6000)
+
+    def test_gate_rejects_nonfinite_q(self):
+        gate = SafetyGate()
+        for q in (math.inf, -math.inf, math.nan, "1e999", "nan"):
+            out = gate.evaluate({"Q": q, "P_in": 0.5, "P_draw": 0.5, "sensor_valid": True})
+            self.assertEqual(out["state"], "S2_BARRIER", q)
+            self.assertIn("sensor_invalid:nonfinite_Q", out["flags"])
+
+    def test_failures_shrink_to_minimal_reproducer(self):
+        compute = Runtime.compute
+
+        def leaky(self, sensors, safety_state):  # ignores allow_control on an e-stop
+            out = compute(self, sensors, safety_state)
+            return {**out, "u_control": 0.25} if sensors.get("emergency_stop") is True else out
+
+        spec = StressSpec(faults=tuple(make_faults(["drift", "estop", "spike"], estop={"rate": 0.02})), ticks=2000)
+        with mock.patch.object(Runtime, "compute", leaky):
+            res = run_stress(spec, 3, seed=0, workers=1)
+            self.assertEqual(res.failed_trials, 3)
+            (f, count), = res.failures
+            self.assertEqual((f.invariant, f.faults, count), ("u_zero", ("estop",), 3))
+            self.assertIs(f.frame["emergency_stop"], True)
+            _, again = run_trial(f.seed, spec, faults=[spec.faults[1]], ticks=f.ticks)
+            self.assertEqual((again.invariant, again.tick), (f.invariant, f.tick))
+            n, none = run_trial(f.seed, spec, faults=[spec.faults[1]], ticks=f.tick)
+            self.assertEqual((n, none), (f.tick, None))
+
+    def test_pool_matches_serial(self):
+        spec = StressSpec(faults=tuple(make_faults(["garbage", "spike"])), ticks=400)
+        a, b = run_stress(spec, 6, workers=1).to_dict(), run_stress(spec, 6, workers=2, chunk_size=1).to_dict()
+        for d in (a, b):
+            d.pop("wall_s")
+            d.pop("workers")
+        self.assertEqual(a, b)
+
+
+if __name__ == "__main__":
+    unittest.main()
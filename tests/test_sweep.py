@@ -0,0 +1,87 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from controller.amnion_controller import AmnionController
+from controller.io import sweep
+from controller.io.sensor_stub import SensorStub
+from controller.io.sweep import SweepPoint, SweepTable, grid, latin_hypercube, resolve_field, run_point, run_sweep
+from controller.runtime import Runtime, RuntimeConfig
+from controller.safety_gate import SafetyConfig, SafetyGate
+
+
+class TestSweep(unittest.TestCase):
+    def test_specifications(self):
+        self.assertEqual(resolve_field("Q_crit"), ("safety", "Q_crit"))
+        self.assertEqual(resolve_field("runtime.P_budget_min"), ("runtime", "P_budget_min"))
+        for bad in ("P_budget_min", "lawx_throttle_to", "safety.nope"):
+            with self.assertRaises(ValueError):
+                resolve_field(bad)
+
+        pts = grid({"Q_crit": [0.4, 0.5], "u_nominal": [0.3, 0.5, 0.7]}, ticks=10)
+        self.assertEqual(len(pts), 6)
+        self.assertEqual(pts[1].params, (("safety.Q_crit", 0.4), ("runtime.u_nominal", 0.5)))
+        self.assertEqual(pts[1].overrides(), {"safety": {"Q_crit": 0.4}, "runtime": {"u_nominal": 0.5}})
+
+        n = 16
+        lhs = latin_hypercube({"phase_trip": (0.1, 0.5), "u_nominal": (0.2, 0.8)}, n, seed=3)
+        self.assertEqual(lhs, latin_hypercube({"phase_trip": (0.1, 0.5), "u_nominal": (0.2, 0.8)}, n, seed=3))
+        for k, (lo, hi) in enumerate([(0.1, 0.5), (0.2, 0.8)]):
+            strata = sorted(int((p.params[k][1] - lo) / (hi - lo) * n) for p in lhs)
+            self.assertEqual(strata, list(range(n)))  # one sample per stratum
+
+    def test_config_hash_tracks_resolved_config(self):
+        a = SweepPoint(0, (("safety.Q_crit", 0.5),), ticks=10)
+        b = SweepPoint(7, (("Q_crit", 0.5),), ticks=10)  # default value, other id / spelling
+        self.assertEqual(a.config_hash, b.config_hash)
+        self.assertEqual(a.config_hash, SweepPoint(1, (), ticks=10).config_hash)
+        self.assertNotEqual(a.config_hash, SweepPoint(0, (("safety.Q_crit", 0.6),), ticks=10).config_hash)
+        self.assertNotEqual(a.config_hash, SweepPoint(0, (("safety.Q_crit", 0.5),), ticks=11).config_hash)
+
+    def test_summary_matches_controller_loop(self):
+        point = SweepPoint(0, (("safety.Q_crit", 0.8), ("runtime.u_nominal", 0.4)), ticks=1200)
+        s = run_point(point)
+
+        ctrl = AmnionController(safety=SafetyGate(SafetyConfig(Q_crit=0.8)),
+                                runtime=Runtime(RuntimeConfig(u_nominal=0.4)))
+        sensor = SensorStub()
+        outs = [ctrl.step(sensor.read()) for _ in range(1200)]
+        states = [o["state"] for o in outs]
+        self.assertEqual(s["ticks_s0"], states.count("S0_NORMAL"))
+        self.assertEqual(s["ticks_s2"], states.count("S2_BARRIER"))
+        self.assertEqual(s["first_escalation"], states.index("S2_BARRIER"))
+        self.assertEqual(s["violations"], ctrl.metrics.violations)
+        self.assertEqual(s["trips_Q_crit"], s["ticks_s2"])
+        self.assertAlmostEqual(s["mean_u"], sum(o["u_control"] for o in outs) / 1200)
+
+    def test_pool_resume_and_table(self):
+        points = grid({"Q_crit": [0.5, 0.85, 0.5], "rate_limit": [0.005, 0.02]}, ticks=300)
+        with tempfile.TemporaryDirectory() as tmp:
+            journal = os.path.join(tmp, "j.jsonl")
+            serial = run_sweep(points, workers=1)
+            self.assertEqual((serial.computed, serial.cached), (4, 2))  # repeated Q_crit=0.5 row
+
+            pooled = run_sweep(points, workers=2, chunk_size=1, journal_path=journal)
+            for name, col in serial.table.columns.items():
+                self.assertEqual(col.tolist(), pooled.table.columns[name].tolist(), name)
+            self.assertEqual({**serial.table.row(0), "point_id": 4}, serial.table.row(4))
+
+            with open(journal, "a", encoding="utf-8") as f:
+                f.write('{"format": 1, "hash": "torn')  # interrupted append
+            with mock.patch.object(sweep, "run_point", side_effect=AssertionError("recomputed")):
+                resumed = run_sweep(points, workers=1, journal_path=journal)
+            self.assertEqual((resumed.computed, resumed.cached), (0, 6))
+
+            more = grid({"Q_crit": [0.5, 0.85, 0.6], "rate_limit": [0.005, 0.02]}, ticks=300)
+            self.assertEqual(run_sweep(more, workers=1, journal_path=journal).computed, 2)
+            self.assertEqual(len(sweep.load_journal(journal)), 6)  # appended after the torn line
+
+            path = pooled.table.save(os.path.join(tmp, "t.npz"))
+            loaded = SweepTable.load(path)
+            self.assertEqual(loaded.params, ("safety.Q_crit", "safety.rate_limit"))
+            self.assertEqual(loaded.row(3), pooled.table.row(3))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import gc
+import os
+import tracemalloc
+import unittest
+
+from controller.amnion_controller import AmnionController
+from controller.io.sensor_stub import SensorStub
+from controller.tick_context import TickView
+
+_PKG = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TestTickContext(unittest.TestCase):
+    def test_view_matches_legacy_metrics_payload(self):
+        ctrl = AmnionController()
+        frame = SensorStub().read()
+        out = ctrl.step(frame)
+        ctx = ctrl.context
+        view = ctx.view
+        self.assertIsInstance(view, TickView)
+        self.assertEqual(view["derived_metrics"], out["derived_metrics"])
+        self.assertEqual(view["sensor_frame"]["Q"], frame["Q"])
+        self.assertEqual(view.get("r_order"), ctx.resonance.r_order)
+        self.assertIn("abraxas_violation_count", view)
+        self.assertEqual(list(view)[-2:], ["sensor_frame", "derived_metrics"])
+        self.assertEqual(len(view), len(ctx.sensors) + 2)
+        self.assertNotIn("r_order", frame)  # caller's dict is never enriched
+
+        kept = view.detach()
+        ctrl.step({"Q": 0.1})
+        self.assertEqual(kept["sensor_frame"]["Q"], frame["Q"])
+        self.assertEqual(view["sensor_frame"]["Q"], 0.1)
+
+    def test_steady_state_tick_allocations_are_bounded(self):
+        ctrl = AmnionController()
+        stub = SensorStub()
+        frames = [stub.read() for _ in range(2500)]
+        for f in frames[:500]:
+            ctrl.step(f)
+        gc.collect()
+
+        tracemalloc.start()
+        try:
+            peaks = []
+            for f in frames[500:600]:
+                tracemalloc.reset_peak()
+                cur, _ = tracemalloc.get_traced_memory()
+                ctrl.step(f)
+                peaks.append(tracemalloc.get_traced_memory()[1] - cur)
+            gc.collect()
+            before = tracemalloc.take_snapshot()
+            for f in frames[600:]:
+                ctrl.step(f)
+            gc.collect()
+            after = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+
+        # transient working set of one tick (the returned payload included)
+        peaks.sort()
+        self.assertLess(peaks[len(peaks) // 2], 2048)
+        # nothing accumulates per tick once the metrics ring is warm
+        flt = [tracemalloc.Filter(True, os.path.join(_PKG, "controller", "*"))]
+        diff = after.filter_traces(flt).compare_to(before.filter_traces(flt), "filename")
+        self.assertLessEqual(sum(d.count_diff for d in diff), 16)
+        self.assertLess(sum(d.size_diff for d in diff), 4096)
+
+
+if __name__ == "__main__":
+    unittest.main()
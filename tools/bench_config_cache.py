@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Benchmark: load_config() cold vs warm.
+
+  pure-python  previous behavior (yaml.safe_load + deep merge, re-created here)
+  parse        current loader without the cache (libyaml loader when available)
+  cold         empty cache folder: parse + write the cache entry
+  warm         cache hit: read + hash the files, unpickle the merged config
+  schema *     config_schema.validate_configs(): fresh (compile + validate),
+               compiled (validators cached, results not), warm (result-cache hit),
+               threads (fresh, one thread per file)
+  process      fresh interpreter running load_config(), warm cache (startup cost,
+               schema check included)
+
+Usage:
+  python tools/bench_config_cache.py
+  python tools/bench_config_cache.py --repeat 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import yaml  # noqa: E402
+
+from controller import config_loader, config_schema  # noqa: E402
+from controller.config_loader import DEFAULT_CONFIG_DIR, DEFAULT_CONFIG_FILES, load_config  # noqa: E402
+
+
+def _pure_python() -> dict:
+    merged: dict = {}
+    for name in DEFAULT_CONFIG_FILES:
+        with open(DEFAULT_CONFIG_DIR / name, "r", encoding="utf-8") as f:
+            merged = config_loader._deep_merge(merged, yaml.safe_load(f) or {})
+    config_loader._validate_basic(merged)
+    return merged
+
+
+def _best_ms(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1e3
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--repeat", type=int, default=20)
+    args = ap.parse_args()
+
+    tmp = Path(tempfile.mkdtemp())
+    try:
+        cache = tmp / "cache"
+
+        def cold() -> None:
+            shutil.rmtree(cache, ignore_errors=True)
+            load_config(cache_dir=cache, validate="off")
+
+        rows = [
+            ("pure-python", _best_ms(_pure_python, args.repeat)),
+            ("parse", _best_ms(lambda: load_config(use_cache=False, validate="off"), args.repeat)),
+            ("cold", _best_ms(cold, args.repeat)),
+        ]
+        load_config(cache_dir=cache, validate="off")
+        rows.append(("warm", _best_ms(lambda: load_config(cache_dir=cache, validate="off"), args.repeat)))
+
+        def schema_fresh(jobs: int) -> None:
+            config_schema._VALIDATORS.clear()
+            config_schema.validate_configs(use_cache=False, jobs=jobs)
+
+        rows.append(("schema fresh", _best_ms(lambda: schema_fresh(1), args.repeat)))
+        rows.append(("schema threads", _best_ms(lambda: schema_fresh(len(config_schema.SCHEMA_MAP)), args.repeat)))
+        rows.append(("schema compiled", _best_ms(lambda: config_schema.validate_configs(use_cache=False, jobs=1),
+                                                 args.repeat)))
+        config_schema.validate_configs(cache_dir=cache)
+        rows.append(("schema warm", _best_ms(lambda: config_schema.validate_configs(cache_dir=cache), args.repeat)))
+
+        code = "from controller.config_loader import load_config; load_config()"
+        env = {**os.environ, config_loader.CACHE_ENV: str(cache), "PYTHONPATH": str(ROOT)}
+
+        def proc(env=env) -> None:
+            subprocess.run([sys.executable, "-c", code], env=env, check=True)
+
+        base = _best_ms(lambda: subprocess.run([sys.executable, "-c", "import yaml"], check=True), 5)
+        rows.append(("process warm", _best_ms(proc, 5) - base))
+        rows.append(("process parse", _best_ms(lambda: proc({**env, config_loader.CACHE_ENV: "0"}), 5) - base))
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    print(f"libyaml loader: {config_loader._yaml_loader().__name__}")
+    print(f"{'load':<16} {'ms':>8}")
+    for label, ms in rows:
+        print(f"{label:<16} {ms:>8.2f}")
+    print("(process rows: minus a bare 'import yaml' interpreter start)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
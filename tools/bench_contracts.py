@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Benchmark: memory per frame for the controller contracts.
+
+Compares the previous plain dataclasses (per-instance __dict__, re-created here
+as a reference), the slotted contracts and their structured record arrays
+(controller/contracts.py), measured with tracemalloc over a batch of frames
+captured from AmnionController.step(). Instance rows count the object (and its
+__dict__) only: the boxed float fields they point to (24 B each) come on top.
+
+Usage:
+  python tools/bench_contracts.py
+  python tools/bench_contracts.py --frames 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+import tracemalloc
+from dataclasses import fields, make_dataclass
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from controller.amnion_controller import AmnionController  # noqa: E402
+from controller.contracts import (  # noqa: E402
+    ControlOutput,
+    DerivedMetrics,
+    SafetyState,
+    SensorFrame,
+    from_records,
+    to_records,
+)
+from controller.io.sensor_stub import SensorStub  # noqa: E402
+
+CONTRACTS = (SensorFrame, DerivedMetrics, SafetyState, ControlOutput)
+
+
+def _legacy(cls: type) -> type:
+    """Previous layout: plain @dataclass, one __dict__ per instance."""
+    return make_dataclass(cls.__name__, [(f.name, f.type, f.default) for f in fields(cls)])
+
+
+def _capture(n: int, window: int) -> dict:
+    """Field tuples of the contracts built by step(), for `window` ticks, cycled to n."""
+    stub, ctrl = SensorStub(), AmnionController()
+    rows: dict = {cls: [] for cls in CONTRACTS}
+    for _ in range(window):
+        ctrl.step(stub.read())
+        ctx = ctrl.context
+        for cls, obj in zip(CONTRACTS, (ctx.sensor_frame, ctx.derived, ctx.safety_state, ctx.output)):
+            rows[cls].append(tuple(getattr(obj, f.name) for f in fields(obj)))
+    # fresh float objects per frame, as in a real capture
+    return {cls: [tuple(float(v) if type(v) is float else v for v in r[i % window]) for i in range(n)]
+            for cls, r in rows.items()}
+
+
+def _measure(build) -> tuple:
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    t0 = time.perf_counter()
+    obj = build()
+    dt = time.perf_counter() - t0
+    used = tracemalloc.get_traced_memory()[0] - base
+    tracemalloc.stop()
+    del obj
+    return used, dt
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--frames", type=int, default=100_000)
+    ap.add_argument("--window", type=int, default=2000)
+    args = ap.parse_args()
+
+    n = args.frames
+    captured = _capture(n, args.window)
+    print(f"frames={n}")
+    print(f"{'contract':<16} {'layout':<14} {'bytes/frame':>12} {'build ms':>10}")
+    for cls in CONTRACTS:
+        rows = captured[cls]
+        legacy = _legacy(cls)
+        slotted = [cls(*r) for r in rows]
+        cases = (
+            ("dataclass", lambda: [legacy(*r) for r in rows]),
+            ("slots", lambda: [cls(*r) for r in rows]),
+            ("record array", lambda: to_records(slotted, cls)),
+        )
+        for label, build in cases:
+            used, dt = _measure(build)
+            print(f"{cls.__name__:<16} {label:<14} {used / n:>12.1f} {dt * 1e3:>10.1f}")
+        t0 = time.perf_counter()
+        back = from_records(to_records(slotted, cls), cls).to_list()
+        assert back[: args.window] == slotted[: args.window]
+        print(f"{'':<16} {'-> instances':<14} {'':>12} {(time.perf_counter() - t0) * 1e3:>10.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
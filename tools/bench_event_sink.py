@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-tick logging cost and bytes on disk, JsonlSink vs BinarySink.
+
+A window of real controller ticks is recorded once and cycled, so only the
+sink is timed (the controller itself is not part of the measurement). The
+driver loop overhead is measured with a null sink and subtracted.
+
+Usage:
+  python tools/bench_event_sink.py
+  python tools/bench_event_sink.py --ticks 1000000 --out-dir /tmp/amnion_bench
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from controller.amnion_controller import AmnionController  # noqa: E402
+from controller.io.event_sink import BinarySink, JsonlSink  # noqa: E402
+from controller.io.sensor_stub import SensorStub  # noqa: E402
+
+
+def _record(window: int) -> list:
+    stub, ctrl = SensorStub(), AmnionController()
+    frames = []
+    for _ in range(window):
+        s = stub.read()
+        out = ctrl.step(s)
+        frames.append((s, out, dict(out)))
+    return frames
+
+
+class _NullSink:
+    def write(self, *args) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+def _run(sink, frames: list, ticks: int) -> tuple:
+    """(producer seconds, total seconds incl. close/flush)"""
+    w = len(frames)
+    t0 = time.perf_counter()
+    for i in range(ticks):
+        s, out, last = frames[i % w]
+        sink.write(i, 1.7e9 + i * 1e-3, i * 1e-3, s, out, last, 1)
+    t1 = time.perf_counter()
+    sink.close()
+    return t1 - t0, time.perf_counter() - t0
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--ticks", type=int, default=1_000_000)
+    ap.add_argument("--window", type=int, default=200_000,
+                    help="Distinct recorded ticks to cycle (keep above a chunk: repeats inflate the bytes ratio)")
+    ap.add_argument("--out-dir", default="")
+    ap.add_argument("--repeat", type=int, default=3, help="Runs per sink; best is reported")
+    args = ap.parse_args()
+
+    frames = _record(args.window)
+    out_dir = args.out_dir or tempfile.mkdtemp(prefix="amnion_sink_")
+    os.makedirs(out_dir, exist_ok=True)
+
+    reps = max(1, args.repeat)
+    overhead = min(_run(_NullSink(), frames, args.ticks)[0] for _ in range(reps))
+
+    rows = []
+    for label, make, name in (
+        ("jsonl", JsonlSink, "events.jsonl"),
+        ("binary", BinarySink, "events.bin"),
+    ):
+        path = os.path.join(out_dir, name)
+        runs = [_run(make(path), frames, args.ticks) for _ in range(reps)]
+        prod, total = min(r[0] for r in runs), min(r[1] for r in runs)
+        rows.append((label, max(1e-9, prod - overhead), max(1e-9, total - overhead), os.path.getsize(path)))
+
+    base_s, base_b = rows[0][1], rows[0][3]
+    print(f"ticks={args.ticks} best of {reps} dir={out_dir} loop_overhead={overhead / args.ticks * 1e6:.2f} us/tick (subtracted)")
+    print("producer = cost seen by the control loop; total = incl. background flush/compression")
+    print(f"{'sink':<8} {'producer us':>12} {'total us':>9} {'bytes/tick':>11} {'producer x':>11} {'bytes x':>8}")
+    for label, prod, total, size in rows:
+        print(
+            f"{label:<8} {prod / args.ticks * 1e6:>12.2f} {total / args.ticks * 1e6:>9.2f} "
+            f"{size / args.ticks:>11.1f} {base_s / prod:>11.1f} {base_b / size:>8.1f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark: SafetyGate.evaluate() vs the compiled guard program
+(controller/guard_engine.py) built from configs/02_safety.yaml.
+
+Usage:
+  python tools/bench_guard.py
+  python tools/bench_guard.py --ticks 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from controller.guard_engine import GuardEngine, load_guard_engine  # noqa: E402
+from controller.io.sensor_stub import SensorStub  # noqa: E402
+from controller.safety_gate import SafetyGate  # noqa: E402
+
+
+def _bench(label: str, fn, items: list, repeat: int) -> None:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for it in items:
+            fn(it)
+        best = min(best, time.perf_counter() - t0)
+    ns = best / len(items) * 1e9
+    print(f"{label:<34} {ns:>9.0f} ns/tick  {len(items) / best:>12.0f} ticks/s")
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--ticks", type=int, default=100_000)
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    stub = SensorStub()
+    frames = [stub.read() for _ in range(args.ticks)]
+
+    gate = SafetyGate()
+    engine = load_guard_engine()
+    vectors = [GuardEngine.observe(f) for f in frames]
+
+    print(f"ticks={args.ticks} repeat={args.repeat} (best of)")
+    _bench("SafetyGate.evaluate", gate.evaluate, frames, args.repeat)
+    _bench("GuardEngine.observe + step", lambda f: engine.step(engine.observe(f)), frames, args.repeat)
+    _bench("GuardEngine.step (pre-extracted)", engine.step, vectors, args.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark: per-ensemble KuramotoModel.step loops vs KuramotoBatch.integrate
+(controller/coherence_model.py).
+
+Usage:
+  python tools/bench_kuramoto.py
+  python tools/bench_kuramoto.py --ensembles 4000 --oscillators 64 --steps 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from controller.coherence_model import KuramotoModel  # noqa: E402
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--ensembles", type=int, default=2000)
+    ap.add_argument("--oscillators", type=int, default=64)
+    ap.add_argument("--steps", type=int, default=500)
+    ap.add_argument("--loop-cap", type=int, default=100, help="Ensembles timed with the step() loop")
+    args = ap.parse_args()
+
+    rng = np.random.default_rng(0)
+    phases = rng.uniform(0.0, 2.0 * np.pi, (args.ensembles, args.oscillators))
+    model = KuramotoModel()
+
+    n_loop = min(args.loop_cap, args.ensembles)
+    t0 = time.perf_counter()
+    for i in range(n_loop):
+        p = phases[i]
+        for _ in range(args.steps):
+            p = model.step(p)
+            np.abs(np.mean(np.exp(1j * p)))
+    loop_s = (time.perf_counter() - t0) * args.ensembles / n_loop
+
+    batch = model.batch(phases)
+    t0 = time.perf_counter()
+    batch.integrate(args.steps)
+    batch_s = time.perf_counter() - t0
+
+    total = args.ensembles * args.steps
+    print(f"ensembles={args.ensembles} oscillators={args.oscillators} steps={args.steps}")
+    print(f"step() loop (extrapolated from {n_loop}) {loop_s:>9.3f} s  {total / loop_s:>12.0f} ens-steps/s")
+    print(f"KuramotoBatch.integrate          {batch_s:>9.3f} s  {total / batch_s:>12.0f} ens-steps/s")
+    print(f"speedup x{loop_s / batch_s:.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
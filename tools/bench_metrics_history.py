@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Metrics.update() append cost and retained memory per tick.
+
+Compares the columnar ring (controller/metrics_history.py) with the previous
+list-of-dicts history (re-created here as a reference: summary dict per tick,
+list append, re-slice past max_history).
+
+Usage:
+  python tools/bench_metrics_history.py
+  python tools/bench_metrics_history.py --history 100000 --ticks 300000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from controller.amnion_controller import AmnionController  # noqa: E402
+from controller.io.sensor_stub import SensorStub  # noqa: E402
+from controller.metrics import Metrics, MetricsConfig  # noqa: E402
+from controller.metrics_history import BYTES_PER_TICK  # noqa: E402
+
+
+class _ListHistory:
+    """Previous behavior: dict summary per tick + O(n) re-slice."""
+
+    def __init__(self, max_history: int):
+        self.max_history = max_history
+        self.history: list = []
+        self.ticks = 0
+
+    def update(self, sensors: dict, safety: dict, output: dict) -> None:
+        self.ticks += 1
+        summary = {
+            "tick": self.ticks,
+            "ok": bool(safety.get("ok")),
+            "violations_total": 0,
+            "state": safety.get("state"),
+            "allow_control": safety.get("allow_control"),
+            "coherence": sensors.get("coherence"),
+            "phase": sensors.get("phase"),
+            "power_in": float(sensors["P_in"]),
+            "power_draw": float(sensors["P_draw"]),
+            "mismatch_power": safety.get("mismatch_power"),
+            "mismatch_phase": safety.get("mismatch_phase"),
+            "flags": list(safety.get("flags", [])),
+            "u_cmd": output.get("u_cmd"),
+            "G": output.get("G"),
+            "K": output.get("K"),
+            "D": output.get("D"),
+            "P_budget": output.get("P_budget"),
+        }
+        self.history.append(summary)
+        if len(self.history) > self.max_history:
+            self.history = self.history[-self.max_history :]
+
+
+def _inputs(window: int) -> list:
+    stub, ctrl = SensorStub(), AmnionController()
+    out = []
+    for _ in range(window):
+        s = ctrl.safety.sanitize_inputs(stub.read())
+        out.append((s, ctrl.safety.evaluate(s), ctrl.step(s)))
+    return out
+
+
+def _time(m, inputs: list, ticks: int) -> float:
+    w = len(inputs)
+    t0 = time.perf_counter()
+    for i in range(ticks):
+        s, safety, out = inputs[i % w]
+        m.update(s, safety, out)
+    return (time.perf_counter() - t0) / ticks * 1e9
+
+
+def _retained(make, inputs: list, history: int) -> float:
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    m = make()
+    w = len(inputs)
+    for i in range(history):
+        s, safety, out = inputs[i % w]
+        m.update(s, safety, out)
+    used = tracemalloc.get_traced_memory()[0] - base
+    tracemalloc.stop()
+    del m
+    return used / history
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--history", type=int, default=100_000, help="max_history")
+    ap.add_argument("--ticks", type=int, default=200_000)
+    ap.add_argument("--window", type=int, default=2000)
+    args = ap.parse_args()
+
+    inputs = _inputs(args.window)
+
+    def ring() -> Metrics:
+        return Metrics(cfg=MetricsConfig(max_history=args.history))
+
+    def legacy() -> _ListHistory:
+        return _ListHistory(args.history)
+
+    print(f"max_history={args.history} ticks={args.ticks}  (ring dtype itemsize: {BYTES_PER_TICK} B)")
+    print(f"{'history':<12} {'ns/update':>10} {'bytes/retained tick':>20}")
+    for label, make in (("list[dict]", legacy), ("ring", ring)):
+        ns = _time(make(), inputs, args.ticks)
+        per_tick = _retained(make, inputs, args.history)
+        print(f"{label:<12} {ns:>10.0f} {per_tick:>20.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
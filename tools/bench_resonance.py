@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark: from_sensors() over the full phase window every tick vs
+ResonanceStream.update() with only the new samples (controller/resonance_model.py).
+
+Usage:
+  python tools/bench_resonance.py
+  python tools/bench_resonance.py --window 8192 --per-tick 64
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from controller.resonance_model import ResonanceStream, from_sensors  # noqa: E402
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--window", type=int, default=4096)
+    ap.add_argument("--per-tick", type=int, default=32, help="New phase samples per tick")
+    ap.add_argument("--ticks", type=int, default=5000)
+    args = ap.parse_args()
+
+    rng = np.random.default_rng(0)
+    total = args.window + args.per_tick * args.ticks
+    phases = rng.normal(0.0, 0.3, total)
+
+    t0 = time.perf_counter()
+    for i in range(args.ticks):
+        end = args.window + (i + 1) * args.per_tick
+        from_sensors({"phase_samples": phases[end - args.window : end]})
+    full_s = time.perf_counter() - t0
+
+    stream = ResonanceStream(args.window)
+    stream.push(phases[: args.window])
+    t0 = time.perf_counter()
+    for i in range(args.ticks):
+        start = args.window + i * args.per_tick
+        stream.update({"phase_samples": phases[start : start + args.per_tick]})
+    stream_s = time.perf_counter() - t0
+
+    print(f"window={args.window} per_tick={args.per_tick} ticks={args.ticks}")
+    print(f"from_sensors (full window)  {full_s / args.ticks * 1e6:>9.1f} us/tick")
+    print(f"ResonanceStream.update      {stream_s / args.ticks * 1e6:>9.1f} us/tick")
+    print(f"speedup x{full_s / stream_s:.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark: producer-side cost of logging one record per control tick.
+
+  print    - Logger: json.dumps + print per event (stdout redirected to a file)
+  run      - RunLogger.metrics(): enqueue only; encoding, sha256 and disk
+             writes happen on the writer thread (drain time reported separately)
+
+Usage:
+  python tools/bench_run_logger.py
+  python tools/bench_run_logger.py --records 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from controller.logger import Logger, RunLogger  # noqa: E402
+
+
+def _percentile(xs: list, q: float) -> float:
+    xs = sorted(xs)
+    return xs[min(len(xs) - 1, int(len(xs) * q / 100.0))]
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--records", type=int, default=50_000)
+    args = ap.parse_args()
+    n = args.records
+    record = {"mismatch_power": 0.012345678, "mismatch_phase": 0.5, "coherence_score": 0.93, "u_control": 0.4}
+    tmp = Path(tempfile.mkdtemp())
+    clock = time.perf_counter_ns
+    try:
+        lat = []
+        with open(tmp / "stdout.jsonl", "w", encoding="utf-8") as out, contextlib.redirect_stdout(out):
+            log = Logger("bench")
+            t0 = time.perf_counter()
+            for i in range(n):
+                s = clock()
+                log.info("tick", record)
+                lat.append(clock() - s)
+            dt_print = time.perf_counter() - t0
+        print(f"print   : {dt_print / n * 1e6:7.2f} us/record  p99 {_percentile(lat, 99) / 1e3:7.2f} us")
+
+        lat = []
+        run = RunLogger(root_dir=str(tmp / "logs"))
+        t0 = time.perf_counter()
+        for i in range(n):
+            s = clock()
+            run.metrics(dict(record), tick=i)
+            lat.append(clock() - s)
+        dt_run = time.perf_counter() - t0
+        t1 = time.perf_counter()
+        run.close()
+        drain = time.perf_counter() - t1
+        print(f"run     : {dt_run / n * 1e6:7.2f} us/record  p99 {_percentile(lat, 99) / 1e3:7.2f} us  "
+              f"(close/drain {drain * 1e3:.0f} ms, dropped {run.dropped})")
+    finally:
+        shutil.rmtree(tmp, True)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
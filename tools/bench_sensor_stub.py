@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Benchmark: SensorStub.read() per frame vs read_batch() per chunk.
+
+  read      one dict per call (math.sin / math.cos + clock() per frame)
+  batch     read_batch(start, chunk): fresh column arrays per chunk
+  buffers   read_batch(start, chunk, out=buf): preallocated columns reused
+
+Usage:
+  python tools/bench_sensor_stub.py
+  python tools/bench_sensor_stub.py --frames 1000000 --chunk 8192
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from controller.io.sensor_stub import SensorStub  # noqa: E402
+
+
+def _best_s(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--frames", type=int, default=200_000)
+    ap.add_argument("--chunk", type=int, default=4096)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+    n, chunk = args.frames, args.chunk
+
+    def read() -> None:
+        stub = SensorStub()
+        for _ in range(n):
+            stub.read()
+
+    def batch() -> None:
+        stub = SensorStub()
+        for start in range(0, n, chunk):
+            stub.read_batch(start, min(chunk, n - start))
+
+    def buffers() -> None:
+        stub = SensorStub()
+        buf = stub.alloc_batch(chunk)
+        for start in range(0, n, chunk):
+            stub.read_batch(start, min(chunk, n - start), out=buf)
+
+    base = _best_s(read, args.repeat)
+    print(f"{'source':<8} {'ns/frame':>9} {'speedup':>8}")
+    for label, fn in (("read", read), ("batch", batch), ("buffers", buffers)):
+        s = base if fn is read else _best_s(fn, args.repeat)
+        print(f"{label:<8} {s / n * 1e9:>9.1f} {base / s:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Benchmark: AmnionController.step() loop vs step_batch() on columnar frames.
+
+The per-frame loop is timed on at most --loop-cap frames and extrapolated
+linearly for larger sizes (10^7 dict ticks would take minutes).
+
+Usage:
+  python tools/bench_step_batch.py
+  python tools/bench_step_batch.py --sizes 10000 100000 1000000 10000000 --loop-cap 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from controller.amnion_controller import AmnionController  # noqa: E402
+from controller.batch import SensorColumns  # noqa: E402
+from controller.io.sensor_stub import SensorStub  # noqa: E402
+
+
+def make_columns(n: int) -> dict:
+    # SensorStub frames for ticks 0..n-1 ("ts" is not a controller input)
+    cols = SensorStub().read_batch(0, n)
+    del cols["ts"]
+    return cols
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sizes", nargs="*", type=int, default=[10_000, 100_000, 1_000_000, 10_000_000])
+    ap.add_argument("--loop-cap", type=int, default=20_000, help="Max frames timed through step()")
+    args = ap.parse_args()
+
+    print(f"{'frames':>10}  {'step() s':>10}  {'batch s':>9}  {'batch fps':>12}  {'speedup':>8}")
+    for n in args.sizes:
+        cols = SensorColumns.from_mapping(make_columns(n))
+
+        m = min(n, args.loop_cap)
+        frames = [cols.frame(i) for i in range(m)]
+        ctrl = AmnionController()
+        t0 = time.perf_counter()
+        for frame in frames:
+            ctrl.step(frame)
+        loop_s = (time.perf_counter() - t0) * (n / m)
+
+        t0 = time.perf_counter()
+        AmnionController().step_batch(cols)
+        batch_s = time.perf_counter() - t0
+
+        est = "~" if m < n else " "
+        print(f"{n:>10}  {est}{loop_s:>9.3f}  {batch_s:>9.3f}  {n / batch_s:>12.0f}  {loop_s / batch_s:>7.0f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -5,24 +5,44 @@ AMNION release packer (canonical).
 Creates a release ZIP with:
 - source snapshot (selected folders/files)
 - SHA256 manifest
-- minimal metadata (timestamp, git sha if available)
+- minimal metadata (source timestamp, git sha if available)
+
+Each file is read once (mmap above MMAP_MIN): the same pass feeds sha256, the
+zip CRC and the deflate stream, on a thread pool (hashlib / zlib release the
+interpreter lock on large buffers). The archive is deterministic: sorted
+entries, fixed entry timestamps and permissions, and a timestamp taken from
+--timestamp, SOURCE_DATE_EPOCH or the HEAD commit, so identical inputs give a
+byte-identical zip.
+
+--incremental reuses the previous archive at --out: files whose size and
+mtime match its index sidecar (<out>.index.json) are copied compressed from
+it without being read, and keep their recorded digest.
 
 Usage:
   python tools/pack_release.py --out dist/amnion_oracle_release.zip
   python tools/pack_release.py --out dist/amnion_oracle_release.zip --include docs schemas configs controller amnion_oracle tools tests README.md LICENSE
+  python tools/pack_release.py --out dist/amnion_oracle_release.zip --incremental --jobs 8
 """
 
 from __future__ import annotations
 
 import argparse
 import hashlib
+import json
+import mmap
+import os
+import shutil
+import struct
 import subprocess
 import sys
+import tempfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterable
-from zipfile import ZIP_DEFLATED, ZipFile
+from typing import IO, Dict, Iterable, Optional
+from zipfile import ZIP64_LIMIT, ZIP_DEFLATED, ZipFile, ZipInfo
 
 
 DEFAULT_INCLUDE = [
@@ -40,6 +60,18 @@ DEFAULT_INCLUDE = [
     "requirements-dev.txt",
 ]
 
+# Fixed per-entry metadata (zip timestamps are local DOS time; 1980-01-01 is the epoch)
+ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+ZIP_FILE_MODE = 0o100644
+COMPRESS_LEVEL = 6  # zlib default (what ZipFile.write uses for ZIP_DEFLATED)
+
+CHUNK = 1 << 20
+MMAP_MIN = 1 << 20  # files at least this large are mmapped
+SPOOL_MAX = 8 << 20  # compressed data above this spills to a temp file until written
+INDEX_FORMAT = 1
+
+_LOCAL_HEADER = struct.Struct("<4s5H3L2H")  # zip local file header (30 bytes)
+
 
 @dataclass(frozen=True)
 class Item:
@@ -47,10 +79,24 @@ class Item:
     arcname: str  # path inside zip
 
 
+@dataclass
+class Packed:
+    """One file, hashed and compressed (or located in the previous archive)."""
+
+    item: Item
+    size: int
+    mtime_ns: int
+    sha256: str
+    crc: int
+    compress_size: int
+    data: Optional[IO[bytes]] = None  # compressed stream (fresh)
+    prev_offset: int = -1  # offset of the compressed data in the previous archive (reused)
+
+
 def sha256_file(p: Path) -> str:
     h = hashlib.sha256()
     with p.open("rb") as f:
-        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+        for chunk in iter(lambda: f.read(CHUNK), b""):
             h.update(chunk)
     return h.hexdigest()
 
@@ -65,6 +111,22 @@ def git_sha() -> str:
     return "unknown"
 
 
+def source_timestamp(explicit: Optional[str] = None) -> str:
+    """--timestamp, else SOURCE_DATE_EPOCH, else the HEAD commit time, else now (UTC)."""
+    if explicit:
+        return explicit
+    epoch = os.environ.get("SOURCE_DATE_EPOCH")
+    if not epoch:
+        try:
+            epoch = subprocess.check_output(
+                ["git", "log", "-1", "--format=%ct"], stderr=subprocess.DEVNULL, text=True
+            ).strip()
+        except Exception:
+            epoch = None
+    dt = datetime.fromtimestamp(int(epoch), timezone.utc) if epoch else datetime.now(timezone.utc)
+    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
 def iter_files(root: Path, include: Iterable[str]) -> list[Item]:
     items: list[Item] = []
     for entry in include:
@@ -99,7 +161,97 @@ def iter_files(root: Path, include: Iterable[str]) -> list[Item]:
     return items
 
 
-def write_manifest(root: Path, items: list[Item], ts_iso: str, sha: str) -> str:
+def pack_file(item: Item, level: int = COMPRESS_LEVEL) -> Packed:
+    """Single read: sha256, CRC-32 and raw deflate of one file (thread-safe)."""
+    sha = hashlib.sha256()
+    crc = 0
+    comp = zlib.compressobj(level, zlib.DEFLATED, -15)
+    out = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX)
+    with item.path.open("rb") as f:
+        st = os.fstat(f.fileno())
+        if st.st_size >= MMAP_MIN:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                for off in range(0, len(view), CHUNK):
+                    with view[off : off + CHUNK] as chunk:
+                        sha.update(chunk)
+                        crc = zlib.crc32(chunk, crc)
+                        out.write(comp.compress(chunk))
+        else:
+            data = f.read()
+            sha.update(data)
+            crc = zlib.crc32(data)
+            out.write(comp.compress(data))
+    out.write(comp.flush())
+    compress_size = out.tell()
+    out.seek(0)
+    return Packed(item, st.st_size, st.st_mtime_ns, sha.hexdigest(), crc, compress_size, data=out)
+
+
+def _zipinfo(arcname: str) -> ZipInfo:
+    zinfo = ZipInfo(arcname, date_time=ZIP_DATE_TIME)
+    zinfo.compress_type = ZIP_DEFLATED
+    zinfo.create_system = 3  # unix, on every platform
+    zinfo.external_attr = ZIP_FILE_MODE << 16
+    return zinfo
+
+
+def _write_raw(zf: ZipFile, packed: Packed, prev: Optional[IO[bytes]]) -> None:
+    """Append an already-compressed entry (ZipFile.close() writes the central directory)."""
+    zinfo = _zipinfo(packed.item.arcname)
+    zinfo.file_size = packed.size
+    zinfo.compress_size = packed.compress_size
+    zinfo.CRC = packed.crc
+    zip64 = packed.size > ZIP64_LIMIT or packed.compress_size > ZIP64_LIMIT
+    fp = zf.fp
+    zinfo.header_offset = fp.tell()
+    fp.write(zinfo.FileHeader(zip64))
+    if packed.data is not None:
+        shutil.copyfileobj(packed.data, fp, CHUNK)
+        packed.data.close()
+    else:
+        prev.seek(packed.prev_offset)
+        remaining = packed.compress_size
+        while remaining:
+            buf = prev.read(min(CHUNK, remaining))
+            if not buf:
+                raise OSError(f"previous archive truncated at {packed.item.arcname}")
+            fp.write(buf)
+            remaining -= len(buf)
+    zf.filelist.append(zinfo)
+    zf.NameToInfo[zinfo.filename] = zinfo
+    zf.start_dir = fp.tell()
+    zf._didModify = True
+
+
+def index_path(out_path: Path) -> Path:
+    return out_path.with_name(out_path.name + ".index.json")
+
+
+def load_previous(out_path: Path, level: int) -> Dict[str, Dict]:
+    """{arcname: {size, mtime_ns, sha256, crc, compress_size, offset}} reusable from the last run."""
+    try:
+        index = json.loads(index_path(out_path).read_text(encoding="utf-8"))
+        if index.get("format") != INDEX_FORMAT or index.get("level") != level:
+            return {}
+        files = index["files"]
+        reuse: Dict[str, Dict] = {}
+        with ZipFile(out_path) as zf, out_path.open("rb") as raw:
+            for zinfo in zf.infolist():
+                rec = files.get(zinfo.filename)
+                if rec is None or zinfo.compress_type != ZIP_DEFLATED:
+                    continue
+                raw.seek(zinfo.header_offset)
+                header = _LOCAL_HEADER.unpack(raw.read(_LOCAL_HEADER.size))
+                offset = zinfo.header_offset + _LOCAL_HEADER.size + header[-2] + header[-1]
+                reuse[zinfo.filename] = dict(rec, crc=zinfo.CRC, compress_size=zinfo.compress_size, offset=offset)
+        return reuse
+    except (OSError, ValueError, KeyError, TypeError, struct.error):
+        return {}
+
+
+def write_manifest(
+    root: Path, items: list[Item], ts_iso: str, sha: str, digests: Optional[Dict[str, str]] = None
+) -> str:
     lines: list[str] = []
     lines.append("AMNION Release Manifest v1")
     lines.append(f"timestamp_utc: {ts_iso}")
@@ -107,12 +259,72 @@ def write_manifest(root: Path, items: list[Item], ts_iso: str, sha: str) -> str:
     lines.append("")
     lines.append("sha256  path")
     for it in items:
-        digest = sha256_file(it.path)
+        digest = digests[it.arcname] if digests is not None else sha256_file(it.path)
         lines.append(f"{digest}  {it.arcname}")
     lines.append("")
     return "\n".join(lines)
 
 
+def pack(
+    items: list[Item],
+    out_path: Path,
+    ts_iso: str,
+    sha: str,
+    *,
+    jobs: Optional[int] = None,
+    incremental: bool = False,
+    level: int = COMPRESS_LEVEL,
+) -> Dict[str, int]:
+    """Write the release zip (atomically) and its index sidecar; returns counts."""
+    prev = load_previous(out_path, level) if incremental else {}
+
+    packed: list[Optional[Packed]] = [None] * len(items)
+    todo: list[int] = []
+    for i, it in enumerate(items):
+        rec = prev.get(it.arcname)
+        if rec is not None:
+            st = it.path.stat()
+            if st.st_size == rec["size"] and st.st_mtime_ns == rec["mtime_ns"]:
+                packed[i] = Packed(it, st.st_size, st.st_mtime_ns, rec["sha256"], rec["crc"],
+                                   rec["compress_size"], prev_offset=rec["offset"])
+                continue
+        todo.append(i)
+
+    with ThreadPoolExecutor(max_workers=jobs or os.cpu_count() or 1) as pool:
+        for i, p in zip(todo, pool.map(lambda i: pack_file(items[i], level), todo)):
+            packed[i] = p
+    done: list[Packed] = [p for p in packed if p is not None]
+
+    digests = {p.item.arcname: p.sha256 for p in done}
+    manifest_text = write_manifest(out_path.parent, items, ts_iso, sha, digests)
+
+    tmp = out_path.with_name(out_path.name + ".tmp")
+    prev_fp = out_path.open("rb") if any(p.data is None for p in done) else None
+    try:
+        with ZipFile(tmp, "w", compression=ZIP_DEFLATED, compresslevel=level) as zf:
+            # metadata
+            zf.writestr(_zipinfo("RELEASE_META.txt"), f"timestamp_utc: {ts_iso}\ngit_sha: {sha}\n")
+            zf.writestr(_zipinfo("MANIFEST_SHA256.txt"), manifest_text)
+            # files
+            for p in done:
+                _write_raw(zf, p, prev_fp)
+    finally:
+        if prev_fp is not None:
+            prev_fp.close()
+        for p in done:
+            if p.data is not None:
+                p.data.close()
+    os.replace(tmp, out_path)
+
+    index = {
+        "format": INDEX_FORMAT,
+        "level": level,
+        "files": {p.item.arcname: {"size": p.size, "mtime_ns": p.mtime_ns, "sha256": p.sha256} for p in done},
+    }
+    index_path(out_path).write_text(json.dumps(index, sort_keys=True, indent=1) + "\n", encoding="utf-8")
+    return {"files": len(done), "packed": len(todo), "reused": len(done) - len(todo)}
+
+
 def main() -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument("--out", required=True, help="Output zip path, e.g. dist/release.zip")
@@ -122,13 +334,18 @@ def main() -> int:
         default=DEFAULT_INCLUDE,
         help="Paths to include (files/dirs) relative to repo root",
     )
+    ap.add_argument("--jobs", type=int, default=None, help="Worker threads (default: CPU count)")
+    ap.add_argument("--incremental", action="store_true",
+                    help="Reuse unchanged files (size + mtime) from the previous archive at --out")
+    ap.add_argument("--timestamp", default=None,
+                    help="timestamp_utc to record (default: SOURCE_DATE_EPOCH or the HEAD commit time)")
     args = ap.parse_args()
 
     root = Path(__file__).resolve().parents[1]
     out_path = Path(args.out).expanduser().resolve()
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
-    ts_iso = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    ts_iso = source_timestamp(args.timestamp)
     sha = git_sha()
 
     items = iter_files(root, args.include)
@@ -136,18 +353,8 @@ def main() -> int:
         print("Nothing to pack (no include paths found).", file=sys.stderr)
         return 2
 
-    manifest_text = write_manifest(root, items, ts_iso, sha)
-
-    # write zip
-    with ZipFile(out_path, "w", compression=ZIP_DEFLATED) as zf:
-        # metadata
-        zf.writestr("RELEASE_META.txt", f"timestamp_utc: {ts_iso}\ngit_sha: {sha}\n")
-        zf.writestr("MANIFEST_SHA256.txt", manifest_text)
-        # files
-        for it in items:
-            zf.write(it.path, it.arcname)
-
-    print(f"OK: {out_path}")
+    counts = pack(items, out_path, ts_iso, sha, jobs=args.jobs, incremental=args.incremental)
+    print(f"OK: {out_path} ({counts['files']} files, {counts['reused']} reused)")
     return 0
 
 